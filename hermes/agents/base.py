@@ -7,6 +7,8 @@ Custom agents should inherit from :class:`HermesAgent` and implement
 
 from __future__ import annotations
 
+import copy
+import dataclasses
 import logging
 from abc import ABC, abstractmethod
 from typing import Any
@@ -58,35 +60,49 @@ def _make_gemini_safe_schema(orig_mjs: Any) -> Any:
         ``additionalProperties`` from the result.
     """
 
-    @classmethod  # type: ignore[misc]
     def _safe_mjs(cls, **kwargs: Any) -> dict:
         schema = orig_mjs(**kwargs)
         _strip_additional_properties(schema)
         return schema
 
-    return _safe_mjs
+    return classmethod(_safe_mjs)
 
 
-def patch_tools_for_google(tools: list[Any]) -> None:
-    """Patch tool fn_schema classes to strip ``additionalProperties`` for Gemini.
+def patch_tools_for_google(tools: list[Any]) -> list[Any]:
+    """Return copies of *tools* whose schemas strip ``additionalProperties`` for Gemini.
 
     Pydantic v2 emits ``additionalProperties: true`` for ``dict[str, Any]``
     parameters.  The standard Gemini API rejects any schema containing this
-    keyword (even nested within a property definition).  This patches each
-    tool's schema class in-place so subsequent calls to ``model_json_schema()``
-    return a Gemini-compatible schema.
+    keyword (even nested within a property definition).  Tool objects are
+    shared between agents (see :func:`hermes.tools._base.shared_tools`), so
+    each tool is shallow-copied with a subclass of its schema class whose
+    ``model_json_schema()`` returns a Gemini-compatible schema.  The original
+    tools, and agents built for other providers, are left untouched.
 
     Args:
         tools: List of LlamaIndex tool instances to patch.
+
+    Returns:
+        A new list with a patched copy of every tool that has an
+        ``fn_schema``; tools without one are returned as-is.
     """
+    patched = []
     for tool in tools:
         try:
             schema_cls = tool.metadata.fn_schema
-            schema_cls.model_json_schema = _make_gemini_safe_schema(
-                schema_cls.model_json_schema
+            safe_cls = type(
+                schema_cls.__name__,
+                (schema_cls,),
+                {"model_json_schema": _make_gemini_safe_schema(schema_cls.model_json_schema)},
             )
+            metadata = dataclasses.replace(tool.metadata, fn_schema=safe_cls)
         except (AttributeError, TypeError):
-            pass
+            patched.append(tool)
+            continue
+        tool = copy.copy(tool)
+        tool._metadata = metadata  # BaseTool.metadata is a read-only property.
+        patched.append(tool)
+    return patched
 
 
 class HermesAgent(ABC):
@@ -174,7 +190,7 @@ class HermesAgent(ABC):
 
         if llm is not None and _is_google_llm(llm):
             logger.debug("Patching %d tool schemas for Gemini API compatibility", len(tools))
-            patch_tools_for_google(tools)
+            tools = patch_tools_for_google(tools)
 
         agent_cls = FunctionAgent if self.agent_type == "function" else ReActAgent
 
@@ -7,11 +7,16 @@ and can be explicitly set or updated with :func:`configure`.
 
 Environment variables with the ``HERMES_`` prefix are read automatically
 (e.g. ``HERMES_LLM_PROVIDER=openai``).
+
+A config can also be bound to the current context with
+:func:`set_request_config`, overriding the global for that task (and any
+tasks it spawns) without mutating it.
 """
 
 from __future__ import annotations
 
 import os
+from contextvars import ContextVar, Token
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, model_validator
@@ -75,6 +80,35 @@ class HermesConfig(BaseModel):
     output_dir: str = "./output"
     cache_dir: str = "~/.hermes/cache"
 
+    # -- Ingestion ------------------------------------------------------------
+    ingest_batch_size: int = 96
+    """Nodes per embedding/insert batch in :meth:`IndexManager.add_documents`."""
+
+    ingest_workers: int = 4
+    """Batches embedded and inserted concurrently by ``add_documents``."""
+
+    # -- Charts ---------------------------------------------------------------
+    chart_workers: int = 0
+    """Worker processes for charts rendered concurrently; 0 renders in the calling thread.
+
+    The pool uses the ``spawn`` start method, which re-imports the main module
+    in every worker.  Only enable it from programs whose entry point is
+    guarded by ``if __name__ == "__main__":``; otherwise each worker re-runs
+    the script's top-level code.
+
+    Set via env var: ``HERMES_CHART_WORKERS=4``
+    """
+
+    # -- Documents ------------------------------------------------------------
+    max_open_documents: int = 8
+    """Word documents kept in memory; less recently used ones are spilled to ``cache_dir``."""
+
+    pdf_cache_max_mb: int = 256
+    """Size bound of the exported-PDF cache under ``cache_dir``, keyed by ``.docx`` content."""
+
+    pdf_export_workers: int = 2
+    """PDF exports awaited at once by async tool calls; further exports queue behind them."""
+
     # -- Provider-specific caching --------------------------------------------
     google_cached_content: str | None = None
     """Google GenAI cached content name (e.g. ``"cachedContents/abc123"``).
@@ -120,6 +154,9 @@ class HermesConfig(BaseModel):
 
 _config: HermesConfig | None = None
 
+# Per-context override consulted by get_config() before the global.
+_current_config: ContextVar[HermesConfig | None] = ContextVar("hermes_config", default=None)
+
 
 def _env_overrides() -> dict[str, object]:
     """Read HERMES_* environment variables and return as a field-name → value dict.
@@ -166,15 +203,38 @@ def configure(**kwargs: object) -> HermesConfig:
 
 
 def get_config() -> HermesConfig:
-    """Return the global config, creating a default instance if needed.
+    """Return the active config, creating a default global instance if needed.
 
-    This is the canonical way for internal modules to obtain configuration.
+    A config bound with :func:`set_request_config` takes precedence over the
+    global one.  This is the canonical way for internal modules to obtain configuration.
     End-users should prefer :func:`configure` to customise settings before
     calling any library code.
     """
     global _config  # noqa: PLW0603
 
+    scoped = _current_config.get()
+    if scoped is not None:
+        return scoped
+
     if _config is None:
         _config = HermesConfig(**_env_overrides())
 
     return _config
+
+
+def set_request_config(config: HermesConfig) -> Token[HermesConfig | None]:
+    """Make :func:`get_config` return *config* in the current context.
+
+    The binding follows :mod:`contextvars` semantics: it applies to the
+    calling task and to tasks created from it afterwards, and leaves the
+    global config and concurrent tasks untouched.
+
+    Returns:
+        A token to pass to :func:`reset_request_config` to undo the binding.
+    """
+    return _current_config.set(config)
+
+
+def reset_request_config(token: Token[HermesConfig | None]) -> None:
+    """Restore the config binding that was active before :func:`set_request_config`."""
+    _current_config.reset(token)
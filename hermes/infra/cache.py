@@ -1,26 +1,44 @@
 """File-based cache with per-item TTL.
 
 Stores cached data on disk at ``~/.hermes/cache/`` (configurable).  Each entry
-consists of two files inside a namespace directory:
+consists of two files inside a namespace directory, named after the 256-bit
+BLAKE2b hex digest of the key:
 
-* ``<sha256>.data`` -- the raw bytes
-* ``<sha256>.meta`` -- a small JSON object with *created_at* and *ttl_seconds*
+* ``<hash>.data`` -- the raw bytes
+* ``<hash>.meta`` -- a small JSON object with *created_at* and *ttl_seconds*
 
 This keeps the implementation simple and inspectable; you can ``ls`` the cache
 directory and see exactly what is stored.
+
+Small entries that have been read or written recently are also kept in a
+bounded in-process LRU so hot keys are served without touching the disk.
+
+Expired entries are removed lazily when they are next read, and entries
+written with a TTL are additionally tracked in a min-heap so :meth:`FileCache.sweep`
+can delete exactly the ones that have expired without scanning the directory.
 """
 
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import logging
+import mmap
+import os
 import shutil
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is used instead
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -32,6 +50,52 @@ TTL_1_HOUR: float = 3600
 TTL_24_HOURS: float = 86400
 TTL_7_DAYS: float = 604800
 
+#: Entries at least this large are memory-mapped by :meth:`FileCache.get_buffer`.
+MMAP_THRESHOLD: int = 64 * 1024
+
+#: Default number of entries held in the in-process LRU in front of the disk.
+MEMORY_CAPACITY: int = 512
+
+#: Seconds a confirmed miss is remembered, to short-circuit polling on absent keys.
+MISS_TTL: float = 0.1
+
+_MISS_CAPACITY = 1024
+
+
+# ---------------------------------------------------------------------------
+# Metadata serialisation
+# ---------------------------------------------------------------------------
+
+
+def _dump_meta(meta: dict) -> bytes:
+    """Serialise a metadata dict to UTF-8 JSON bytes (via orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(meta)
+    return json.dumps(meta).encode("utf-8")
+
+
+def _load_meta(raw: bytes) -> object:
+    """Parse UTF-8 JSON bytes written by :func:`_dump_meta`."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_file(path: Path) -> bytes:
+    """Read the whole of *path* with a single positional read.
+
+    Sizes the read from ``fstat`` and uses :func:`os.pread` where available,
+    skipping the buffered-reader setup and the trailing zero-length read that
+    :meth:`Path.read_bytes` performs to detect EOF.
+    """
+    if not hasattr(os, "pread"):  # pragma: no cover - Windows
+        return path.read_bytes()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.pread(fd, os.fstat(fd).st_size, 0)
+    finally:
+        os.close(fd)
+
 
 # ---------------------------------------------------------------------------
 # Internal model
@@ -58,11 +122,40 @@ class FileCache:
     ----------
     base_dir:
         Root directory for all cached data.  ``~`` is expanded automatically.
+    mmap_threshold:
+        Minimum entry size in bytes for :meth:`get_buffer` to memory-map the
+        data file instead of reading it into a fresh ``bytes`` object.  Entries
+        this large are never held in the in-process LRU.
+    memory_capacity:
+        Maximum number of entries kept in the in-process LRU.  ``0`` disables
+        it.  The LRU is private to this instance, so writes made by other
+        processes sharing *base_dir* are only seen once an entry is evicted.
+    miss_ttl:
+        Seconds a lookup that found nothing on disk is remembered, so tight
+        loops polling an absent key don't hit the filesystem each time.
+        Writes through this instance clear the remembered miss immediately.
     """
 
-    def __init__(self, base_dir: str = "~/.hermes/cache") -> None:
+    def __init__(
+        self,
+        base_dir: str = "~/.hermes/cache",
+        mmap_threshold: int = MMAP_THRESHOLD,
+        memory_capacity: int = MEMORY_CAPACITY,
+        miss_ttl: float = MISS_TTL,
+    ) -> None:
         self._base = Path(base_dir).expanduser()
         self._base.mkdir(parents=True, exist_ok=True)
+        self._mmap_threshold = max(1, mmap_threshold)
+        self._mem_capacity = max(0, memory_capacity)
+        # (namespace, key) -> (expiry epoch, data), least recently used first.
+        self._mem: OrderedDict[tuple[str, str], tuple[float, bytes]] = OrderedDict()
+        self._miss_ttl = max(0.0, miss_ttl)
+        # (namespace, key) -> monotonic deadline until which the key is a known miss.
+        self._misses: OrderedDict[tuple[str, str], float] = OrderedDict()
+        # Min-heap of (expiry epoch, namespace, key) for entries put with a TTL.
+        self._expiry_heap: list[tuple[float, str, str]] = []
+        # Namespace directories already created by this instance.
+        self._dirs_made: set[Path] = set()
 
     # -- public API --------------------------------------------------------
 
@@ -71,26 +164,61 @@ class FileCache:
 
         Expired entries are deleted from disk as a side-effect.
         """
-        data_path = self._entry_path(namespace, key)
-        meta_path = self._meta_path(namespace, key)
+        hit = self._mem_get(namespace, key)
+        if hit is not None:
+            return hit
 
-        if not data_path.exists() or not meta_path.exists():
-            logger.debug("Cache miss: %s/%s", namespace, key)
+        found = self._lookup(namespace, key)
+        if found is None:
             return None
-
-        meta = self._read_meta(meta_path)
-        if meta is None:
-            # Corrupt metadata -- treat as miss.
-            self._remove_pair(data_path, meta_path)
-            logger.debug("Cache miss: %s/%s", namespace, key)
+        data_path, meta = found
+        try:
+            data = _read_file(data_path)
+        except FileNotFoundError:
+            # Removed between the metadata check and the read.
             return None
+        self._mem_put(namespace, key, data, self._expires_at(meta))
+        return data
 
-        if self._is_expired(meta):
-            self._remove_pair(data_path, meta_path)
-            logger.debug("Cache expired: %s/%s", namespace, key)
+    def try_get(self, namespace: str, key: str) -> tuple[bool, bytes | None]:
+        """Return ``(hit, data)`` in a single lookup.
+
+        Use this instead of calling :meth:`has` followed by :meth:`get`, which
+        reads the metadata twice and can race with expiry in between.
+        """
+        data = self.get(namespace, key)
+        return data is not None, data
+
+    def get_buffer(self, namespace: str, key: str) -> bytes | memoryview | None:
+        """Like :meth:`get`, but memory-map large entries instead of copying them.
+
+        Entries of at least ``mmap_threshold`` bytes are returned as a read-only
+        :class:`memoryview` over an ``mmap`` of the data file, so cache hits on
+        large blobs (e.g. full SEC filings) are served straight from the page
+        cache.  Smaller entries are returned as plain ``bytes``.
+
+        Callers that receive a ``memoryview`` should ``release()`` it, or copy
+        out what they need, once they are done with it.
+        """
+        hit = self._mem_get(namespace, key)
+        if hit is not None:
+            return hit
+
+        found = self._lookup(namespace, key)
+        if found is None:
             return None
+        data_path, _meta = found
 
-        return data_path.read_bytes()
+        try:
+            fh = data_path.open("rb")
+        except FileNotFoundError:
+            return None
+        with fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size < self._mmap_threshold:
+                return fh.read()
+            mm = mmap.mmap(fh.fileno(), size, access=mmap.ACCESS_READ)
+        return memoryview(mm)
 
     def put(
         self,
@@ -98,95 +226,228 @@ class FileCache:
         key: str,
         data: bytes,
         ttl_seconds: float | None = None,
+        durable: bool = False,
     ) -> None:
         """Write *data* to the cache.
 
+        Both files are written to a temporary name and moved into place with
+        :func:`os.replace`, so readers never observe a half-written entry.
+
         Parameters
         ----------
         namespace:
             Logical grouping (e.g. ``"sec_filings"``).
         key:
-            Arbitrary string key.  Hashed to SHA-256 for the filename.
+            Arbitrary string key.  Hashed with BLAKE2b for the filename.
         data:
             Raw bytes to store.
         ttl_seconds:
             Seconds until expiry.  ``None`` means the entry never expires.
+        durable:
+            ``fsync`` each file before moving it into place.  Off by default
+            since the cache can always be refilled from the source.
         """
-        data_path = self._entry_path(namespace, key)
-        meta_path = self._meta_path(namespace, key)
+        if self._expiry_heap and self._expiry_heap[0][0] <= time.time():
+            self.sweep()
 
-        data_path.parent.mkdir(parents=True, exist_ok=True)
+        data_path, meta_path = self._entry_paths(namespace, key)
 
-        data_path.write_bytes(data)
+        parent = data_path.parent
+        if parent not in self._dirs_made:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._dirs_made.add(parent)
 
+        # Data first, then metadata: lookups start from the .meta file.
+        try:
+            self._atomic_write(data_path, data, durable)
+        except FileNotFoundError:
+            # The directory was removed by someone else; recreate it once.
+            parent.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(data_path, data, durable)
         meta = {"created_at": time.time(), "ttl_seconds": ttl_seconds}
-        meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        self._atomic_write(meta_path, _dump_meta(meta), durable)
+        self._misses.pop((namespace, key), None)
+        expires_at = self._expires_at(meta)
+        if ttl_seconds is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, namespace, key))
+        self._mem_put(namespace, key, data, expires_at)
         logger.debug("Cache put: %s/%s (ttl=%s)", namespace, key, ttl_seconds)
 
     def has(self, namespace: str, key: str) -> bool:
-        """Return ``True`` if a valid (non-expired) entry exists for *key*."""
-        data_path = self._entry_path(namespace, key)
-        meta_path = self._meta_path(namespace, key)
+        """Return ``True`` if a valid (non-expired) entry exists for *key*.
 
-        if not data_path.exists() or not meta_path.exists():
-            return False
-
-        meta = self._read_meta(meta_path)
-        if meta is None:
-            return False
-
-        if self._is_expired(meta):
-            self._remove_pair(data_path, meta_path)
-            return False
-
-        return True
+        Prefer :meth:`try_get` when the data is needed as well.
+        """
+        if self._mem_get(namespace, key) is not None:
+            return True
+        found = self._lookup(namespace, key)
+        return found is not None and found[0].exists()
 
     def delete(self, namespace: str, key: str) -> bool:
         """Remove a single cached entry.  Returns ``True`` if it existed."""
-        data_path = self._entry_path(namespace, key)
-        meta_path = self._meta_path(namespace, key)
+        data_path, meta_path = self._entry_paths(namespace, key)
         existed = data_path.exists() or meta_path.exists()
         self._remove_pair(data_path, meta_path)
+        self._mem.pop((namespace, key), None)
+        self._misses.pop((namespace, key), None)
         return existed
 
+    def sweep(self) -> int:
+        """Delete entries written by this instance whose TTL has elapsed.
+
+        Only the entries that are actually due are touched, so the cost is
+        proportional to what has expired rather than to the cache size.  It
+        runs automatically from :meth:`put` whenever something is due;
+        long-lived readers may also call it periodically.
+
+        Returns:
+            The number of entries removed from disk.
+        """
+        now = time.time()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, namespace, key = heapq.heappop(self._expiry_heap)
+            data_path, meta_path = self._entry_paths(namespace, key)
+            try:
+                meta = self._parse_meta(_read_file(meta_path))
+            except OSError:
+                continue  # Already deleted.
+            # The key may have been re-put since; only drop it if still expired.
+            if meta is None or self._is_expired(meta):
+                self._remove_pair(data_path, meta_path)
+                self._mem.pop((namespace, key), None)
+                removed += 1
+        if removed:
+            logger.debug("Cache sweep removed %d expired entries", removed)
+        return removed
+
     def clear_namespace(self, namespace: str) -> None:
         """Delete all entries in *namespace*."""
         logger.debug("Cleared cache namespace %r", namespace)
+        for mem_key in [k for k in self._mem if k[0] == namespace]:
+            del self._mem[mem_key]
+        self._misses.clear()
         ns_dir = self._base / namespace
+        self._dirs_made.discard(ns_dir)
         if ns_dir.exists():
             shutil.rmtree(ns_dir)
 
     def clear_all(self) -> None:
         """Delete every cached entry across all namespaces."""
         logger.info("Cleared all cache")
+        self._mem.clear()
+        self._misses.clear()
+        self._expiry_heap.clear()
+        self._dirs_made.clear()
         if self._base.exists():
             shutil.rmtree(self._base)
             self._base.mkdir(parents=True, exist_ok=True)
 
     # -- path helpers ------------------------------------------------------
 
-    def _entry_path(self, namespace: str, key: str) -> Path:
-        """Return the ``.data`` file path for a given namespace/key pair."""
-        return self._base / namespace / (self._hash_key(key) + ".data")
+    def _lookup(self, namespace: str, key: str) -> tuple[Path, dict] | None:
+        """Return ``(data_path, meta)`` for a valid entry, or ``None`` on a miss.
+
+        Missing, corrupt, and expired entries all count as misses; the latter
+        two are deleted from disk.  The metadata file is read directly rather
+        than checked with ``exists()`` first, so a hit costs one open and a
+        vanished file is just another miss.
+        """
+        miss_key = (namespace, key)
+        deadline = self._misses.get(miss_key)
+        if deadline is not None:
+            if deadline > time.monotonic():
+                return None
+            del self._misses[miss_key]
+
+        data_path, meta_path = self._entry_paths(namespace, key)
+
+        try:
+            raw_meta = _read_file(meta_path)
+        except OSError:
+            self._remember_miss(miss_key)
+            logger.debug("Cache miss: %s/%s", namespace, key)
+            return None
+
+        meta = self._parse_meta(raw_meta)
+        if meta is None:
+            # Corrupt metadata -- treat as miss.
+            self._remove_pair(data_path, meta_path)
+            self._remember_miss(miss_key)
+            logger.debug("Cache miss: %s/%s", namespace, key)
+            return None
+
+        if self._is_expired(meta):
+            self._remove_pair(data_path, meta_path)
+            self._remember_miss(miss_key)
+            logger.debug("Cache expired: %s/%s", namespace, key)
+            return None
+
+        return data_path, meta
+
+    def _remember_miss(self, miss_key: tuple[str, str]) -> None:
+        """Record *miss_key* as absent for the next ``miss_ttl`` seconds."""
+        if self._miss_ttl == 0:
+            return
+        self._misses[miss_key] = time.monotonic() + self._miss_ttl
+        self._misses.move_to_end(miss_key)
+        if len(self._misses) > _MISS_CAPACITY:
+            self._misses.popitem(last=False)
 
-    def _meta_path(self, namespace: str, key: str) -> Path:
-        """Return the ``.meta`` file path for a given namespace/key pair."""
-        return self._base / namespace / (self._hash_key(key) + ".meta")
+    # -- in-process LRU ----------------------------------------------------
+
+    def _mem_get(self, namespace: str, key: str) -> bytes | None:
+        """Return *key* from the in-process LRU if present and not expired."""
+        mem_key = (namespace, key)
+        entry = self._mem.get(mem_key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at <= time.time():
+            # Fall through to the disk path, which also removes the files.
+            del self._mem[mem_key]
+            return None
+        self._mem.move_to_end(mem_key)
+        return data
+
+    def _mem_put(self, namespace: str, key: str, data: bytes, expires_at: float) -> None:
+        """Insert *data* into the in-process LRU, evicting the oldest entry."""
+        mem_key = (namespace, key)
+        if self._mem_capacity == 0 or len(data) >= self._mmap_threshold:
+            self._mem.pop(mem_key, None)
+            return
+        self._mem[mem_key] = (expires_at, data)
+        self._mem.move_to_end(mem_key)
+        if len(self._mem) > self._mem_capacity:
+            self._mem.popitem(last=False)
+
+    def _entry_paths(self, namespace: str, key: str) -> tuple[Path, Path]:
+        """Return the ``(.data, .meta)`` file paths for a namespace/key pair.
+
+        Both names share one digest, so the key is hashed once per operation.
+        """
+        stem = self._base / namespace / self._hash_key(key)
+        return stem.with_suffix(".data"), stem.with_suffix(".meta")
 
     # -- internals ---------------------------------------------------------
 
     @staticmethod
     def _hash_key(key: str) -> str:
-        """SHA-256 hex digest of *key*."""
-        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+        """256-bit BLAKE2b hex digest of *key*.
+
+        The hash only needs to be a stable, filesystem-safe name, so the
+        faster stdlib BLAKE2b is used rather than SHA-256.
+        """
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=32).hexdigest()
 
     @staticmethod
-    def _read_meta(meta_path: Path) -> dict | None:
-        """Read and parse a ``.meta`` JSON file; return ``None`` on failure."""
+    def _parse_meta(raw: bytes) -> dict | None:
+        """Parse the contents of a ``.meta`` file; return ``None`` on failure."""
         try:
-            return json.loads(meta_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            meta = _load_meta(raw)
+        except ValueError:  # JSONDecodeError, orjson.JSONDecodeError, UnicodeDecodeError
             return None
+        return meta if isinstance(meta, dict) and "created_at" in meta else None
 
     @staticmethod
     def _is_expired(meta: dict) -> bool:
@@ -196,6 +457,29 @@ class FileCache:
             return False
         return time.time() - meta["created_at"] > ttl
 
+    @staticmethod
+    def _expires_at(meta: dict) -> float:
+        """Return the wall-clock expiry time for a metadata dict."""
+        ttl = meta.get("ttl_seconds")
+        if ttl is None:
+            return float("inf")
+        return meta["created_at"] + ttl
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes, durable: bool) -> None:
+        """Write *data* to a temporary sibling of *path*, then rename it over *path*."""
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with tmp.open("wb") as fh:
+                fh.write(data)
+                if durable:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
     @staticmethod
     def _remove_pair(data_path: Path, meta_path: Path) -> None:
         """Silently remove the data and metadata files if they exist."""
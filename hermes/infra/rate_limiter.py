@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
 from types import TracebackType
 
@@ -38,27 +39,39 @@ class RateLimiter:
     def __init__(self, rate: float, per: float = 1.0) -> None:
         self.rate = rate
         self.per = per
-        self._tokens: float = rate
-        self._last_refill: float = time.monotonic()
-        self._lock: asyncio.Lock = asyncio.Lock()
+        # The bucket is tracked as a single "theoretical arrival time": the
+        # instant at which the bucket would be empty again if nothing else
+        # arrived.  A full bucket of ``rate`` tokens is ``per`` seconds of
+        # slack ahead of that point.
+        self._interval: float = per / rate
+        self._burst: float = per - self._interval
+        self._tat: float = time.monotonic()
 
     # -- core algorithm ----------------------------------------------------
 
     async def acquire(self) -> None:
-        """Wait until a token is available, then consume it."""
-        while True:
-            async with self._lock:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
-                # Calculate how long until at least one token is available.
-                deficit = 1.0 - self._tokens
-                wait = deficit * (self.per / self.rate)
-
-            # Sleep *outside* the lock so other coroutines can check too.
-            logger.debug("Rate limiter %s: waiting %.2fs", self.rate, wait)
+        """Wait until a token is available, then consume it.
+
+        Every caller reserves its slot up front by advancing the theoretical
+        arrival time, then sleeps exactly until that slot comes due, so
+        concurrent waiters are served in arrival order without re-polling.
+        The bookkeeping has no ``await`` in it, so it is atomic with respect
+        to other coroutines on the loop and needs no lock.
+        """
+        now = time.monotonic()
+        tat = max(self._tat, now)
+        self._tat = tat + self._interval
+        wait = tat - now - self._burst
+        if wait <= 0.0:
+            return
+
+        logger.debug("Rate limiter %s: waiting %.2fs", self.rate, wait)
+        try:
             await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Return the unused reservation so later callers aren't delayed.
+            self._tat -= self._interval
+            raise
 
     # -- context manager ---------------------------------------------------
 
@@ -75,15 +88,6 @@ class RateLimiter:
         # Nothing to release; the token was consumed on entry.
         return None
 
-    # -- internals ---------------------------------------------------------
-
-    def _refill(self) -> None:
-        """Add tokens based on elapsed time since the last refill."""
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._last_refill = now
-        self._tokens = min(self.rate, self._tokens + elapsed * (self.rate / self.per))
-
 
 # ---------------------------------------------------------------------------
 # Pre-built limiters for known financial APIs
@@ -96,6 +100,7 @@ DEFAULT_LIMITS: dict[str, tuple[float, float]] = {
 }
 
 _limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
 
 
 def get_limiter(name: str) -> RateLimiter:
@@ -104,9 +109,18 @@ def get_limiter(name: str) -> RateLimiter:
     If *name* matches a key in :data:`DEFAULT_LIMITS` the limiter is created
     with the corresponding ``(rate, per)`` tuple.  Unknown names default to
     ``(1, 1.0)`` -- one request per second.
+
+    Lookups of existing limiters take no lock; creation is guarded so that
+    concurrent first callers (e.g. from worker threads) share one instance.
     """
-    if name not in _limiters:
-        rate, per = DEFAULT_LIMITS.get(name, (1, 1.0))
-        _limiters[name] = RateLimiter(rate=rate, per=per)
-        logger.debug("Created rate limiter %r (%.0f req/%.1fs)", name, rate, per)
-    return _limiters[name]
+    limiter = _limiters.get(name)
+    if limiter is not None:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            rate, per = DEFAULT_LIMITS.get(name, (1, 1.0))
+            limiter = _limiters[name] = RateLimiter(rate=rate, per=per)
+            logger.debug("Created rate limiter %r (%.0f req/%.1fs)", name, rate, per)
+    return limiter
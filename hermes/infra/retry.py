@@ -8,7 +8,10 @@ to handle transient rate-limit errors from any supported LLM provider.
 from __future__ import annotations
 
 import asyncio
+import functools
+import importlib
 import re
+from collections.abc import Callable
 from dataclasses import dataclass
 
 
@@ -32,6 +35,12 @@ class RetryConfig:
 # ---------------------------------------------------------------------------
 
 
+_GO_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)([a-z]+)")
+
+# Seconds per Go duration unit.  Unknown units contribute nothing.
+_GO_DURATION_UNITS: dict[str, float] = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
 def _parse_go_duration(s: str) -> float:
     """Parse a Go-style duration string into seconds.
 
@@ -43,21 +52,121 @@ def _parse_go_duration(s: str) -> float:
     Returns:
         Total duration in seconds as a float.
     """
+    # Fast path for plain seconds ("53s", "0.5s") -- the only form Google's
+    # RetryInfo uses and the most common OpenAI reset value.
+    head = s[:-1]
+    if (
+        s.endswith("s")
+        and head[:1].isdigit()
+        and head[-1:].isdigit()
+        and head.isascii()
+        and head.replace(".", "", 1).isdigit()
+    ):
+        return float(head)
+
     total = 0.0
-    for val, unit in re.findall(r"(\d+(?:\.\d+)?)([a-z]+)", s):
-        v = float(val)
-        match unit:
-            case "h":
-                total += v * 3600
-            case "m":
-                total += v * 60
-            case "s":
-                total += v
-            case "ms":
-                total += v / 1000
+    for val, unit in _GO_DURATION_RE.findall(s):
+        total += float(val) * _GO_DURATION_UNITS.get(unit, 0.0)
     return total
 
 
+@functools.cache
+def _sdk_class(module: str, name: str) -> type | None:
+    """Import *module* and return its attribute *name*, or ``None`` if unavailable.
+
+    Results (including misses for uninstalled SDKs) are cached so the 429
+    path doesn't repeat the import machinery on every retry.
+    """
+    try:
+        return getattr(importlib.import_module(module), name)
+    except (ImportError, AttributeError):
+        return None
+
+
+def _isinstance_of(exc: BaseException, module: str, name: str) -> bool:
+    """Return True if *exc* is an instance of ``module.name`` (when importable)."""
+    cls = _sdk_class(module, name)
+    return cls is not None and isinstance(exc, cls)
+
+
+def _anthropic_retry_after(exc: BaseException) -> float | None:
+    """Read Anthropic's ``retry-after`` header, in seconds."""
+    try:
+        headers = exc.response.headers  # type: ignore[attr-defined]
+        val = headers.get("retry-after")
+        if val is not None:
+            return float(val)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _openai_retry_after(exc: BaseException) -> float | None:
+    """Read ``retry-after`` or the Go-duration reset headers of OpenAI-compatible APIs."""
+    try:
+        headers = exc.response.headers  # type: ignore[attr-defined]
+        # Try plain seconds first
+        val = headers.get("retry-after")
+        if val is not None:
+            try:
+                return float(val)
+            except ValueError:
+                return _parse_go_duration(val)
+        # Try Go duration headers
+        for header in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+            val = headers.get(header)
+            if val:
+                return _parse_go_duration(val)
+    except (AttributeError, TypeError):
+        pass
+    return None
+
+
+def _google_retry_after(exc: BaseException) -> float | None:
+    """Read Google's ``RetryInfo`` from the JSON body or the proto ``retry_delay``."""
+    # Try JSON body RetryInfo
+    try:
+        json_val = exc.response.json()  # type: ignore[attr-defined]
+        # Some Google SDK versions return a coroutine from .json().
+        # Close it to suppress the "coroutine never awaited" warning.
+        if asyncio.iscoroutine(json_val):
+            json_val.close()
+            raise AttributeError("json() is async")
+        body = json_val
+        details = body.get("error", {}).get("details", [])
+        for detail in details:
+            type_url = detail.get("@type", "")
+            if type_url.endswith("RetryInfo"):
+                delay_str = detail.get("retryDelay", "")
+                if delay_str:
+                    return _parse_go_duration(delay_str)
+    except (AttributeError, TypeError, ValueError, KeyError):
+        pass
+    # Try proto Duration attribute
+    try:
+        retry_delay = exc.retry_delay  # type: ignore[attr-defined]
+        seconds = getattr(retry_delay, "seconds", 0) or 0
+        nanos = getattr(retry_delay, "nanos", 0) or 0
+        total = seconds + nanos / 1e9
+        if total > 0:
+            return total
+    except (AttributeError, TypeError):
+        pass
+    return None
+
+
+# Retry-delay extractor per provider, looked up once per 429 instead of
+# walking an if/elif chain.  Extractors return None when the error carries
+# no usable delay.
+_RETRY_AFTER_EXTRACTORS: dict[str, Callable[[BaseException], float | None]] = {
+    "anthropic": _anthropic_retry_after,
+    "openai": _openai_retry_after,
+    "xai": _openai_retry_after,
+    "deepseek": _openai_retry_after,
+    "google": _google_retry_after,
+}
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -75,28 +184,21 @@ def is_transient_error(exc: BaseException) -> bool:
     Returns:
         True if the exception is likely transient and worth retrying.
     """
-    try:
-        import httpx
-
-        if isinstance(
-            exc,
-            (httpx.TimeoutException, httpx.ConnectError, httpx.RemoteProtocolError),
-        ):
-            return True
-        if (
-            isinstance(exc, httpx.HTTPStatusError)
-            and exc.response.status_code in (500, 502, 503, 504)
-        ):
-            return True
-    except ImportError:
-        pass
+    if (
+        _isinstance_of(exc, "httpx", "TimeoutException")
+        or _isinstance_of(exc, "httpx", "ConnectError")
+        or _isinstance_of(exc, "httpx", "RemoteProtocolError")
+    ):
+        return True
+    if _isinstance_of(exc, "httpx", "HTTPStatusError"):
+        return exc.response.status_code in (500, 502, 503, 504)  # type: ignore[attr-defined]
     return False
 
 
 def is_rate_limit_error(exc: BaseException, provider: str) -> bool:
     """Return True if *exc* is a rate-limit error from *provider*.
 
-    Imports for each SDK are done inside try/except blocks so uninstalled
+    SDK exception classes are imported lazily and cached, so uninstalled
     provider SDKs do not break other providers.
 
     Args:
@@ -107,38 +209,18 @@ def is_rate_limit_error(exc: BaseException, provider: str) -> bool:
         True if the exception represents an HTTP 429 rate-limit error.
     """
     if provider == "anthropic":
-        try:
-            import anthropic
-
-            return isinstance(exc, anthropic.RateLimitError)
-        except ImportError:
-            return False
+        return _isinstance_of(exc, "anthropic", "RateLimitError")
 
     if provider in ("openai", "xai", "deepseek"):
-        try:
-            import openai
-
-            return isinstance(exc, openai.RateLimitError)
-        except ImportError:
-            return False
+        return _isinstance_of(exc, "openai", "RateLimitError")
 
     if provider == "google":
-        try:
-            import google.genai.errors  # type: ignore[import-untyped]
-
-            code = getattr(exc, "code", None)
-            if isinstance(exc, google.genai.errors.ClientError) and code == 429:
-                return True
-        except ImportError:
-            pass
-        try:
-            import google.api_core.exceptions  # type: ignore[import-untyped]
-
-            if isinstance(exc, google.api_core.exceptions.ResourceExhausted):
-                return True
-        except ImportError:
-            pass
-        return False
+        if (
+            _isinstance_of(exc, "google.genai.errors", "ClientError")
+            and getattr(exc, "code", None) == 429
+        ):
+            return True
+        return _isinstance_of(exc, "google.api_core.exceptions", "ResourceExhausted")
 
     return False
 
@@ -162,62 +244,9 @@ def extract_retry_after(
         the cap themselves).
     """
     cfg = config if config is not None else RetryConfig()
-
-    if provider == "anthropic":
-        try:
-            headers = exc.response.headers  # type: ignore[union-attr]
-            val = headers.get("retry-after")
-            if val is not None:
-                return float(val)
-        except (AttributeError, TypeError, ValueError):
-            pass
-
-    elif provider in ("openai", "xai", "deepseek"):
-        try:
-            headers = exc.response.headers  # type: ignore[union-attr]
-            # Try plain seconds first
-            val = headers.get("retry-after")
-            if val is not None:
-                try:
-                    return float(val)
-                except ValueError:
-                    return _parse_go_duration(val)
-            # Try Go duration headers
-            for header in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
-                val = headers.get(header)
-                if val:
-                    return _parse_go_duration(val)
-        except (AttributeError, TypeError):
-            pass
-
-    elif provider == "google":
-        # Try JSON body RetryInfo
-        try:
-            json_val = exc.response.json()  # type: ignore[union-attr]
-            # Some Google SDK versions return a coroutine from .json().
-            # Close it to suppress the "coroutine never awaited" warning.
-            if asyncio.iscoroutine(json_val):
-                json_val.close()
-                raise AttributeError("json() is async")
-            body = json_val
-            details = body.get("error", {}).get("details", [])
-            for detail in details:
-                type_url = detail.get("@type", "")
-                if type_url.endswith("RetryInfo"):
-                    delay_str = detail.get("retryDelay", "")
-                    if delay_str:
-                        return _parse_go_duration(delay_str)
-        except (AttributeError, TypeError, ValueError, KeyError):
-            pass
-        # Try proto Duration attribute
-        try:
-            retry_delay = exc.retry_delay  # type: ignore[union-attr]
-            seconds = getattr(retry_delay, "seconds", 0) or 0
-            nanos = getattr(retry_delay, "nanos", 0) or 0
-            total = seconds + nanos / 1e9
-            if total > 0:
-                return total
-        except (AttributeError, TypeError):
-            pass
-
+    extractor = _RETRY_AFTER_EXTRACTORS.get(provider)
+    if extractor is not None:
+        delay = extractor(exc)
+        if delay is not None:
+            return delay
     return cfg.base_backoff
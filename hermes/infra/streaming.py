@@ -9,11 +9,13 @@ describing the context.
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 
 class EventType(str, Enum):
     """Discriminator for stream events."""
@@ -29,9 +31,21 @@ class EventType(str, Enum):
     WORKFLOW_COMPLETE = "workflow_complete"
 
 
-class StreamEvent(BaseModel):
+# Shared read-only default so events without metadata don't allocate a dict.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_metadata() -> Mapping[str, Any]:
+    return _EMPTY_METADATA
+
+
+@dataclass(slots=True, frozen=True)
+class StreamEvent:
     """A single event emitted during agent execution.
 
+    Events are immutable and slotted: one is created per streamed token, so
+    they skip validation and carry no per-instance ``__dict__``.
+
     Attributes
     ----------
     type:
@@ -55,35 +69,72 @@ class StreamEvent(BaseModel):
     tool_name: str | None = None
     text: str | None = None
     file_path: str | None = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
-    timestamp: float = Field(default_factory=time.time)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_metadata)
+    timestamp: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        # Accept plain strings such as "token", as the former Pydantic model
+        # did; an unknown value raises ValueError.
+        if type(self.type) is not EventType:
+            object.__setattr__(self, "type", EventType(self.type))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event as a plain, JSON-serialisable dict."""
+        return {
+            "type": self.type.value,
+            "agent_name": self.agent_name,
+            "tool_name": self.tool_name,
+            "text": self.text,
+            "file_path": self.file_path,
+            "metadata": dict(self.metadata),
+            "timestamp": self.timestamp,
+        }
+
+    def model_dump(self, mode: str = "python") -> dict[str, Any]:
+        """Return the event as a dict, like the former Pydantic model's ``model_dump``.
+
+        Args:
+            mode: ``"python"`` keeps ``type`` as an :class:`EventType`;
+                ``"json"`` gives its string value, as :meth:`to_dict` does.
+        """
+        data = self.to_dict()
+        if mode == "python":
+            data["type"] = self.type
+        return data
 
 
 # ---------------------------------------------------------------------------
 # Convenience constructors
 # ---------------------------------------------------------------------------
 
+# Constructors pre-bound to their event type, built once at import.
+_agent_start = partial(StreamEvent, EventType.AGENT_START)
+_agent_output = partial(StreamEvent, EventType.AGENT_OUTPUT)
+_tool_call = partial(StreamEvent, EventType.TOOL_CALL)
+_file_created = partial(StreamEvent, EventType.FILE_CREATED)
+_error = partial(StreamEvent, EventType.ERROR)
+
 
 def agent_start(name: str) -> StreamEvent:
     """Create an ``AGENT_START`` event."""
-    return StreamEvent(type=EventType.AGENT_START, agent_name=name)
+    return _agent_start(agent_name=name)
 
 
 def agent_output(name: str, text: str) -> StreamEvent:
     """Create an ``AGENT_OUTPUT`` event carrying *text*."""
-    return StreamEvent(type=EventType.AGENT_OUTPUT, agent_name=name, text=text)
+    return _agent_output(agent_name=name, text=text)
 
 
 def tool_call(agent: str, tool: str) -> StreamEvent:
     """Create a ``TOOL_CALL`` event for *tool* invoked by *agent*."""
-    return StreamEvent(type=EventType.TOOL_CALL, agent_name=agent, tool_name=tool)
+    return _tool_call(agent_name=agent, tool_name=tool)
 
 
 def file_created(path: str, agent: str | None = None) -> StreamEvent:
     """Create a ``FILE_CREATED`` event for *path*."""
-    return StreamEvent(type=EventType.FILE_CREATED, file_path=path, agent_name=agent)
+    return _file_created(file_path=path, agent_name=agent)
 
 
 def error(message: str, agent: str | None = None) -> StreamEvent:
     """Create an ``ERROR`` event with *message*."""
-    return StreamEvent(type=EventType.ERROR, text=message, agent_name=agent)
+    return _error(text=message, agent_name=agent)
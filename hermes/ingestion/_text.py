@@ -0,0 +1,51 @@
+"""Text helpers shared by the ingestion parsers."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from itertools import accumulate, repeat
+from operator import add
+
+
+def greedy_chunk(text: str, max_len: int, sep: str = "\n\n") -> list[str]:
+    """Split *text* into chunks of at most *max_len* characters at *sep*.
+
+    Consecutive pieces are packed greedily into each chunk and rejoined with
+    *sep*; each piece is budgeted with one trailing separator, so chunks may
+    stop slightly short of *max_len*.  A single piece longer than *max_len* is
+    hard-split into *max_len*-sized slices.
+
+    Args:
+        text: The text to potentially split.
+        max_len: Maximum length of each chunk.
+        sep: Separator marking the preferred split points.
+
+    Returns:
+        A list of one or more text chunks, each within the length limit.
+    """
+    if len(text) <= max_len:
+        return [text]
+
+    chunks: list[str] = []
+    pieces = text.split(sep)
+    # ends[i] is the joined length of pieces[:i + 1], counting one separator
+    # per piece.  Each chunk is then a single bisect plus one join, instead
+    # of per-piece running-length arithmetic or accumulator writes.
+    ends = list(accumulate(map(add, map(len, pieces), repeat(len(sep)))))
+    offset = 0
+    i = 0
+
+    while i < len(pieces):
+        if ends[i] - offset > max_len:
+            # Hard split a piece that alone exceeds the limit.
+            piece = pieces[i]
+            chunks.extend(piece[j : j + max_len] for j in range(0, len(piece), max_len))
+        else:
+            # Greedily take every following piece that still fits.
+            stop = bisect_right(ends, offset + max_len, i)
+            chunks.append(sep.join(pieces[i:stop]))
+            i = stop - 1
+        offset = ends[i]
+        i += 1
+
+    return chunks
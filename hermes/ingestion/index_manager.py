@@ -9,6 +9,9 @@ retrieval, preventing cross-company contamination in search results.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain, islice
 from typing import Any
 
 import chromadb
@@ -40,7 +43,7 @@ class IndexManager:
         manager = IndexManager()
         parser = SecFilingParser()
 
-        nodes = parser.parse(filing_html, metadata={"ticker": "AAPL"})
+        nodes = parser.iter_parse(filing_html, metadata={"ticker": "AAPL"})
         manager.add_documents("sec_filings_AAPL", nodes)
 
         results = manager.query("sec_filings_AAPL", "What are the risk factors?")
@@ -65,6 +68,9 @@ class IndexManager:
         )
         # Cache of VectorStoreIndex instances keyed by collection name.
         self._index_cache: dict[str, VectorStoreIndex] = {}
+        # Known collection names; populated on first use and kept in sync by
+        # this manager's own create/delete calls.
+        self._coll_names: set[str] | None = None
 
         logger.debug("IndexManager initialized with persist_dir=%s", persist_dir)
 
@@ -104,13 +110,14 @@ class IndexManager:
         )
 
         self._index_cache[collection_name] = index
+        self._names().add(collection_name)
         logger.debug("Index for collection %r ready", collection_name)
         return index
 
     def add_documents(
         self,
         collection_name: str,
-        nodes: list[TextNode],
+        nodes: Iterable[TextNode],
     ) -> None:
         """Add document nodes to a collection's index.
 
@@ -118,24 +125,60 @@ class IndexManager:
         inserts the provided nodes.  Nodes are embedded using the
         default embedding model configured in LlamaIndex.
 
+        Nodes are consumed in batches of :attr:`HermesConfig.ingest_batch_size`
+        which are embedded and inserted concurrently on up to
+        :attr:`HermesConfig.ingest_workers` threads, so a long filing costs a
+        handful of overlapping embedding round-trips rather than one long
+        sequential run.  *nodes* may be a lazy iterator such as
+        :meth:`SecFilingParser.iter_parse`; only the batches in flight are
+        held in memory.
+
         Args:
             collection_name: Target collection name.
-            nodes: List of :class:`TextNode` instances to index.  Each node
-                should have meaningful ``text`` and ``metadata`` attributes.
+            nodes: :class:`TextNode` instances to index.  Each node should
+                have meaningful ``text`` and ``metadata`` attributes.
 
         Raises:
             ValueError: If ``nodes`` is empty.
         """
-        if not nodes:
+        cfg = get_config()
+        batches = _batches(nodes, max(1, cfg.ingest_batch_size))
+        first = next(batches, None)
+        if first is None:
             raise ValueError("Cannot add an empty list of nodes.")
 
         index = self.get_or_create_index(collection_name)
-        index.insert_nodes(nodes)
+        workers = max(1, cfg.ingest_workers)
+        n_nodes = 0
+        n_batches = 0
+
+        if workers == 1:
+            for batch in chain((first,), batches):
+                index.insert_nodes(batch)
+                n_nodes += len(batch)
+                n_batches += 1
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending: set[Future[None]] = set()
+                for batch in chain((first,), batches):
+                    # Keep at most ``workers`` batches in flight so a lazy
+                    # node stream is not drained into memory up front.
+                    if len(pending) >= workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    pending.add(executor.submit(index.insert_nodes, batch))
+                    n_nodes += len(batch)
+                    n_batches += 1
+                # result() surfaces the first exception raised by any batch.
+                for future in pending:
+                    future.result()
 
         logger.info(
-            "Added %d nodes to collection %r",
-            len(nodes),
+            "Added %d nodes to collection %r in %d batch(es)",
+            n_nodes,
             collection_name,
+            n_batches,
         )
 
     def query(
@@ -166,13 +209,7 @@ class IndexManager:
         Raises:
             KeyError: If the collection does not exist.
         """
-        if collection_name not in {
-            c.name for c in self._client.list_collections()
-        }:
-            raise KeyError(
-                f"Collection '{collection_name}' does not exist. "
-                f"Available: {self.list_collections()}"
-            )
+        self._require_collection(collection_name)
 
         index = self.get_or_create_index(collection_name)
         retriever = index.as_retriever(similarity_top_k=top_k)
@@ -202,8 +239,15 @@ class IndexManager:
             A sorted list of collection name strings currently stored
             in ChromaDB.
         """
-        collections = self._client.list_collections()
-        return sorted(c.name for c in collections)
+        return sorted(self._names())
+
+    def refresh(self) -> None:
+        """Drop the cached collection names so the next call re-reads ChromaDB.
+
+        Only needed when another process or client creates or deletes
+        collections in the same ``persist_dir``.
+        """
+        self._coll_names = None
 
     def delete_collection(self, collection_name: str) -> None:
         """Delete a collection and all its data.
@@ -217,15 +261,11 @@ class IndexManager:
         Raises:
             KeyError: If the collection does not exist.
         """
-        existing = {c.name for c in self._client.list_collections()}
-        if collection_name not in existing:
-            raise KeyError(
-                f"Collection '{collection_name}' does not exist. "
-                f"Available: {sorted(existing)}"
-            )
+        self._require_collection(collection_name)
 
         self._client.delete_collection(name=collection_name)
         self._index_cache.pop(collection_name, None)
+        self._names().discard(collection_name)
 
         logger.info("Deleted collection %r", collection_name)
 
@@ -241,19 +281,35 @@ class IndexManager:
         Raises:
             KeyError: If the collection does not exist.
         """
-        existing = {c.name for c in self._client.list_collections()}
-        if collection_name not in existing:
-            raise KeyError(
-                f"Collection '{collection_name}' does not exist. "
-                f"Available: {sorted(existing)}"
-            )
+        self._require_collection(collection_name)
 
         chroma_collection = self._client.get_collection(name=collection_name)
         return chroma_collection.count()
 
+    def _names(self) -> set[str]:
+        """Return the cached set of collection names, loading it on first use."""
+        if self._coll_names is None:
+            self._coll_names = {c.name for c in self._client.list_collections()}
+        return self._coll_names
+
+    def _require_collection(self, collection_name: str) -> None:
+        """Raise :class:`KeyError` if *collection_name* is not a known collection."""
+        names = self._names()
+        if collection_name not in names:
+            raise KeyError(
+                f"Collection '{collection_name}' does not exist. "
+                f"Available: {sorted(names)}"
+            )
+
     def __repr__(self) -> str:
-        collections = self.list_collections()
         return (
             f"IndexManager(persist_dir={self._persist_dir!r}, "
-            f"collections={len(collections)})"
+            f"collections={len(self._names())})"
         )
+
+
+def _batches(nodes: Iterable[TextNode], size: int) -> Iterator[list[TextNode]]:
+    """Yield consecutive lists of at most *size* items drawn from *nodes*."""
+    it = iter(nodes)
+    while batch := list(islice(it, size)):
+        yield batch
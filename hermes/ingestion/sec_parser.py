@@ -11,13 +11,95 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress, count
 from typing import Any
 
-from bs4 import BeautifulSoup, Tag
 from llama_index.core.schema import TextNode
+from lxml import etree  # type: ignore[import-untyped]
+from lxml import html as lxml_html  # type: ignore[import-untyped]
+
+from hermes.ingestion._text import greedy_chunk
 
 logger = logging.getLogger(__name__)
 
+# Block-level elements whose text is extracted as a block, in document order.
+# Inline tags (span, font, b, ...) are not listed: their text belongs to the
+# enclosing block, or to an implicit block when no listed element encloses it.
+_BLOCK_TAGS: frozenset[str] = frozenset({
+    "p", "div", "center", "h1", "h2", "h3", "h4", "h5", "h6", "li", "td", "th",
+})
+
+# Non-visible elements removed before text extraction.
+_STRIP_TAGS: tuple[str, ...] = ("script", "style", "meta", "link", "title")
+
+# Per-thread lxml HTML parser; see _html_parser().
+_parser_local = threading.local()
+
+# XPath string value of an element: all descendant text, concatenated in C.
+_string_value = etree.XPath("string()")
+
+
+# Whitespace normalisation used by SecFilingParser._clean_text.
+# Tabs, carriage returns and non-breaking spaces map 1:1 onto spaces, which
+# str.translate does without the regex engine; only run collapsing needs re.
+_ODD_SPACE_TABLE = str.maketrans({"\t": " ", "\r": " ", "\xa0": " "})
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+
+def _html_parser() -> etree.HTMLParser:
+    """Return this thread's HTML parser, creating it on first use.
+
+    The configured parser is reused across documents instead of being rebuilt
+    per call, but lxml parser objects must not be shared between threads, so
+    each thread gets its own.  Input is always handed over as UTF-8 bytes:
+    lxml rejects ``str`` documents that carry an XML encoding declaration,
+    which inline XBRL filings do.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = etree.HTMLParser(huge_tree=True, encoding="utf-8")
+    return parser
+
+
+def _compile_heading_pattern(
+    patterns: dict[str, str],
+) -> tuple[tuple[str, ...], re.Pattern[str]]:
+    """Build one anchored, case-insensitive regex over known section keys.
+
+    Keys such as ``"item 1a"`` and ``"part ii"`` are grouped by their first
+    word into ``item\\s+(1a|...)|part\\s+(ii|...)``.  Alternatives are
+    ordered longest first so ``item 1a`` wins over ``item 1``, and a trailing
+    ``\\b`` keeps ``item 1`` from matching ``Item 10``.
+
+    Args:
+        patterns: Mapping of lowercased ``"<prefix> <number>"`` keys.
+
+    Returns:
+        A ``(prefixes, pattern)`` pair where capture group *N* of *pattern*
+        holds the number for ``prefixes[N - 1]``.
+    """
+    grouped: dict[str, list[str]] = {}
+    for key in patterns:
+        prefix, number = key.split()
+        grouped.setdefault(prefix, []).append(number)
+
+    alternatives = [
+        rf"{re.escape(prefix)}\s+("
+        + "|".join(re.escape(n) for n in sorted(numbers, key=len, reverse=True))
+        + ")"
+        for prefix, numbers in grouped.items()
+    ]
+    pattern = re.compile(
+        r"^\s*(?:" + "|".join(alternatives) + r")\b",
+        re.IGNORECASE,
+    )
+    return tuple(grouped), pattern
+
 
 class SecFilingParser:
     """Parse SEC filing HTML into structured document nodes.
@@ -73,17 +155,16 @@ class SecFilingParser:
         "part ii": "Other Information",
     }
 
-    # Regex for matching "Item N" or "Item NA" headings with optional
-    # punctuation, whitespace, and section titles.
-    _ITEM_PATTERN: re.Pattern[str] = re.compile(
-        r"^\s*item\s+(\d+[a-c]?)\b",
-        re.IGNORECASE,
-    )
+    # Anchored heading matcher generated from the SECTION_PATTERNS keys, so
+    # unknown item numbers never match and the key is read straight off the
+    # match.  Group N corresponds to the Nth entry of _HEADING_PREFIXES.
+    _HEADING_PREFIXES, _HEADING_PATTERN = _compile_heading_pattern(SECTION_PATTERNS)
 
-    _PART_PATTERN: re.Pattern[str] = re.compile(
-        r"^\s*part\s+(i{1,3}|iv)\b",
-        re.IGNORECASE,
-    )
+    # Prebuilt ``(section_id, section_name)`` results, so every node of a
+    # section shares one id/name object pair instead of a fresh f-string.
+    _SECTIONS: dict[str, tuple[str, str]] = {
+        key: (sys.intern(key), name) for key, name in SECTION_PATTERNS.items()
+    }
 
     # Minimum character count for a section to be considered substantive
     # and worth indexing.  Filters out empty sections and TOC entries.
@@ -115,21 +196,140 @@ class SecFilingParser:
             section (or sub-section) of the filing with metadata including
             ``section_id`` and ``section_name``.
         """
-        base_meta = metadata or {}
-        soup = BeautifulSoup(html, "html.parser")
+        return list(self.iter_parse(html, metadata))
+
+    def iter_parse(
+        self,
+        html: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[TextNode]:
+        """Lazily parse filing HTML into text nodes with section metadata.
+
+        Yields the same nodes as :meth:`parse`, one at a time, so a consumer
+        such as :meth:`IndexManager.add_documents` can embed them in batches
+        without the whole filing's nodes being held at once.
+
+        Args:
+            html: Raw HTML content of the SEC filing.
+            metadata: Optional base metadata dict to merge into every node.
+
+        Yields:
+            :class:`TextNode` instances in document order.
+        """
+        return self._iter_nodes(self._parse_document(html), metadata)
+
+    def parse_many(
+        self,
+        documents: Iterable[tuple[str, dict[str, Any] | None]],
+        max_workers: int | None = None,
+    ) -> list[TextNode]:
+        """Parse many filings in parallel worker processes.
+
+        :meth:`parse` is CPU-bound and touches no shared state, so documents
+        are spread across a :class:`~concurrent.futures.ProcessPoolExecutor`
+        to get past the GIL.  Nodes come back flattened, in input order.
+
+        Args:
+            documents: ``(html, metadata)`` pairs as accepted by :meth:`parse`.
+            max_workers: Number of worker processes; defaults to the CPU
+                count.  ``1`` parses everything in the current process.
+
+        Returns:
+            The nodes of every document, in input order.
+        """
+        docs = list(documents)
+        if len(docs) < 2 or max_workers == 1:
+            return [node for html, meta in docs for node in self.parse(html, meta)]
+
+        htmls, metadatas = zip(*docs)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # A few documents per task amortises the pickling round trip.
+            results = executor.map(self.parse, htmls, metadatas, chunksize=4)
+            return list(chain.from_iterable(results))
+
+    def parse_tables(self, html: str) -> list[dict[str, Any]]:
+        """Extract HTML tables as structured data.
+
+        Each table is returned as a dictionary with keys ``headers`` (list of
+        column header strings) and ``rows`` (list of lists of cell strings).
+        Rows whose cells are all blank (spacer rows) are dropped, and tables
+        with fewer than 2 remaining rows are skipped as they are typically
+        formatting artifacts rather than data tables.
+
+        Args:
+            html: Raw HTML content containing tables.
 
-        # Remove script, style, and hidden elements.
-        for tag in soup.find_all(["script", "style", "meta", "link"]):
-            tag.decompose()
+        Returns:
+            A list of dicts, each with ``headers`` and ``rows`` keys.
+        """
+        return self._extract_tables(self._parse_document(html))
+
+    def parse_all(
+        self,
+        html: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> tuple[list[TextNode], list[dict[str, Any]]]:
+        """Parse filing HTML into both text nodes and tables.
+
+        Equivalent to calling :meth:`parse` and :meth:`parse_tables` on the
+        same input, but the HTML is only parsed once.
+
+        Args:
+            html: Raw HTML content of the SEC filing.
+            metadata: Optional base metadata dict to merge into every node.
+
+        Returns:
+            A ``(nodes, tables)`` tuple as returned by :meth:`parse` and
+            :meth:`parse_tables` respectively.
+        """
+        root = self._parse_document(html)
+        return list(self._iter_nodes(root, metadata)), self._extract_tables(root)
+
+    @staticmethod
+    def _parse_document(html: str) -> etree._Element | None:
+        """Parse *html* with lxml and remove non-visible elements.
+
+        Args:
+            html: Raw HTML content.
+
+        Returns:
+            The document root, or ``None`` if the document is empty.
+        """
+        try:
+            root = lxml_html.document_fromstring(html.encode("utf-8"), parser=_html_parser())
+        except etree.ParserError:
+            # Empty document (or nothing but comments/whitespace).
+            return None
+        etree.strip_elements(root, *_STRIP_TAGS, with_tail=False)
+        return root
+
+    def _iter_nodes(
+        self,
+        root: etree._Element | None,
+        metadata: dict[str, Any] | None,
+    ) -> Iterator[TextNode]:
+        """Build section-tagged text nodes from a parsed document.
+
+        Args:
+            root: Document root from :meth:`_parse_document`.
+            metadata: Optional base metadata dict to merge into every node.
+
+        Yields:
+            The nodes described in :meth:`parse`.
+        """
+        base_meta = metadata or {}
 
         # Extract all text blocks, preserving rough document order.
-        text_blocks = self._extract_text_blocks(soup)
+        text_blocks = self._extract_text_blocks(root)
 
         # Split text blocks into sections by heading patterns.
         sections = self._split_into_sections(text_blocks)
+        # The sections hold joined copies of the blocks; don't keep both
+        # alive in this generator's frame while nodes are being consumed.
+        del text_blocks
 
         # Convert sections into TextNode instances.
-        nodes: list[TextNode] = []
+        n_nodes = 0
         for section_id, section_name, section_text in sections:
             clean_text = self._clean_text(section_text)
             if len(clean_text) < self.MIN_SECTION_LENGTH:
@@ -143,63 +343,59 @@ class SecFilingParser:
 
             # Split large sections into sub-nodes.
             chunks = self._split_long_text(clean_text)
+            # TextNode copies its metadata dict, so a single-chunk node can
+            # take node_meta as-is; chunked nodes get one dict literal each.
+            if len(chunks) == 1:
+                n_nodes += 1
+                yield TextNode(text=chunks[0], metadata=node_meta)
+                continue
+
+            total = len(chunks)
+            n_nodes += total
             for i, chunk in enumerate(chunks):
-                chunk_meta = {**node_meta}
-                if len(chunks) > 1:
-                    chunk_meta["chunk_index"] = i
-                    chunk_meta["total_chunks"] = len(chunks)
-
-                nodes.append(
-                    TextNode(
-                        text=chunk,
-                        metadata=chunk_meta,
-                    )
+                yield TextNode(
+                    text=chunk,
+                    metadata={**node_meta, "chunk_index": i, "total_chunks": total},
                 )
 
         logger.info(
             "Parsed SEC filing into %d nodes across %d sections",
-            len(nodes),
+            n_nodes,
             len(sections),
         )
-        return nodes
 
-    def parse_tables(self, html: str) -> list[dict[str, Any]]:
-        """Extract HTML tables as structured data.
-
-        Each table is returned as a dictionary with keys ``headers`` (list of
-        column header strings) and ``rows`` (list of lists of cell strings).
-        Tables with fewer than 2 rows are skipped as they are typically
-        formatting artifacts rather than data tables.
+    def _extract_tables(self, root: etree._Element | None) -> list[dict[str, Any]]:
+        """Extract tables from a parsed document.
 
         Args:
-            html: Raw HTML content containing tables.
+            root: Document root from :meth:`_parse_document`.
 
         Returns:
-            A list of dicts, each with ``headers`` and ``rows`` keys.
+            The tables described in :meth:`parse_tables`.
         """
-        soup = BeautifulSoup(html, "html.parser")
         tables: list[dict[str, Any]] = []
+        if root is None:
+            return tables
 
-        for table_tag in soup.find_all("table"):
-            rows = table_tag.find_all("tr")
-            if len(rows) < 2:
-                continue
-
+        clean = self._clean_text
+        for table in root.iter("table"):
+            # Spacer rows whose cells are all blank are dropped up front.
             parsed_rows: list[list[str]] = []
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                parsed_rows.append(
-                    [self._clean_text(cell.get_text()) for cell in cells]
-                )
-
-            if not parsed_rows:
+            first_row = None
+            for row in table.iter("tr"):
+                cells = [clean(_string_value(cell)) for cell in row.iter("td", "th")]
+                if not any(cells):
+                    continue
+                if first_row is None:
+                    first_row = row
+                parsed_rows.append(cells)
+
+            if first_row is None or len(parsed_rows) < 2:
                 continue
 
-            # Use the first row as headers if it contains <th> elements
-            # or looks like a header row (all non-numeric).
-            first_row = rows[0]
-            has_th = first_row.find("th") is not None
-            if has_th and len(parsed_rows) > 1:
+            # Use the first row as headers if it contains <th> elements.
+            has_th = next(first_row.iter("th"), None) is not None
+            if has_th:
                 headers = parsed_rows[0]
                 data_rows = parsed_rows[1:]
             else:
@@ -225,59 +421,72 @@ class SecFilingParser:
             A ``(section_id, section_name)`` tuple if the text matches a
             known heading pattern, otherwise ``None``.
         """
-        stripped = text.strip()
-
-        # Try Item pattern first (more specific).
-        item_match = self._ITEM_PATTERN.match(stripped)
-        if item_match:
-            item_key = f"item {item_match.group(1).lower()}"
-            section_name = self.SECTION_PATTERNS.get(item_key)
-            if section_name:
-                return item_key, section_name
+        match = self._HEADING_PATTERN.match(text)
+        if match is None or match.lastindex is None:
+            return None
 
-        # Try Part pattern.
-        part_match = self._PART_PATTERN.match(stripped)
-        if part_match:
-            part_key = f"part {part_match.group(1).lower()}"
-            section_name = self.SECTION_PATTERNS.get(part_key)
-            if section_name:
-                return part_key, section_name
+        prefix = self._HEADING_PREFIXES[match.lastindex - 1]
+        return self._SECTIONS[f"{prefix} {match.group(match.lastindex).lower()}"]
 
-        return None
+    def _extract_text_blocks(self, root: etree._Element | None) -> list[str]:
+        """Extract visible text blocks from a parsed filing in document order.
 
-    def _extract_text_blocks(self, soup: BeautifulSoup) -> list[str]:
-        """Extract visible text blocks from parsed HTML in document order.
-
-        Walks the DOM and extracts text from block-level elements (p, div,
-        headings, table cells, spans) while preserving the document reading
-        order.
+        Walks the tree once, collecting text from block-level elements (p,
+        div, headings, list items, table cells).  Inline markup such as
+        ``<span>`` or ``<b>`` is folded into its enclosing block, and a block
+        nested inside another ends the outer block's text run, so every piece
+        of text is emitted exactly once instead of once per ancestor.  Text
+        outside any block, as in legacy filings that put ``<font>`` or bare
+        text directly under ``<body>``, forms an implicit block that ends at
+        the next block boundary or ``<br>``.
 
         Args:
-            soup: A parsed BeautifulSoup document.
+            root: Document root from :meth:`_parse_document`.
 
         Returns:
             A list of non-empty text strings in document order.
         """
+        if root is None:
+            return []
+
         blocks: list[str] = []
-        block_tags = {"p", "div", "h1", "h2", "h3", "h4", "h5", "h6",
-                       "li", "td", "th", "span", "font", "b", "i", "u"}
-
-        for element in soup.descendants:
-            if isinstance(element, Tag) and element.name in block_tags:
-                # Only get direct text to avoid duplication from nested tags.
-                direct_text = element.get_text(separator=" ", strip=True)
-                if direct_text and len(direct_text) > 1:
-                    blocks.append(direct_text)
-
-        # Deduplicate consecutive identical blocks (common in nested HTML).
-        deduped: list[str] = []
         prev = ""
-        for block in blocks:
-            if block != prev:
-                deduped.append(block)
-                prev = block
+        parts: list[str] = []
+        depth = 0  # Number of open block elements.
+
+        def flush() -> None:
+            nonlocal prev
+            # Same result as bs4's get_text(separator=" ", strip=True).
+            text = " ".join([chunk for chunk in map(str.strip, parts) if chunk])
+            parts.clear()
+            # Skip consecutive identical blocks (common in nested HTML).
+            if len(text) > 1 and text != prev:
+                blocks.append(text)
+                prev = text
+
+        for event, element in etree.iterwalk(root, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                if tag in _BLOCK_TAGS:
+                    if parts:
+                        flush()
+                    depth += 1
+                elif tag == "br" and not depth and parts:
+                    flush()  # Line breaks are the only structure in implicit blocks.
+                # Comments and processing instructions carry no visible text.
+                if element.text and isinstance(tag, str):
+                    parts.append(element.text)
+                continue
+
+            if tag in _BLOCK_TAGS:
+                flush()
+                depth -= 1
+            if element.tail:
+                parts.append(element.tail)
 
-        return deduped
+        if parts:
+            flush()
+        return blocks
 
     def _split_into_sections(
         self,
@@ -295,27 +504,32 @@ class SecFilingParser:
         Returns:
             A list of ``(section_id, section_name, section_text)`` tuples.
         """
+        # Locate the heading blocks with map/compress so the per-block loop
+        # (one anchored regex match each) runs entirely in C; the Python-level
+        # work below is proportional to the number of headings, not blocks.
+        heading_indices = compress(count(), map(self._HEADING_PATTERN.match, text_blocks))
+
         sections: list[tuple[str, str, str]] = []
         current_id = "preamble"
         current_name = "Preamble"
-        current_text_parts: list[str] = []
-
-        for block in text_blocks:
-            match = self._identify_section(block)
-            if match is not None:
-                # Save the current section before starting a new one.
-                if current_text_parts:
-                    full_text = "\n\n".join(current_text_parts)
-                    sections.append((current_id, current_name, full_text))
-
-                current_id, current_name = match
-                current_text_parts = []
-            else:
-                current_text_parts.append(block)
+        start = 0
+
+        for index in heading_indices:
+            section = self._identify_section(text_blocks[index])
+            if section is None:
+                continue  # Keep the block as body text of the current section.
+
+            # Save the current section before starting a new one.
+            if index > start:
+                full_text = "\n\n".join(text_blocks[start:index])
+                sections.append((current_id, current_name, full_text))
+
+            current_id, current_name = section
+            start = index + 1
 
         # Don't forget the last section.
-        if current_text_parts:
-            full_text = "\n\n".join(current_text_parts)
+        if start < len(text_blocks):
+            full_text = "\n\n".join(text_blocks[start:])
             sections.append((current_id, current_name, full_text))
 
         return sections
@@ -332,34 +546,7 @@ class SecFilingParser:
         Returns:
             A list of one or more text chunks, each within the length limit.
         """
-        if len(text) <= self.MAX_NODE_LENGTH:
-            return [text]
-
-        chunks: list[str] = []
-        paragraphs = text.split("\n\n")
-        current_chunk: list[str] = []
-        current_length = 0
-
-        for para in paragraphs:
-            para_len = len(para) + 2  # Account for the join separator.
-            if current_length + para_len > self.MAX_NODE_LENGTH and current_chunk:
-                chunks.append("\n\n".join(current_chunk))
-                current_chunk = []
-                current_length = 0
-
-            # Handle individual paragraphs that exceed the limit.
-            if para_len > self.MAX_NODE_LENGTH:
-                # Hard split at MAX_NODE_LENGTH boundaries.
-                for i in range(0, len(para), self.MAX_NODE_LENGTH):
-                    chunks.append(para[i : i + self.MAX_NODE_LENGTH])
-            else:
-                current_chunk.append(para)
-                current_length += para_len
-
-        if current_chunk:
-            chunks.append("\n\n".join(current_chunk))
-
-        return chunks
+        return greedy_chunk(text, self.MAX_NODE_LENGTH)
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -374,10 +561,12 @@ class SecFilingParser:
         Returns:
             Cleaned text string.
         """
-        # Replace various whitespace characters with spaces.
-        text = re.sub(r"[\t\r\xa0]+", " ", text)
-        # Collapse multiple spaces.
-        text = re.sub(r" {2,}", " ", text)
-        # Collapse more than two consecutive newlines.
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        # Each pass is skipped when a plain substring test (much cheaper than a
+        # regex scan) shows it has nothing to replace.
+        if "\t" in text or "\r" in text or "\xa0" in text:
+            text = text.translate(_ODD_SPACE_TABLE)
+        if "  " in text:
+            text = _MULTI_SPACE_RE.sub(" ", text)
+        if "\n\n\n" in text:
+            text = _MULTI_NEWLINE_RE.sub("\n\n", text)
         return text.strip()
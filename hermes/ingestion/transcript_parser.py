@@ -9,10 +9,15 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from typing import Any
 
 from llama_index.core.schema import TextNode
 
+from hermes.ingestion._text import greedy_chunk
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,22 +46,22 @@ class TranscriptParser:
             print(node.metadata["speaker"], node.metadata["section"])
     """
 
-    # Regex patterns for speaker identification.
-    # Matches patterns like:
+    # Regex for speaker lines, covering both the standalone "Operator" line
+    # (common in transcripts) and name/role attributions such as:
     #   "Tim Cook -- Chief Executive Officer"
     #   "Tim Cook - CEO"
     #   "Tim Cook, CEO"
     #   "Analyst: Jane Doe, Goldman Sachs"
-    _SPEAKER_DASH_PATTERN: re.Pattern[str] = re.compile(
-        r"^(?P<name>[A-Z][a-zA-Z\.\-\' ]{2,40})\s*"
+    # One alternation means the transcript is scanned once for both kinds.
+    # "Operator" is tried first so it wins where both would match.  The role
+    # runs to the last non-space character of the line.  Spelling that out
+    # (instead of a lazy ``.+?`` followed by ``\s*$``) keeps matching linear
+    # on lines with long whitespace runs, with identical captures.
+    _SPEAKER_LINE_PATTERN: re.Pattern[str] = re.compile(
+        r"^(?:\s*(?P<operator>Operator)\s*"
+        r"|(?P<name>[A-Z][a-zA-Z\.\-\' ]{2,40})\s*"
         r"(?:--|---|-|,)\s*"
-        r"(?P<role>.+?)\s*$",
-        re.MULTILINE,
-    )
-
-    # Matches "Operator" standalone line (common in transcripts).
-    _OPERATOR_PATTERN: re.Pattern[str] = re.compile(
-        r"^\s*Operator\s*$",
+        r"(?P<role>[^\n](?:[^\n]*[^\s\n])?)\s*)$",
         re.MULTILINE,
     )
 
@@ -72,6 +77,14 @@ class TranscriptParser:
         "analyst q&a",
     )
 
+    # Case-insensitive alternation over the Q&A markers.  search() returns the
+    # leftmost hit and stops there, so text after the first marker is never
+    # scanned, and no lowercased copy of the transcript is made.
+    _QA_BOUNDARY_PATTERN: re.Pattern[str] = re.compile(
+        "|".join(map(re.escape, _QA_SECTION_MARKERS)),
+        re.IGNORECASE,
+    )
+
     _PREPARED_REMARKS_MARKERS: tuple[str, ...] = (
         "prepared remarks",
         "opening remarks",
@@ -108,6 +121,26 @@ class TranscriptParser:
             speaker's segment with metadata including ``speaker``,
             ``speaker_role``, and ``section``.
         """
+        return list(self.iter_parse(text, metadata))
+
+    def iter_parse(
+        self,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[TextNode]:
+        """Lazily parse transcript text into speaker-attributed segments.
+
+        Yields the same nodes as :meth:`parse`, one at a time, so a consumer
+        such as :meth:`IndexManager.add_documents` can embed them in batches
+        without the whole transcript's nodes being held at once.
+
+        Args:
+            text: Full text of the earnings call transcript.
+            metadata: Optional base metadata dict merged into every node.
+
+        Yields:
+            :class:`TextNode` instances in transcript order.
+        """
         base_meta = metadata or {}
 
         # Determine the boundary between prepared remarks and Q&A.
@@ -116,7 +149,7 @@ class TranscriptParser:
         # Split transcript into speaker segments.
         segments = self._split_by_speaker(text)
 
-        nodes: list[TextNode] = []
+        n_nodes = 0
         for segment in segments:
             speaker = segment["speaker"]
             role = segment["role"]
@@ -141,25 +174,55 @@ class TranscriptParser:
 
             # Split long segments into multiple nodes.
             chunks = self._split_long_text(segment_text)
+            # TextNode copies its metadata dict, so a single-chunk node can
+            # take node_meta as-is; chunked nodes get one dict literal each.
+            if len(chunks) == 1:
+                n_nodes += 1
+                yield TextNode(text=chunks[0], metadata=node_meta)
+                continue
+
+            total = len(chunks)
+            n_nodes += total
             for i, chunk in enumerate(chunks):
-                chunk_meta = {**node_meta}
-                if len(chunks) > 1:
-                    chunk_meta["chunk_index"] = i
-                    chunk_meta["total_chunks"] = len(chunks)
-
-                nodes.append(
-                    TextNode(
-                        text=chunk,
-                        metadata=chunk_meta,
-                    )
+                yield TextNode(
+                    text=chunk,
+                    metadata={**node_meta, "chunk_index": i, "total_chunks": total},
                 )
 
         logger.info(
             "Parsed transcript into %d nodes (%d speaker segments)",
-            len(nodes),
+            n_nodes,
             len(segments),
         )
-        return nodes
+
+    def parse_many(
+        self,
+        documents: Iterable[tuple[str, dict[str, Any] | None]],
+        max_workers: int | None = None,
+    ) -> list[TextNode]:
+        """Parse many transcripts in parallel worker processes.
+
+        :meth:`parse` is CPU-bound and touches no shared state, so documents
+        are spread across a :class:`~concurrent.futures.ProcessPoolExecutor`
+        to get past the GIL.  Nodes come back flattened, in input order.
+
+        Args:
+            documents: ``(text, metadata)`` pairs as accepted by :meth:`parse`.
+            max_workers: Number of worker processes; defaults to the CPU
+                count.  ``1`` parses everything in the current process.
+
+        Returns:
+            The nodes of every document, in input order.
+        """
+        docs = list(documents)
+        if len(docs) < 2 or max_workers == 1:
+            return [node for text, meta in docs for node in self.parse(text, meta)]
+
+        texts, metadatas = zip(*docs)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # A few documents per task amortises the pickling round trip.
+            results = executor.map(self.parse, texts, metadatas, chunksize=4)
+            return list(chain.from_iterable(results))
 
     def _find_qa_boundary(self, text: str) -> int | None:
         """Find the character position where the Q&A session begins.
@@ -174,22 +237,15 @@ class TranscriptParser:
         Returns:
             Character index of Q&A section start, or ``None``.
         """
-        text_lower = text.lower()
-        earliest: int | None = None
-
-        for marker in self._QA_SECTION_MARKERS:
-            idx = text_lower.find(marker)
-            if idx != -1 and (earliest is None or idx < earliest):
-                earliest = idx
-
-        return earliest
+        match = self._QA_BOUNDARY_PATTERN.search(text)
+        return match.start() if match else None
 
     def _split_by_speaker(self, text: str) -> list[dict[str, Any]]:
         """Split transcript text into speaker-attributed segments.
 
         Identifies speaker lines using regex patterns and splits the text
         at each speaker boundary.  The Operator is treated as a special
-        speaker.
+        speaker.  Segments shorter than ``MIN_SEGMENT_LENGTH`` are omitted.
 
         Args:
             text: Full transcript text.
@@ -200,19 +256,12 @@ class TranscriptParser:
         """
         segments: list[dict[str, Any]] = []
 
-        # Find all speaker boundaries.
-        boundaries: list[tuple[int, int, str, str]] = []
-
-        for match in self._SPEAKER_DASH_PATTERN.finditer(text):
-            name = match.group("name").strip()
-            role = match.group("role").strip()
-            boundaries.append((match.start(), match.end(), name, role))
-
-        for match in self._OPERATOR_PATTERN.finditer(text):
-            boundaries.append((match.start(), match.end(), "Operator", "Operator"))
-
-        # Sort by position in the document.
-        boundaries.sort(key=lambda b: b[0])
+        boundaries: list[tuple[int, int, str, str]] = [
+            (m.start(), m.end(), "Operator", "Operator")
+            if m.group("operator")
+            else (m.start(), m.end(), m.group("name").strip(), m.group("role").strip())
+            for m in self._SPEAKER_LINE_PATTERN.finditer(text)
+        ]
 
         if not boundaries:
             # No speakers identified -- return the entire text as one segment.
@@ -237,21 +286,21 @@ class TranscriptParser:
                 }
             )
 
-        # Create segments between consecutive speaker boundaries.
-        for i, (start, end, name, role) in enumerate(boundaries):
-            # Text runs from the end of this speaker line to the start of the
-            # next speaker line (or end of document).
-            if i + 1 < len(boundaries):
-                next_start = boundaries[i + 1][0]
-                segment_text = text[end:next_start]
-            else:
-                segment_text = text[end:]
+        # Create segments between consecutive speaker boundaries.  Text runs
+        # from the end of each speaker line to the start of the next one (or
+        # the end of the document).  Spans too short to survive parse()'s
+        # MIN_SEGMENT_LENGTH filter are skipped before anything is sliced.
+        next_starts = [b[0] for b in boundaries[1:]]
+        next_starts.append(len(text))
+        for (start, end, name, role), next_start in zip(boundaries, next_starts):
+            if next_start - end < self.MIN_SEGMENT_LENGTH:
+                continue
 
             segments.append(
                 {
                     "speaker": name,
                     "role": role,
-                    "text": segment_text,
+                    "text": text[end:next_start],
                     "start_pos": start,
                 }
             )
@@ -267,29 +316,4 @@ class TranscriptParser:
         Returns:
             A list of one or more text chunks within the length limit.
         """
-        if len(text) <= self.MAX_NODE_LENGTH:
-            return [text]
-
-        chunks: list[str] = []
-        paragraphs = text.split("\n\n")
-        current_parts: list[str] = []
-        current_length = 0
-
-        for para in paragraphs:
-            para_len = len(para) + 2
-            if current_length + para_len > self.MAX_NODE_LENGTH and current_parts:
-                chunks.append("\n\n".join(current_parts))
-                current_parts = []
-                current_length = 0
-
-            if para_len > self.MAX_NODE_LENGTH:
-                for j in range(0, len(para), self.MAX_NODE_LENGTH):
-                    chunks.append(para[j : j + self.MAX_NODE_LENGTH])
-            else:
-                current_parts.append(para)
-                current_length += para_len
-
-        if current_parts:
-            chunks.append("\n\n".join(current_parts))
-
-        return chunks
+        return greedy_chunk(text, self.MAX_NODE_LENGTH)
@@ -14,8 +14,10 @@ import asyncio
 import functools
 import importlib
 import logging
-from dataclasses import dataclass, field
-from typing import Any
+import re
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,17 @@ except ImportError:  # pragma: no cover - llama-index is a core dependency
     _OPENAI_REASONING_MODEL_IDS = frozenset()
 
 
+# Forward-compatible: reasoning-style ids not yet in the installed LlamaIndex.
+_OPENAI_REASONING_PREFIXES: tuple[str, ...] = ("o1", "o3", "o4", "gpt-5")
+
+# LlamaIndex classes whose ``max_tokens`` handling keys off exact O1_MODELS ids:
+# OpenAI itself, and Groq, which subclasses OpenAILike -> OpenAI.
+_OPENAI_TOKEN_MAPPING_CLASSES: frozenset[tuple[str, str]] = frozenset({
+    ("llama_index.llms.openai", "OpenAI"),
+    ("llama_index.llms.groq", "Groq"),
+})
+
+
 def _openai_model_needs_canonical_id(model: str) -> bool:
     """Return True if *model* should be lowercased for LlamaIndex OpenAI token handling.
 
@@ -37,21 +50,12 @@ def _openai_model_needs_canonical_id(model: str) -> bool:
     (e.g. ``O3-mini``) skips that branch and the API may reject ``max_tokens``.
 
     Args:
-        model: Raw model string from configuration.
+        model: Model string from configuration, already stripped and lowercased.
 
     Returns:
-        Whether the identifier should be normalized with :func:`_canonical_openai_model_id`.
+        Whether the lowercased identifier should be passed to LlamaIndex.
     """
-    ml = model.strip().lower()
-    if ml in _OPENAI_REASONING_MODEL_IDS:
-        return True
-    # Forward-compatible: new reasoning-style ids not yet in the installed LlamaIndex.
-    return ml.startswith(("o1", "o3", "o4", "gpt-5"))
-
-
-def _canonical_openai_model_id(model: str) -> str:
-    """Return lowercase model id when it is a known reasoning / O1_MODELS OpenAI model."""
-    return model.strip().lower()
+    return model in _OPENAI_REASONING_MODEL_IDS or model.startswith(_OPENAI_REASONING_PREFIXES)
 
 
 def _resolve_llm_model_id(spec: ProviderSpec, model: str) -> str:
@@ -67,20 +71,18 @@ def _resolve_llm_model_id(spec: ProviderSpec, model: str) -> str:
     Returns:
         Model id to pass to the LLM class (``model`` or ``model_name``, etc.).
     """
-    if spec.class_name == "OpenAI" and spec.import_module == "llama_index.llms.openai":
-        if _openai_model_needs_canonical_id(model):
-            return _canonical_openai_model_id(model)
-        return model.strip()
-    # Groq subclasses OpenAILike → OpenAI; same ``model in O1_MODELS`` behaviour.
-    if spec.class_name == "Groq":
-        if _openai_model_needs_canonical_id(model):
-            return _canonical_openai_model_id(model)
-        return model.strip()
-    return model.strip()
-
-
-@dataclass(frozen=True)
-class ProviderSpec:
+    model = model.strip()
+    if (spec.import_module, spec.class_name) in _OPENAI_TOKEN_MAPPING_CLASSES:
+        lower = model.lower()
+        if _openai_model_needs_canonical_id(lower):
+            return lower
+    return model
+
+
+_NO_EXTRA_KWARGS: Mapping[str, Any] = MappingProxyType({})
+
+
+class ProviderSpec(NamedTuple):
     """Describes how to locate and instantiate a LlamaIndex LLM class.
 
     Attributes:
@@ -94,6 +96,7 @@ class ProviderSpec:
             SDK reads its own env var.
         extra_kwargs: Additional keyword arguments passed to the LLM
             constructor (e.g. ``api_base`` for OpenAI-compatible proxies).
+            Read-only, since specs and their defaults are shared.
         detection_prefixes: Model-name prefixes used by :func:`detect_provider`
             to auto-select this provider.
         package: pip-installable package name shown in error messages.
@@ -104,7 +107,7 @@ class ProviderSpec:
     class_name: str
     model_kwarg: str = "model"
     api_key_config_field: str | None = None
-    extra_kwargs: dict[str, Any] = field(default_factory=dict)
+    extra_kwargs: Mapping[str, Any] = _NO_EXTRA_KWARGS
     detection_prefixes: tuple[str, ...] = ()
     package: str = ""
 
@@ -113,7 +116,7 @@ class ProviderSpec:
 # Provider registry
 # ---------------------------------------------------------------------------
 
-PROVIDER_REGISTRY: dict[str, ProviderSpec] = {
+PROVIDER_REGISTRY: Mapping[str, ProviderSpec] = MappingProxyType({
     "anthropic": ProviderSpec(
         name="anthropic",
         import_module="llama_index.llms.anthropic",
@@ -170,12 +173,12 @@ PROVIDER_REGISTRY: dict[str, ProviderSpec] = {
         import_module="llama_index.llms.openai_like",
         class_name="OpenAILike",
         api_key_config_field="xai_api_key",
-        extra_kwargs={
+        extra_kwargs=MappingProxyType({
             "api_base": "https://api.x.ai/v1",
             "context_window": 131072,
             "is_chat_model": True,
             "is_function_calling_model": True,
-        },
+        }),
         detection_prefixes=("grok",),
         package="llama-index-llms-openai-like",
     ),
@@ -194,15 +197,49 @@ PROVIDER_REGISTRY: dict[str, ProviderSpec] = {
         detection_prefixes=("command",),
         package="llama-index-llms-cohere",
     ),
-}
+})
 
+# Comma-separated provider names for the unknown-provider error message.
+_AVAILABLE_PROVIDERS = ", ".join(sorted(PROVIDER_REGISTRY))
+
+
+def _compile_prefix_pattern(
+    registry: Mapping[str, ProviderSpec],
+) -> tuple[tuple[str, ...], re.Pattern[str]]:
+    """Build one case-insensitive regex over every provider's detection prefixes.
+
+    Each provider contributes one capture group holding the alternation of
+    its prefixes, in registry order, so an anchored match picks the same
+    provider as scanning the registry prefix by prefix -- in a single C call.
+
+    Args:
+        registry: Provider specifications keyed by name.
+
+    Returns:
+        A ``(names, pattern)`` pair where capture group *N* of *pattern*
+        matches a prefix of provider ``names[N - 1]``.
+    """
+    specs = [spec for spec in registry.values() if spec.detection_prefixes]
+    pattern = re.compile(
+        "|".join(
+            "(" + "|".join(map(re.escape, spec.detection_prefixes)) + ")" for spec in specs
+        ),
+        re.IGNORECASE,
+    )
+    return tuple(spec.name for spec in specs), pattern
 
+
+_PREFIX_PROVIDERS, _PREFIX_PATTERN = _compile_prefix_pattern(PROVIDER_REGISTRY)
+
+
+@functools.lru_cache(maxsize=256)
 def detect_provider(model: str) -> str:
     """Auto-detect the LLM provider from a model name string.
 
-    Scans :data:`PROVIDER_REGISTRY` entries and returns the first provider
-    whose ``detection_prefixes`` match the start of *model* (case-insensitive).
-    Falls back to ``"openai"`` if no prefix matches.
+    Returns the first :data:`PROVIDER_REGISTRY` entry whose
+    ``detection_prefixes`` match the start of *model* (case-insensitive).
+    Falls back to ``"openai"`` if no prefix matches.  Results are memoised,
+    since the same handful of model ids is looked up repeatedly.
 
     Args:
         model: A model identifier (e.g. ``"claude-sonnet-4-6"``).
@@ -210,19 +247,125 @@ def detect_provider(model: str) -> str:
     Returns:
         Provider name string suitable for :data:`PROVIDER_REGISTRY` lookup.
     """
-    lower = model.lower()
-    for spec in PROVIDER_REGISTRY.values():
-        for prefix in spec.detection_prefixes:
-            if lower.startswith(prefix):
-                logger.debug(
-                    "Detected provider %r for model %r (prefix=%r)",
-                    spec.name, model, prefix,
-                )
-                return spec.name
+    match = _PREFIX_PATTERN.match(model)
+    if match is not None and match.lastindex is not None:
+        name = _PREFIX_PROVIDERS[match.lastindex - 1]
+        logger.debug(
+            "Detected provider %r for model %r (prefix=%r)",
+            name, model, match.group(),
+        )
+        return name
     logger.debug("No prefix matched model %r, falling back to 'openai'", model)
     return "openai"
 
 
+# Constructor kwargs that never vary per call, keyed by provider name: each
+# spec's extra_kwargs plus provider-specific settings.
+_BASE_KWARGS: dict[str, dict[str, Any]] = {
+    name: dict(spec.extra_kwargs) for name, spec in PROVIDER_REGISTRY.items()
+}
+
+# Enable Anthropic prompt caching.  cache_idx=-1 instructs LlamaIndex to add
+# cache_control breakpoints on all messages up to the last one, which covers
+# the system prompt and all accumulated tool context -- the largest cost
+# driver in multi-agent workflows.
+_BASE_KWARGS["anthropic"]["cache_idx"] = -1
+
+# Resolved LLM classes keyed by provider name, so repeat build_llm calls skip
+# importlib (import lock + sys.modules lookup) and the attribute lookup.
+_LLM_CLASS_CACHE: dict[str, type] = {}
+
+
+def _load_llm_class(spec: ProviderSpec) -> type:
+    """Import and return the LlamaIndex LLM class for *spec*, caching it.
+
+    Args:
+        spec: Provider specification.
+
+    Returns:
+        The LLM class named by ``spec.class_name``.
+
+    Raises:
+        ImportError: If the required package is not installed.
+    """
+    cls = _LLM_CLASS_CACHE.get(spec.name)
+    if cls is not None:
+        return cls
+
+    try:
+        module = importlib.import_module(spec.import_module)
+    except ImportError as exc:
+        raise ImportError(
+            f"Provider {spec.name!r} requires package {spec.package!r}. "
+            f"Install it with:  pip install {spec.package}"
+        ) from exc
+
+    cls = _LLM_CLASS_CACHE[spec.name] = getattr(module, spec.class_name)
+    return cls
+
+
+def _make_builder(spec: ProviderSpec) -> Callable[[str, Any], Any]:
+    """Specialise LLM construction for *spec* into a closure.
+
+    Everything that depends only on the provider -- the model keyword, the
+    constant kwargs, the API-key field, and whether the model id needs
+    OpenAI-style canonicalisation -- is decided here, once, so each
+    :func:`build_llm` call only does the per-config work.
+
+    Args:
+        spec: Provider specification.
+
+    Returns:
+        A ``build(model, config)`` function returning an unwrapped LLM.
+    """
+    name = spec.name
+    class_name = spec.class_name
+    model_kwarg = spec.model_kwarg
+    key_field = spec.api_key_config_field
+    base_kwargs = _BASE_KWARGS[name]
+    canonicalise = (spec.import_module, class_name) in _OPENAI_TOKEN_MAPPING_CLASSES
+    use_cached_content = name == "google"
+
+    def build(model: str, config: Any) -> Any:
+        cls = _load_llm_class(spec)
+
+        resolved_model = _resolve_llm_model_id(spec, model) if canonicalise else model.strip()
+        kwargs: dict[str, Any] = {model_kwarg: resolved_model, **base_kwargs}
+
+        if key_field:
+            key = getattr(config, key_field, None)
+            if key:
+                kwargs["api_key"] = key
+
+        max_tokens = getattr(config, "llm_max_tokens", 8192)
+        # LlamaIndex OpenAI maps this to max_completion_tokens for O1_MODELS when model id
+        # matches; see _resolve_llm_model_id.
+        kwargs["max_tokens"] = max_tokens
+
+        # Enable Google GenAI cached content when configured.  The caller must
+        # pre-create the cache via the Google GenAI SDK (including the system
+        # instruction) and set HERMES_GOOGLE_CACHED_CONTENT to the cache name.
+        if use_cached_content:
+            cached_content = getattr(config, "google_cached_content", None)
+            if cached_content:
+                kwargs["cached_content"] = cached_content
+                logger.info("Google cached content enabled: %s", cached_content)
+
+        logger.info(
+            "Building LLM: provider=%r, model=%r, class=%s, max_tokens=%d",
+            name, resolved_model, class_name, max_tokens,
+        )
+        return cls(**kwargs)
+
+    return build
+
+
+# One specialised constructor per provider, built once at import.
+_BUILDERS: dict[str, Callable[[str, Any], Any]] = {
+    name: _make_builder(spec) for name, spec in PROVIDER_REGISTRY.items()
+}
+
+
 def build_llm(provider: str, model: str, config: Any) -> Any:
     """Construct a LlamaIndex LLM instance for the given provider.
 
@@ -239,61 +382,13 @@ def build_llm(provider: str, model: str, config: Any) -> Any:
         ValueError: If *provider* is not in the registry.
         ImportError: If the required package is not installed.
     """
-    if provider not in PROVIDER_REGISTRY:
-        available = ", ".join(sorted(PROVIDER_REGISTRY))
+    builder = _BUILDERS.get(provider)
+    if builder is None:
         raise ValueError(
             f"Unknown LLM provider {provider!r}. "
-            f"Available providers: {available}"
+            f"Available providers: {_AVAILABLE_PROVIDERS}"
         )
-
-    spec = PROVIDER_REGISTRY[provider]
-
-    try:
-        module = importlib.import_module(spec.import_module)
-    except ImportError as exc:
-        raise ImportError(
-            f"Provider {provider!r} requires package {spec.package!r}. "
-            f"Install it with:  pip install {spec.package}"
-        ) from exc
-
-    cls = getattr(module, spec.class_name)
-
-    resolved_model = _resolve_llm_model_id(spec, model)
-    kwargs: dict[str, Any] = {spec.model_kwarg: resolved_model}
-    kwargs.update(spec.extra_kwargs)
-
-    if spec.api_key_config_field:
-        key = getattr(config, spec.api_key_config_field, None)
-        if key:
-            kwargs["api_key"] = key
-
-    max_tokens = getattr(config, "llm_max_tokens", 8192)
-    # LlamaIndex OpenAI maps this to max_completion_tokens for O1_MODELS when model id
-    # matches; see _resolve_llm_model_id.
-    kwargs["max_tokens"] = max_tokens
-
-    # Enable Anthropic prompt caching.  cache_idx=-1 instructs LlamaIndex to
-    # add cache_control breakpoints on all messages up to the last one, which
-    # covers the system prompt and all accumulated tool context -- the largest
-    # cost driver in multi-agent workflows.
-    if provider == "anthropic":
-        kwargs["cache_idx"] = -1
-
-    # Enable Google GenAI cached content when configured.  The caller must
-    # pre-create the cache via the Google GenAI SDK (including the system
-    # instruction) and set HERMES_GOOGLE_CACHED_CONTENT to the cache name.
-    if provider == "google":
-        cached_content = getattr(config, "google_cached_content", None)
-        if cached_content:
-            kwargs["cached_content"] = cached_content
-            logger.info("Google cached content enabled: %s", cached_content)
-
-    logger.info(
-        "Building LLM: provider=%r, model=%r, class=%s, max_tokens=%d",
-        provider, resolved_model, spec.class_name, max_tokens,
-    )
-    llm = cls(**kwargs)
-    return _wrap_with_retry(llm, provider)
+    return _wrap_with_retry(builder(model, config), provider)
 
 
 # ---------------------------------------------------------------------------
@@ -11,11 +11,15 @@ that the orchestrator can filter by capability at planning time.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Shared by every tag-less ToolEntry instead of allocating one per entry.
+_NO_TAGS: frozenset[str] = frozenset()
+
 
 @dataclass(slots=True)
 class ToolEntry:
@@ -23,7 +27,7 @@ class ToolEntry:
 
     name: str
     tool: Any  # llama_index.core.tools.FunctionTool at runtime
-    tags: list[str] = field(default_factory=list)
+    tags: frozenset[str] = _NO_TAGS
     description: str = ""
 
 
@@ -47,6 +51,8 @@ class Registry:
     def __init__(self) -> None:
         self._tools: dict[str, ToolEntry] = {}
         self._agents: dict[str, AgentEntry] = {}
+        # Inverted index: tag -> {tool name: entry}, kept in step with _tools.
+        self._by_tag: dict[str, dict[str, ToolEntry]] = {}
 
     # -- Tool operations ------------------------------------------------------
 
@@ -74,12 +80,18 @@ class Registry:
                 f"Tool '{name}' is already registered. "
                 "Pass override=True to replace it."
             )
-        self._tools[name] = ToolEntry(
+        entry = ToolEntry(
             name=name,
             tool=tool,
-            tags=tags or [],
+            tags=frozenset(tags) if tags else _NO_TAGS,
             description=description,
         )
+        previous = self._tools.get(name)
+        if previous is not None:
+            self._unindex(previous, keep=entry.tags)
+        self._tools[name] = entry
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, {})[name] = entry
         logger.debug("Registered tool %r (tags=%s)", name, tags or [])
 
     def get_tool(self, name: str) -> ToolEntry:
@@ -91,18 +103,35 @@ class Registry:
 
     def find_tools_by_tag(self, tag: str) -> list[ToolEntry]:
         """Return every tool whose tags include *tag*."""
-        return [entry for entry in self._tools.values() if tag in entry.tags]
+        return list(self._by_tag.get(tag, {}).values())
+
+    def iter_tools(self) -> Iterator[tuple[str, frozenset[str]]]:
+        """Yield ``(name, tags)`` for each tool in registration order.
+
+        Unlike :meth:`list_tools`, nothing is copied or sorted, so callers
+        that only scan names or tags once can skip building the mapping.
+        """
+        return ((name, entry.tags) for name, entry in self._tools.items())
 
     def list_tools(self) -> dict[str, list[str]]:
-        """Return a mapping of tool names to their tags."""
-        return {name: entry.tags for name, entry in self._tools.items()}
+        """Return a mapping of tool names to their sorted tags."""
+        return {name: sorted(tags) for name, tags in self.iter_tools()}
 
     def remove_tool(self, name: str) -> None:
         """Remove a tool by *name*.  Raises :class:`KeyError` if not found."""
         try:
-            del self._tools[name]
+            entry = self._tools.pop(name)
         except KeyError:
             raise KeyError(f"No tool registered with name '{name}'.") from None
+        self._unindex(entry)
+
+    def _unindex(self, entry: ToolEntry, keep: frozenset[str] = _NO_TAGS) -> None:
+        """Drop *entry* from the tag index, except under the tags in *keep*."""
+        for tag in entry.tags - keep:
+            tagged = self._by_tag[tag]
+            del tagged[entry.name]
+            if not tagged:
+                del self._by_tag[tag]
 
     # -- Agent operations -----------------------------------------------------
 
@@ -158,6 +187,7 @@ class Registry:
         """Remove all registered tools and agents.  Intended for testing."""
         self._tools.clear()
         self._agents.clear()
+        self._by_tag.clear()
 
     def __repr__(self) -> str:
         return (
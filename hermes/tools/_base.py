@@ -1,4 +1,4 @@
-"""Shared HTTP client, caching helpers, and request utilities.
+"""Shared HTTP client, caching helpers, request utilities, and tool registration.
 
 All network-facing tools use the helpers in this module so that rate limiting
 and caching are applied consistently.
@@ -6,10 +6,14 @@ and caching are applied consistently.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
+from llama_index.core.tools import FunctionTool
 
 from hermes.config import get_config
 from hermes.infra.cache import FileCache
@@ -27,43 +31,72 @@ FRED_BASE_URL = "https://api.stlouisfed.org"
 YAHOO_BASE_URL = "https://query1.finance.yahoo.com"
 
 # ---------------------------------------------------------------------------
-# Lazy singletons
+# Shared singletons
 # ---------------------------------------------------------------------------
 
-_client: httpx.AsyncClient | None = None
-_cache: FileCache | None = None
 
-
-def get_http_client() -> httpx.AsyncClient:
+@functools.cache
+def get_http_client(base_url: str = "") -> httpx.AsyncClient:
     """Return a shared :class:`httpx.AsyncClient` with sensible defaults.
 
-    The client is created once and reused for connection pooling.  It sets a
-    generous timeout for the large filing downloads that SEC EDGAR can produce.
+    One client is created per *base_url* and reused for connection pooling,
+    so each API host gets its own pool and requests to it can pass just the
+    path.  Clients set a generous timeout for the large filing downloads that
+    SEC EDGAR can produce.
+
+    Args:
+        base_url: Base URL that request paths are resolved against, e.g.
+            :data:`SEC_BASE_URL`.  The default client takes full URLs.
     """
-    global _client  # noqa: PLW0603
-    if _client is None:
-        _client = httpx.AsyncClient(
-            timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0),
-            follow_redirects=True,
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
-            headers={"Accept": "application/json"},
-        )
-    return _client
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0),
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        headers={"Accept": "application/json"},
+    )
 
 
+@functools.cache
 def get_cache() -> FileCache:
     """Return a shared :class:`FileCache` rooted at the configured cache_dir."""
-    global _cache  # noqa: PLW0603
-    if _cache is None:
-        cfg = get_config()
-        _cache = FileCache(base_dir=cfg.cache_dir)
-    return _cache
+    return FileCache(base_dir=get_config().cache_dir)
 
 
 # ---------------------------------------------------------------------------
 # API-specific GET helpers
 # ---------------------------------------------------------------------------
 
+# Per-request headers are built once and shared; httpx copies them into each
+# request, so they are never mutated.
+_YAHOO_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _sec_headers(user_agent: str) -> dict[str, str]:
+    """Return the shared SEC request headers for *user_agent*.
+
+    Keyed on the configured User-Agent, so a later ``configure()`` call with
+    a different value picks up new headers without explicit invalidation.
+    """
+    return {"User-Agent": user_agent}
+
+
+@functools.lru_cache(maxsize=4)
+def _fred_params(api_key: str) -> dict[str, str]:
+    """Return the shared FRED query parameters for *api_key*.
+
+    Like :func:`_sec_headers`, keyed on the configured value so a changed
+    key is picked up without explicit invalidation.
+    """
+    return {"api_key": api_key, "file_type": "json"}
+
 
 async def sec_get(path: str, params: dict | None = None) -> dict:
     """Rate-limited GET to SEC EDGAR (``data.sec.gov``).
@@ -89,16 +122,16 @@ async def sec_get(path: str, params: dict | None = None) -> dict:
             "Set HERMES_SEC_USER_AGENT or call configure(sec_user_agent=...)."
         )
 
-    client = get_http_client()
+    client = get_http_client(SEC_BASE_URL)
     limiter = get_limiter("sec_edgar")
 
     async with limiter:
-        url = f"{SEC_BASE_URL}{path}"
-        logger.debug("SEC GET %s", url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SEC GET %s%s", SEC_BASE_URL, path)
         response = await client.get(
-            url,
+            path,
             params=params,
-            headers={"User-Agent": cfg.sec_user_agent},
+            headers=_sec_headers(cfg.sec_user_agent),
         )
         response.raise_for_status()
         return response.json()
@@ -123,16 +156,16 @@ async def sec_efts_get(path: str, params: dict | None = None) -> dict:
             "sec_user_agent must be configured before calling SEC EDGAR APIs."
         )
 
-    client = get_http_client()
+    client = get_http_client(SEC_EFTS_URL)
     limiter = get_limiter("sec_edgar")
 
     async with limiter:
-        url = f"{SEC_EFTS_URL}{path}"
-        logger.debug("SEC EFTS GET %s", url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SEC EFTS GET %s%s", SEC_EFTS_URL, path)
         response = await client.get(
-            url,
+            path,
             params=params,
-            headers={"User-Agent": cfg.sec_user_agent},
+            headers=_sec_headers(cfg.sec_user_agent),
         )
         response.raise_for_status()
         return response.json()
@@ -161,17 +194,17 @@ async def fred_get(path: str, params: dict | None = None) -> dict:
             "Set HERMES_FRED_API_KEY or call configure(fred_api_key=...)."
         )
 
-    merged_params = {"api_key": cfg.fred_api_key, "file_type": "json"}
+    merged_params = _fred_params(cfg.fred_api_key)
     if params:
-        merged_params.update(params)
+        merged_params = merged_params | params
 
-    client = get_http_client()
+    client = get_http_client(FRED_BASE_URL)
     limiter = get_limiter("fred")
 
     async with limiter:
-        url = f"{FRED_BASE_URL}{path}"
-        logger.debug("FRED GET %s", url)
-        response = await client.get(url, params=merged_params)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FRED GET %s%s", FRED_BASE_URL, path)
+        response = await client.get(path, params=merged_params)
         response.raise_for_status()
         return response.json()
 
@@ -193,17 +226,12 @@ async def yahoo_get(url: str, params: dict | None = None) -> dict:
     limiter = get_limiter("yahoo_finance")
 
     async with limiter:
-        logger.debug("Yahoo GET %s", url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Yahoo GET %s", url)
         response = await client.get(
             url,
             params=params,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-            },
+            headers=_YAHOO_HEADERS,
         )
         response.raise_for_status()
         return response.json()
@@ -214,6 +242,16 @@ async def yahoo_get(url: str, params: dict | None = None) -> dict:
 # ---------------------------------------------------------------------------
 
 
+# Disk reads and writes for cached_request run here, off the event loop.  A
+# single worker keeps FileCache's in-process bookkeeping (which is not
+# thread-safe) confined to one thread.
+_cache_io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hermes-cache")
+
+# Fetches currently running in cached_request, keyed by (namespace, key), so
+# concurrent misses on the same entry share one network round trip.
+_inflight: dict[tuple[str, str], asyncio.Task[bytes]] = {}
+
+
 async def cached_request(
     namespace: str,
     key: str,
@@ -224,6 +262,10 @@ async def cached_request(
 
     This is the standard pattern for all cacheable tool calls: try the disk
     cache first, fall back to the network, then store the result for next time.
+    Cache reads and writes run on a background thread so disk latency does not
+    stall the event loop.
+    Concurrent calls that miss on the same entry wait for a single fetch
+    instead of each calling *fetch_fn*.
 
     Args:
         namespace: Cache namespace (e.g. ``"sec_facts"``).
@@ -235,13 +277,76 @@ async def cached_request(
         The cached or freshly fetched bytes.
     """
     cache = get_cache()
+    loop = asyncio.get_running_loop()
 
-    cached = cache.get(namespace, key)
+    # Checked once up front: debug is normally off, and the guard skips the
+    # logger.debug() call frame on every request.
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    cached = await loop.run_in_executor(_cache_io, cache.get, namespace, key)
     if cached is not None:
-        logger.debug("Cache hit: %s/%s", namespace, key)
+        if debug:
+            logger.debug("Cache hit: %s/%s", namespace, key)
         return cached
 
-    logger.debug("Cache miss: %s/%s -- fetching", namespace, key)
+    inflight_key = (namespace, key)
+    task = _inflight.get(inflight_key)
+    if task is None or task.get_loop() is not loop:
+        if debug:
+            logger.debug("Cache miss: %s/%s -- fetching", namespace, key)
+        task = asyncio.ensure_future(_fetch_and_store(cache, namespace, key, fetch_fn, ttl))
+        _inflight[inflight_key] = task
+        task.add_done_callback(functools.partial(_forget_inflight, inflight_key))
+    elif debug:
+        logger.debug("Cache miss: %s/%s -- joining in-flight fetch", namespace, key)
+
+    # Shielded so that one cancelled caller does not cancel the fetch that
+    # the other callers are waiting on.
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_store(
+    cache: FileCache,
+    namespace: str,
+    key: str,
+    fetch_fn: Callable[[], Awaitable[bytes]],
+    ttl: float | None,
+) -> bytes:
+    """Call *fetch_fn* and store its result in *cache*."""
     data = await fetch_fn()
-    cache.put(namespace, key, data, ttl_seconds=ttl)
+    await asyncio.get_running_loop().run_in_executor(
+        _cache_io, functools.partial(cache.put, namespace, key, data, ttl_seconds=ttl)
+    )
     return data
+
+
+def _forget_inflight(inflight_key: tuple[str, str], task: asyncio.Task[bytes]) -> None:
+    """Drop a finished fetch from ``_inflight`` unless it was already replaced."""
+    if _inflight.get(inflight_key) is task:
+        del _inflight[inflight_key]
+
+
+# ---------------------------------------------------------------------------
+# Tool registration
+# ---------------------------------------------------------------------------
+
+
+def shared_tools(
+    create_tools: Callable[[], list[FunctionTool]],
+) -> Callable[[], list[FunctionTool]]:
+    """Decorate a module's ``create_tools`` so its tools are built only once.
+
+    Building a :class:`FunctionTool` introspects the function signature and
+    generates a pydantic schema, so the tools are built on the first call and
+    the same objects are returned to every later caller.  Each call gets a
+    fresh list, so callers may extend it.  Callers must not mutate the tools
+    themselves; :func:`hermes.agents.base.patch_tools_for_google` patches
+    copies for this reason.
+    """
+    build = functools.cache(lambda: tuple(create_tools()))
+
+    @functools.wraps(create_tools)
+    def wrapper() -> list[FunctionTool]:
+        return list(build())
+
+    return wrapper
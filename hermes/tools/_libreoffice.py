@@ -0,0 +1,273 @@
+"""Persistent LibreOffice conversion process for PDF export.
+
+Launching ``libreoffice --headless`` per conversion pays the office suite's
+multi-second cold start every time, and concurrent launches contend for the
+same user-profile lock.  Instead, one long-lived office process is started
+on first use and reused for every later conversion:
+
+* When `unoserver <https://github.com/unoconv/unoserver>`_ is installed, it
+  runs the server and each conversion is a lightweight ``unoconvert`` call.
+* Otherwise, when LibreOffice's ``uno`` Python bindings are importable, a
+  headless ``soffice`` listening on a UNO socket is driven directly.
+
+:func:`convert_to_pdf` reports whether it handled the conversion, so callers
+can fall back to the one-shot CLI when neither is available.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+    import uno  # type: ignore[import-not-found]
+    from com.sun.star.beans import PropertyValue  # type: ignore[import-not-found]
+    from com.sun.star.connection import NoConnectException  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - only importable from LibreOffice's Python
+    uno = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+#: Interface and XML-RPC port the unoserver conversion server listens on.
+SERVER_HOST: str = "127.0.0.1"
+SERVER_PORT: int = 2003
+
+#: UNO socket port of the ``soffice`` process driven directly without unoserver.
+UNO_PORT: int = 2002
+
+#: Seconds to wait for a freshly started office process to accept connections.
+STARTUP_TIMEOUT: float = 30.0
+
+_server: subprocess.Popen | None = None
+_server_lock = threading.Lock()
+
+_soffice: subprocess.Popen | None = None
+_desktop: Any = None  # com.sun.star.frame.Desktop of _soffice.
+# Private user profile of _soffice, so it never contends for the lock on the
+# user's own LibreOffice profile.
+_profile_dir: str | None = None
+# Serialises soffice start-up and conversions; one office process loads one
+# document at a time.
+_soffice_lock = threading.Lock()
+
+
+def _port_open() -> bool:
+    """Return True if something is accepting connections on the server port."""
+    try:
+        with socket.create_connection((SERVER_HOST, SERVER_PORT), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def _terminate(proc: subprocess.Popen | None) -> None:
+    """Terminate *proc* if it is still running, killing it if it lingers."""
+    if proc is not None and proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def _stop_server() -> None:
+    """Terminate the conversion server if this process started it.
+
+    Must be called with ``_server_lock`` held, except at interpreter exit.
+    """
+    global _server  # noqa: PLW0603
+
+    _terminate(_server)
+    _server = None
+
+
+def _stop_soffice() -> None:
+    """Terminate the directly driven ``soffice`` if this process started it."""
+    global _soffice, _desktop, _profile_dir  # noqa: PLW0603
+
+    _terminate(_soffice)
+    _soffice = _desktop = None
+    if _profile_dir is not None:
+        shutil.rmtree(_profile_dir, ignore_errors=True)
+        _profile_dir = None
+
+
+atexit.register(_stop_server)
+atexit.register(_stop_soffice)
+
+
+def _ensure_server() -> subprocess.Popen | None:
+    """Start the conversion server once; return it when it is accepting requests."""
+    global _server  # noqa: PLW0603
+
+    with _server_lock:
+        if _server is not None and _server.poll() is None:
+            return _server
+
+        executable = shutil.which("unoserver")
+        if executable is None:
+            return None
+        if _port_open():
+            # Not ours: whatever is listening never gets handed our documents.
+            logger.warning(
+                "Port %d is already in use; not starting the conversion server", SERVER_PORT
+            )
+            return None
+
+        logger.info("Starting LibreOffice conversion server on %s:%d", SERVER_HOST, SERVER_PORT)
+        try:
+            _server = subprocess.Popen(
+                [executable, "--interface", SERVER_HOST, "--port", str(SERVER_PORT)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as exc:
+            logger.warning("Could not start unoserver: %s", exc)
+            return None
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if _server.poll() is not None:
+                break  # Exited early, e.g. the port is taken or soffice is missing.
+            # Only count the port as ours while our own process is still alive.
+            if _port_open() and _server.poll() is None:
+                return _server
+            time.sleep(0.2)
+
+        logger.warning("LibreOffice conversion server did not start; using one-shot CLI")
+        _stop_server()
+        return None
+
+
+def _ensure_desktop() -> Any:
+    """Start ``soffice`` once and return its UNO Desktop, or None if unavailable.
+
+    Must be called with ``_soffice_lock`` held.  Errors starting or connecting
+    to ``soffice`` propagate; the caller stops the process.
+    """
+    global _soffice, _desktop, _profile_dir  # noqa: PLW0603
+
+    if _soffice is not None and _soffice.poll() is None and _desktop is not None:
+        return _desktop
+
+    executable = shutil.which("soffice") or shutil.which("libreoffice")
+    if uno is None or executable is None:
+        return None
+
+    _stop_soffice()  # Reap a process that died since the last conversion.
+    connection = f"socket,host={SERVER_HOST},port={UNO_PORT};urp;StarOffice.ComponentContext"
+    logger.info("Starting LibreOffice on UNO port %d", UNO_PORT)
+    _profile_dir = tempfile.mkdtemp(prefix="hermes-soffice-")
+    _soffice = subprocess.Popen(
+        [
+            executable,
+            "--headless",
+            "--invisible",
+            "--norestore",
+            f"-env:UserInstallation={Path(_profile_dir).as_uri()}",
+            f"--accept={connection}",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    local_ctx = uno.getComponentContext()
+    resolver = local_ctx.ServiceManager.createInstanceWithContext(
+        "com.sun.star.bridge.UnoUrlResolver", local_ctx
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline and _soffice.poll() is None:
+        try:
+            ctx = resolver.resolve(f"uno:{connection}")
+        except NoConnectException:
+            time.sleep(0.2)
+            continue
+        _desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+        return _desktop
+
+    logger.warning("LibreOffice did not accept UNO connections; using one-shot CLI")
+    _stop_soffice()
+    return None
+
+
+def _convert_via_uno(docx_file: Path, pdf_path: Path) -> bool:
+    """Convert *docx_file* to *pdf_path* with the directly driven ``soffice``."""
+    with _soffice_lock:
+        try:
+            desktop = _ensure_desktop()
+            if desktop is None:
+                return False
+            document = desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(docx_file.resolve())),
+                "_blank",
+                0,
+                (PropertyValue(Name="Hidden", Value=True),),
+            )
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(pdf_path.resolve())),
+                    (PropertyValue(Name="FilterName", Value="writer_pdf_Export"),),
+                )
+            finally:
+                document.close(True)
+        except Exception as exc:  # UNO raises its own exception hierarchy.
+            # The office process may have died; start afresh next time.
+            logger.warning("UNO conversion of %s failed: %s", docx_file, exc)
+            _stop_soffice()
+            return False
+    return pdf_path.exists()
+
+
+def convert_to_pdf(docx_file: Path, target_dir: Path) -> bool:
+    """Convert *docx_file* to a same-named PDF in *target_dir* via a persistent process.
+
+    Args:
+        docx_file: The ``.docx`` file to convert.
+        target_dir: Existing directory to write the PDF into.
+
+    Returns:
+        True if the PDF was written; False if neither unoserver nor the UNO
+        bindings are available, the office process could not be started, or
+        the conversion failed.
+    """
+    pdf_path = target_dir / docx_file.with_suffix(".pdf").name
+
+    client = shutil.which("unoconvert")
+    server = _ensure_server() if client is not None else None
+    if client is None or server is None:
+        return _convert_via_uno(docx_file, pdf_path)
+
+    try:
+        result = subprocess.run(
+            [
+                client,
+                "--host", SERVER_HOST,
+                "--port", str(SERVER_PORT),
+                "--convert-to", "pdf",
+                str(docx_file),
+                str(pdf_path),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+    except (subprocess.TimeoutExpired, OSError) as exc:
+        # A hung server would stall every later conversion; start afresh next time,
+        # unless another thread has already replaced it.
+        logger.warning("unoconvert of %s failed: %s", docx_file, exc)
+        with _server_lock:
+            if _server is server:
+                _stop_server()
+        return False
+    if result.returncode != 0:
+        logger.warning("unoconvert failed (exit %d): %s", result.returncode, result.stderr.strip())
+        return False
+    return pdf_path.exists()
@@ -1,30 +1,49 @@
 """Chart generation tools using matplotlib.
 
 Produces static PNG images for embedding in Excel workbooks and Word documents.
-All chart functions return the file path to the saved image.  The Agg backend
-is used so no display server is required.
+All chart functions return the file path to the saved image.  Figures are
+built with the object-oriented API on an Agg canvas rather than through
+pyplot, so no display server or global figure manager is involved and charts
+can be rendered from worker threads.
+
+With ``chart_workers`` set above 0, charts requested while another is
+rendering are handed to a persistent process pool so they use other cores.
+The pool is opt-in because it uses the ``spawn`` start method, which
+re-imports the main module in each worker: the host program's entry point
+must be guarded by ``if __name__ == "__main__":``.
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+import multiprocessing
+import os
+import threading
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import matplotlib
-import matplotlib.pyplot as plt
+import matplotlib.style
 import numpy as np
 from llama_index.core.tools import FunctionTool
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from hermes.config import get_config
+from hermes.tools._base import shared_tools
 
 logger = logging.getLogger(__name__)
 
-# Use a non-interactive backend so charts can be generated on headless servers.
-matplotlib.use("Agg")
-
-# Consistent professional styling across all charts.
-plt.rcParams.update({
+# Consistent professional styling across all charts, registered as the
+# "hermes" style.  It is applied to the global rcParams on the first chart a
+# process draws rather than at import, so importing the tools (or starting a
+# chart worker) does not restyle the host application's plots.
+_HERMES_STYLE = matplotlib.RcParams({
     "figure.facecolor": "white",
     "axes.facecolor": "white",
     "axes.grid": True,
@@ -33,26 +52,95 @@ plt.rcParams.update({
     "axes.titlesize": 14,
     "axes.labelsize": 12,
 })
+matplotlib.style.library["hermes"] = _HERMES_STYLE
+
+#: Default chart resolution.  A 12-inch-wide chart is 1200 px, more than a
+#: 6-inch embed in a document shows at screen resolution.
+CHART_DPI: int = 100
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Idle (figure, axes) pairs keyed by figsize.  Creating a figure pays for
+# canvas, font and artist setup on every call; a pooled figure is only
+# cleared.  At most _FIG_POOL_MAX figures are kept across all sizes.
+_FIG_POOL: dict[tuple[float, float], list[tuple[Figure, Axes]]] = {}
+_FIG_POOL_MAX = 8
+_fig_pool_lock = threading.Lock()
+
+
+@functools.cache
+def _use_hermes_style() -> None:
+    """Apply the "hermes" style once per process."""
+    matplotlib.style.use("hermes")
+
+
+def _acquire_fig(figsize: tuple[float, float]) -> tuple[Figure, Axes]:
+    """Return a blank figure with a single axes, reusing a pooled one if available."""
+    _use_hermes_style()
+    with _fig_pool_lock:
+        idle = _FIG_POOL.get(figsize)
+        if idle:
+            return idle.pop()
+    # Constrained layout is solved once per save, in a non-rasterising layout
+    # pass before the real draw; it replaces tight_layout() plus the extra
+    # measuring render that bbox_inches="tight" needs.  The solved positions
+    # depend on tick and title text extents, so they are not cached.
+    fig = Figure(figsize=figsize, layout="constrained")
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def _release_fig(fig: Figure) -> None:
+    """Clear *fig* and return it to the pool, or drop it if the pool is full.
+
+    The whole figure is cleared, not just the main axes, so extra axes such
+    as heatmap colorbars never leak into the next chart.
+    """
+    fig.clear()
+    ax = fig.add_subplot()
+    figsize = tuple(fig.get_size_inches())
+    with _fig_pool_lock:
+        if sum(map(len, _FIG_POOL.values())) < _FIG_POOL_MAX:
+            _FIG_POOL.setdefault(figsize, []).append((fig, ax))
+
 
-def _save_chart(fig: matplotlib.figure.Figure, filename: str | None = None) -> str:
-    """Save a matplotlib figure to the configured output directory.
+def _waterfall_layout(values: list[float]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute waterfall bar geometry in a few whole-array operations.
+
+    Every value but the last is a step floating on the running total; the
+    last bar is the net total, drawn from zero.
 
     Args:
-        fig: The matplotlib figure to save.
-        filename: Optional filename (without directory).  A unique name is
-            generated if not provided.
+        values: Step values; the last entry stands for the total.
 
     Returns:
-        Absolute path to the saved PNG file.
+        ``(bottoms, heights, rising)`` where *bottoms* and *heights* cover
+        every bar and *rising* is a boolean mask over the steps only.
+    """
+    steps = np.asarray(values[:-1], dtype=float)
+    ends = np.cumsum(steps)
+    # Each step spans from the running total before it to the one after it.
+    bottoms = np.append(np.minimum(ends - steps, ends), 0.0)
+    heights = np.append(np.abs(steps), ends[-1] if steps.size else 0.0)
+    return bottoms, heights, steps >= 0
+
+
+def _heatmap_dark_cells(arr: np.ndarray, cells: np.ndarray) -> np.ndarray:
+    """Return a boolean mask of *cells* more than one std from *arr*'s mean.
+
+    Those cells are drawn dark by the diverging colormap and get white text.
+    """
+    return np.abs(cells - arr.mean()) > arr.std()
+
+
+def _chart_path(output_dir: Path, filename: str | None) -> Path:
+    """Return the PNG path for a chart in *output_dir*, creating the directory.
+
+    A unique name is generated if *filename* is not provided.
     """
-    cfg = get_config()
-    output_dir = Path(cfg.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     if filename is None:
@@ -60,11 +148,258 @@ def _save_chart(fig: matplotlib.figure.Figure, filename: str | None = None) -> s
     if not filename.endswith(".png"):
         filename += ".png"
 
-    filepath = output_dir / filename
-    fig.savefig(str(filepath), dpi=150, bbox_inches="tight")
-    plt.close(fig)
-    logger.info("Saved chart to %s", filepath.resolve())
-    return str(filepath.resolve())
+    return output_dir / filename
+
+
+def _render_to_file(
+    draw: Callable[..., None],
+    figsize: tuple[float, float],
+    filepath: Path,
+    dpi: int,
+    args: tuple[Any, ...],
+) -> None:
+    """Draw a chart on a pooled figure and save it to *filepath*.
+
+    Runs either in the calling thread or in a chart worker process.
+    """
+    fig, ax = _acquire_fig(figsize)
+    try:
+        draw(fig, ax, *args)
+        fig.savefig(str(filepath), dpi=dpi)
+    finally:
+        _release_fig(fig)
+
+
+# Worker processes for overlapping renders.  Matplotlib holds the GIL for
+# most of a render, so charts requested concurrently (e.g. by parallel tool
+# calls) only scale across cores in separate processes.  The pool is created
+# on first overlap and kept for the life of the process.
+_chart_pool: ProcessPoolExecutor | None = None
+_charts_in_flight = 0
+_chart_pool_lock = threading.Lock()
+
+
+def _get_chart_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the chart worker pool, creating it on first use.
+
+    Must be called with ``_chart_pool_lock`` held.
+    """
+    global _chart_pool  # noqa: PLW0603
+
+    if _chart_pool is None:
+        # "spawn" rather than fork: forking a process whose other threads
+        # may hold locks (logging, matplotlib's font cache) can deadlock.
+        _chart_pool = ProcessPoolExecutor(
+            max_workers=max(1, min(workers, os.cpu_count() or 1)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _chart_pool
+
+
+def _render(
+    draw: Callable[..., None],
+    figsize: tuple[float, float],
+    filename: str | None,
+    dpi: int,
+    *args: Any,
+) -> str:
+    """Render a chart to the configured output directory.
+
+    A lone chart is drawn in the calling thread, avoiding process start-up
+    and pickling costs.  While another render is already in progress the
+    chart is sent to the worker pool instead, so concurrent requests run on
+    separate cores.  With ``chart_workers`` at its default of 0, every chart
+    renders inline.
+
+    Args:
+        draw: One of the module-level ``_draw_*`` functions.
+        figsize: Figure size in inches.
+        filename: Optional filename (without directory).
+        dpi: Output resolution in pixels per inch.
+        *args: Chart data forwarded to *draw*; must be picklable.
+
+    Returns:
+        Absolute path to the saved PNG file.
+    """
+    global _charts_in_flight  # noqa: PLW0603
+
+    # Resolve the path here so the caller's config applies in the worker too.
+    cfg = get_config()
+    filepath = _chart_path(Path(cfg.output_dir), filename).resolve()
+
+    with _chart_pool_lock:
+        pool = (
+            _get_chart_pool(cfg.chart_workers)
+            if _charts_in_flight and cfg.chart_workers > 0
+            else None
+        )
+        _charts_in_flight += 1
+    try:
+        if pool is None:
+            _render_to_file(draw, figsize, filepath, dpi, args)
+        else:
+            pool.submit(_render_to_file, draw, figsize, filepath, dpi, args).result()
+    finally:
+        with _chart_pool_lock:
+            _charts_in_flight -= 1
+
+    logger.info("Saved chart to %s", filepath)
+    return str(filepath)
+
+
+# ---------------------------------------------------------------------------
+# Chart drawing
+# ---------------------------------------------------------------------------
+#
+# Each _draw_* function fills a blank pooled figure.  They are module-level
+# and take only plain data so they can also run in a worker process.
+
+
+def _draw_line(
+    fig: Figure,
+    ax: Axes,
+    title: str,
+    x_data: list,
+    y_series: dict[str, list],
+    x_label: str,
+    y_label: str,
+) -> None:
+    """Plot each series in *y_series* against *x_data* on *ax*."""
+    for name, y_values in y_series.items():
+        ax.plot(x_data, y_values, label=name, linewidth=2, marker="o", markersize=3)
+
+    ax.set_title(title, fontweight="bold")
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+
+    if len(y_series) > 1:
+        ax.legend(loc="best")
+
+    # Rotate x-axis labels if there are many data points.
+    if len(x_data) > 10:
+        for tick_label in ax.get_xticklabels():
+            tick_label.set_rotation(45)
+            tick_label.set_horizontalalignment("right")
+
+
+def _draw_bar(
+    fig: Figure,
+    ax: Axes,
+    title: str,
+    categories: list[str],
+    values: dict[str, list[float]],
+    x_label: str,
+    y_label: str,
+) -> None:
+    """Draw one group of bars per category, one bar per series, on *ax*."""
+    n_series = len(values)
+    n_categories = len(categories)
+    x = np.arange(n_categories)
+    bar_width = 0.8 / max(n_series, 1)
+
+    # One broadcast for every series' offset, and contiguous float rows so
+    # matplotlib does not convert each list itself.
+    offsets = (np.arange(n_series, dtype=float) - n_series / 2 + 0.5) * bar_width
+    data = np.asarray(list(values.values()), dtype=float)
+    for name, offset, row in zip(values, offsets, data, strict=True):
+        ax.bar(x + offset, row, bar_width, label=name)
+
+    ax.set_title(title, fontweight="bold")
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories, rotation=45 if n_categories > 6 else 0, ha="right")
+
+    if n_series > 1:
+        ax.legend(loc="best")
+
+
+def _draw_waterfall(
+    fig: Figure,
+    ax: Axes,
+    title: str,
+    categories: list[str],
+    values: list[float],
+) -> None:
+    """Draw a waterfall bridge whose last bar is the net total on *ax*."""
+    bottoms, heights, rising = _waterfall_layout(values)
+    running = float(heights[-1])
+    colors = [*np.where(rising, "#2ca02c", "#d62728").tolist(), "#1f77b4"]
+
+    x = np.arange(len(values))
+    ax.bar(x, heights, bottom=bottoms, color=colors, edgecolor="white", linewidth=0.5)
+
+    # Add value labels on each bar.
+    labels = [f"{v:+,.0f}" for v in values[:-1]] + [f"{running:,.0f}"]
+    for i, (y_pos, label) in enumerate(zip(bottoms + heights / 2, labels, strict=True)):
+        ax.text(i, y_pos, label, ha="center", va="center", fontsize=9, fontweight="bold")
+
+    ax.set_title(title, fontweight="bold")
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories, rotation=45, ha="right")
+    ax.axhline(y=0, color="black", linewidth=0.8)
+
+
+def _draw_scatter(
+    fig: Figure,
+    ax: Axes,
+    title: str,
+    x_data: list[float],
+    y_data: list[float],
+    labels: list[str] | None,
+    x_label: str,
+    y_label: str,
+) -> None:
+    """Draw a scatter of *x_data* against *y_data*, optionally labelled, on *ax*."""
+    ax.scatter(x_data, y_data, s=60, alpha=0.7, edgecolors="white", linewidth=0.5)
+
+    if labels:
+        for i, label in enumerate(labels):
+            if i < len(x_data) and i < len(y_data):
+                ax.annotate(
+                    label,
+                    (x_data[i], y_data[i]),
+                    textcoords="offset points",
+                    xytext=(5, 5),
+                    fontsize=8,
+                )
+
+    ax.set_title(title, fontweight="bold")
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+
+
+def _draw_heatmap(
+    fig: Figure,
+    ax: Axes,
+    title: str,
+    data: list[list[float]],
+    row_labels: list[str],
+    col_labels: list[str],
+) -> None:
+    """Draw an annotated heatmap of *data* with a colorbar on *fig*."""
+    arr = np.array(data, dtype=float)
+    im = ax.imshow(arr, cmap="RdYlBu", aspect="auto")
+
+    ax.set_xticks(np.arange(len(col_labels)))
+    ax.set_yticks(np.arange(len(row_labels)))
+    ax.set_xticklabels(col_labels, rotation=45, ha="right")
+    ax.set_yticklabels(row_labels)
+
+    # Annotate each labelled cell with its value, using white text on dark
+    # (far-from-mean) cells and black on light ones.
+    n_rows = min(len(row_labels), arr.shape[0])
+    n_cols = min(len(col_labels), arr.shape[1])
+    cells = arr[:n_rows, :n_cols]
+    dark = _heatmap_dark_cells(arr, cells)
+    for (i, j), val in np.ndenumerate(cells):
+        ax.text(
+            j, i, f"{val:.2f}",
+            ha="center", va="center", fontsize=9, color="white" if dark[i, j] else "black",
+        )
+
+    ax.set_title(title, fontweight="bold")
+    fig.colorbar(im, ax=ax, shrink=0.8)
 
 
 # ---------------------------------------------------------------------------
@@ -79,6 +414,7 @@ def chart_line(
     x_label: str = "",
     y_label: str = "",
     filename: str | None = None,
+    dpi: int = CHART_DPI,
 ) -> str:
     """Create a line chart with one or more data series.
 
@@ -90,28 +426,13 @@ def chart_line(
         x_label: Label for the x-axis.
         y_label: Label for the y-axis.
         filename: Optional output filename.
+        dpi: Output resolution.  The default suits on-screen documents;
+            use 200 or more for print-quality images.
 
     Returns:
         Absolute path to the saved PNG image.
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    for name, y_values in y_series.items():
-        ax.plot(x_data, y_values, label=name, linewidth=2, marker="o", markersize=3)
-
-    ax.set_title(title, fontweight="bold")
-    ax.set_xlabel(x_label)
-    ax.set_ylabel(y_label)
-
-    if len(y_series) > 1:
-        ax.legend(loc="best")
-
-    # Rotate x-axis labels if there are many data points.
-    if len(x_data) > 10:
-        plt.xticks(rotation=45, ha="right")
-
-    fig.tight_layout()
-    return _save_chart(fig, filename)
+    return _render(_draw_line, (12, 6), filename, dpi, title, x_data, y_series, x_label, y_label)
 
 
 def chart_bar(
@@ -121,6 +442,7 @@ def chart_bar(
     x_label: str = "",
     y_label: str = "",
     filename: str | None = None,
+    dpi: int = CHART_DPI,
 ) -> str:
     """Create a bar chart with grouped bars for multiple series.
 
@@ -132,32 +454,13 @@ def chart_bar(
         x_label: Label for the x-axis.
         y_label: Label for the y-axis.
         filename: Optional output filename.
+        dpi: Output resolution.  The default suits on-screen documents;
+            use 200 or more for print-quality images.
 
     Returns:
         Absolute path to the saved PNG image.
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    n_series = len(values)
-    n_categories = len(categories)
-    x = np.arange(n_categories)
-    bar_width = 0.8 / max(n_series, 1)
-
-    for i, (name, vals) in enumerate(values.items()):
-        offset = (i - n_series / 2 + 0.5) * bar_width
-        ax.bar(x + offset, vals, bar_width, label=name)
-
-    ax.set_title(title, fontweight="bold")
-    ax.set_xlabel(x_label)
-    ax.set_ylabel(y_label)
-    ax.set_xticks(x)
-    ax.set_xticklabels(categories, rotation=45 if n_categories > 6 else 0, ha="right")
-
-    if n_series > 1:
-        ax.legend(loc="best")
-
-    fig.tight_layout()
-    return _save_chart(fig, filename)
+    return _render(_draw_bar, (12, 6), filename, dpi, title, categories, values, x_label, y_label)
 
 
 def chart_waterfall(
@@ -165,6 +468,7 @@ def chart_waterfall(
     categories: list[str],
     values: list[float],
     filename: str | None = None,
+    dpi: int = CHART_DPI,
 ) -> str:
     """Create a waterfall chart (revenue bridge, EPS bridge, etc.).
 
@@ -178,45 +482,13 @@ def chart_waterfall(
         values: Numerical values for each step.  The last value is
             treated as the total.
         filename: Optional output filename.
+        dpi: Output resolution.  The default suits on-screen documents;
+            use 200 or more for print-quality images.
 
     Returns:
         Absolute path to the saved PNG image.
     """
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    n = len(values)
-    cumulative = [0.0] * n
-    bottoms = [0.0] * n
-    colors = []
-
-    running = 0.0
-    for i in range(n - 1):
-        bottoms[i] = running if values[i] >= 0 else running + values[i]
-        cumulative[i] = abs(values[i])
-        colors.append("#2ca02c" if values[i] >= 0 else "#d62728")
-        running += values[i]
-
-    # The last bar is the total, drawn from zero.
-    bottoms[-1] = 0.0
-    cumulative[-1] = running
-    colors.append("#1f77b4")
-
-    x = np.arange(n)
-    ax.bar(x, cumulative, bottom=bottoms, color=colors, edgecolor="white", linewidth=0.5)
-
-    # Add value labels on each bar.
-    for i in range(n):
-        y_pos = bottoms[i] + cumulative[i] / 2
-        label = f"{values[i]:+,.0f}" if i < n - 1 else f"{running:,.0f}"
-        ax.text(i, y_pos, label, ha="center", va="center", fontsize=9, fontweight="bold")
-
-    ax.set_title(title, fontweight="bold")
-    ax.set_xticks(x)
-    ax.set_xticklabels(categories, rotation=45, ha="right")
-    ax.axhline(y=0, color="black", linewidth=0.8)
-
-    fig.tight_layout()
-    return _save_chart(fig, filename)
+    return _render(_draw_waterfall, (12, 6), filename, dpi, title, categories, values)
 
 
 def chart_scatter(
@@ -227,6 +499,7 @@ def chart_scatter(
     x_label: str = "",
     y_label: str = "",
     filename: str | None = None,
+    dpi: int = CHART_DPI,
 ) -> str:
     """Create a scatter plot.
 
@@ -241,31 +514,15 @@ def chart_scatter(
         x_label: Label for the x-axis.
         y_label: Label for the y-axis.
         filename: Optional output filename.
+        dpi: Output resolution.  The default suits on-screen documents;
+            use 200 or more for print-quality images.
 
     Returns:
         Absolute path to the saved PNG image.
     """
-    fig, ax = plt.subplots(figsize=(10, 8))
-
-    ax.scatter(x_data, y_data, s=60, alpha=0.7, edgecolors="white", linewidth=0.5)
-
-    if labels:
-        for i, label in enumerate(labels):
-            if i < len(x_data) and i < len(y_data):
-                ax.annotate(
-                    label,
-                    (x_data[i], y_data[i]),
-                    textcoords="offset points",
-                    xytext=(5, 5),
-                    fontsize=8,
-                )
-
-    ax.set_title(title, fontweight="bold")
-    ax.set_xlabel(x_label)
-    ax.set_ylabel(y_label)
-
-    fig.tight_layout()
-    return _save_chart(fig, filename)
+    return _render(
+        _draw_scatter, (10, 8), filename, dpi, title, x_data, y_data, labels, x_label, y_label
+    )
 
 
 def chart_heatmap(
@@ -274,6 +531,7 @@ def chart_heatmap(
     row_labels: list[str],
     col_labels: list[str],
     filename: str | None = None,
+    dpi: int = CHART_DPI,
 ) -> str:
     """Create a heatmap for sensitivity tables or correlation matrices.
 
@@ -286,37 +544,14 @@ def chart_heatmap(
         row_labels: Labels for each row.
         col_labels: Labels for each column.
         filename: Optional output filename.
+        dpi: Output resolution.  The default suits on-screen documents;
+            use 200 or more for print-quality images.
 
     Returns:
         Absolute path to the saved PNG image.
     """
-    fig, ax = plt.subplots(figsize=(max(8, len(col_labels) * 1.2), max(6, len(row_labels) * 0.8)))
-
-    arr = np.array(data, dtype=float)
-    im = ax.imshow(arr, cmap="RdYlBu", aspect="auto")
-
-    ax.set_xticks(np.arange(len(col_labels)))
-    ax.set_yticks(np.arange(len(row_labels)))
-    ax.set_xticklabels(col_labels, rotation=45, ha="right")
-    ax.set_yticklabels(row_labels)
-
-    # Annotate each cell with its value.
-    for i in range(len(row_labels)):
-        for j in range(len(col_labels)):
-            if i < arr.shape[0] and j < arr.shape[1]:
-                val = arr[i, j]
-                # Use white text on dark cells, black on light cells.
-                text_color = "white" if abs(val - arr.mean()) > arr.std() else "black"
-                ax.text(
-                    j, i, f"{val:.2f}",
-                    ha="center", va="center", fontsize=9, color=text_color,
-                )
-
-    ax.set_title(title, fontweight="bold")
-    fig.colorbar(im, ax=ax, shrink=0.8)
-
-    fig.tight_layout()
-    return _save_chart(fig, filename)
+    figsize = (max(8, len(col_labels) * 1.2), max(6, len(row_labels) * 0.8))
+    return _render(_draw_heatmap, figsize, filename, dpi, title, data, row_labels, col_labels)
 
 
 # ---------------------------------------------------------------------------
@@ -324,6 +559,7 @@ def chart_heatmap(
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all chart tools."""
     return [
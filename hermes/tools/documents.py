@@ -1,41 +1,419 @@
 """Document generation tools for creating Word reports and exporting to PDF.
 
 Built on python-docx for Word documents.  PDF export uses LibreOffice headless
-CLI for best fidelity -- it renders the .docx exactly as Word would, including
-tables, images, and page breaks.
+for best fidelity -- it renders the .docx exactly as Word would, including
+tables, images, and page breaks -- via a persistent conversion server when
+unoserver is installed (see :mod:`hermes.tools._libreoffice`), else the CLI.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
 import logging
+import os
+import re
+import shutil
 import subprocess
+import tempfile
+import threading
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, Any, cast
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
+import numpy as np
 from docx import Document
+from docx.document import Document as DocxDocument
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches
+from docx.opc.packuri import PackURI
+from docx.opc.phys_pkg import PhysPkgWriter
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu, Inches
+from docx.table import Table
 from llama_index.core.tools import FunctionTool
+from lxml import etree  # type: ignore[import-untyped]
+from PIL import Image, ImageOps
 
 from hermes.config import get_config
+from hermes.tools import _libreoffice
+from hermes.tools._base import shared_tools
 
 logger = logging.getLogger(__name__)
 
+# Clark-notation WordprocessingML tags, so XML walks compare plain strings
+# instead of resolving prefixes per element.
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = _W + "p"
+_W_R, _W_RPR, _W_B, _W_T = _W + "r", _W + "rPr", _W + "b", _W + "t"
+_W_TBL, _W_TR, _W_TC, _W_TCPR = _W + "tbl", _W + "tr", _W + "tc", _W + "tcPr"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Characters python-docx turns into <w:tab/> / <w:br/> rather than <w:t> text.
+_RUN_BREAK_CHARS = re.compile(r"[\t\n\r]")
+_RUN_BREAK_SPLIT = re.compile(r"([\t\n\r])")
+
+
+#: Images wider than this many pixels per inch of display width are
+#: downsampled before embedding (with 20 % slack, to skip marginal resizes).
+IMAGE_EMBED_DPI: int = 150
+
+# EXIF tag holding the camera orientation of a photo.
+_EXIF_ORIENTATION = 0x0112
+
+
+@functools.lru_cache(maxsize=64)
+def _prepared_image(path: str, mtime_ns: int, target_px: int) -> bytes:
+    """Return the bytes to embed for *path*, re-encoded at most *target_px* wide.
+
+    Keyed on the file's modification time so an overwritten chart is read
+    again, while the same chart embedded in several documents is read,
+    decoded and resampled only once.  Images already small enough, and files
+    Pillow cannot read or refuses to decode as decompression bombs, are
+    returned unchanged for python-docx to handle.  Re-encoded images are
+    rotated upright first, since their EXIF orientation tag is not kept.
+    """
+    blob = Path(path).read_bytes()
+    try:
+        with Image.open(io.BytesIO(blob)) as im:
+            # Orientations 5-8 turn the image a quarter, swapping its sides.
+            rotated = im.getexif().get(_EXIF_ORIENTATION, 1) in (5, 6, 7, 8)
+            if (im.height if rotated else im.width) <= target_px * 1.2:
+                return blob
+            fmt = "JPEG" if im.format == "JPEG" else "PNG"
+            upright = ImageOps.exif_transpose(im)
+            upright.thumbnail((target_px, upright.height), Image.Resampling.LANCZOS)
+            buf = io.BytesIO()
+            upright.save(buf, format=fmt, optimize=True)
+    except (OSError, Image.DecompressionBombError, Image.DecompressionBombWarning):
+        return blob
+    logger.debug("Downsampled %s to %d px wide for embedding", path, target_px)
+    return buf.getvalue()
+
+
+# Package parts whose payload is already compressed.  Deflating them again
+# costs CPU for no size gain, so they are stored as is; XML parts are still
+# deflated.
+_STORED_PART_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif"})
+
+# Every entry gets this timestamp instead of the time of the save, so an
+# unchanged document always serialises to the same bytes and its PDF export
+# is served from the cache.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class _DocxZipWriter:
+    """Zip writer for python-docx's ``PackageWriter`` that picks compression per part."""
+
+    def __init__(self, target: Path | IO[bytes], *, compress: bool = True) -> None:
+        self._zipf = ZipFile(target, "w", compression=ZIP_DEFLATED)
+        self._compress = compress
+
+    def close(self) -> None:
+        self._zipf.close()
+
+    def write(self, pack_uri: PackURI, blob: bytes) -> None:
+        compress_type = (
+            ZIP_DEFLATED
+            if self._compress and pack_uri.ext.lower() not in _STORED_PART_EXTENSIONS
+            else ZIP_STORED
+        )
+        info = ZipInfo(pack_uri.membername, date_time=_ZIP_DATE_TIME)
+        info.compress_type = compress_type
+        self._zipf.writestr(info, blob)
+
+
+def _save_docx(doc: DocxDocument, target: Path | IO[bytes], *, compress: bool = True) -> None:
+    """Save *doc* to *target* like ``Document.save``, without re-deflating images.
+
+    With ``compress=False`` every part is stored uncompressed, which suits
+    scratch files that are only read back by this process.
+
+    This drives ``PackageWriter``'s private ``_write_*`` helpers with
+    :class:`_DocxZipWriter` in place of python-docx's zip writer, which is why
+    python-docx is pinned below its next minor release.
+    """
+    package = doc.part.package
+    parts = package.parts
+    for part in parts:
+        part.before_marshal()
+    writer = _DocxZipWriter(target, compress=compress)
+    phys_writer = cast(PhysPkgWriter, writer)  # Same write(pack_uri, blob) interface.
+    try:
+        PackageWriter._write_content_types_stream(phys_writer, parts)
+        PackageWriter._write_pkg_rels(phys_writer, package.rels)
+        PackageWriter._write_parts(phys_writer, parts)
+    finally:
+        writer.close()
+
+
+# Evaluated inside libxml2 and returning plain strings, so no Python proxy
+# is created per <w:t> element.
+_W_T_TEXTS = etree.XPath(
+    ".//w:t/text()", namespaces={"w": _W[1:-1]}, smart_strings=False
+)
+
+
+# A paragraph's style ID, or "" when it has none, in one libxml2 call rather
+# than two find()s and a get().
+_W_PSTYLE_VAL = etree.XPath(
+    "string(w:pPr/w:pStyle/@w:val)", namespaces={"w": _W[1:-1]}, smart_strings=False
+)
+
+
+def _text_of(element: Any) -> str:
+    """Concatenate the ``<w:t>`` text anywhere under *element*, in document order."""
+    return "".join(_W_T_TEXTS(element))
+
+
+def _escape_text(text: str) -> str:
+    """Escape ``&``, ``<`` and ``>`` for XML element content.
+
+    Most table cells contain none of them, so the string is returned as is
+    after three C-level membership tests; otherwise chained ``str.replace``
+    beats both ``saxutils.escape`` and ``str.translate`` on short text.
+    """
+    if "&" in text or "<" in text or ">" in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text
+
+
+def _run_xml(text: str, rpr: str = "") -> str:
+    """Return a ``<w:r>`` for *text*, with tabs and line breaks as python-docx writes them."""
+    if "\t" not in text and "\n" not in text and "\r" not in text:
+        # Nearly every table cell: at most one <w:t>, with no regex split.
+        return f"<w:r>{rpr}{_t_xml(text) if text else ''}</w:r>"
+    content = []
+    for piece in _RUN_BREAK_SPLIT.split(text):
+        if piece == "\t":
+            content.append("<w:tab/>")
+        elif piece in ("\n", "\r"):
+            content.append("<w:br/>")
+        elif piece:
+            content.append(_t_xml(piece))
+    return f"<w:r>{rpr}{''.join(content)}</w:r>"
+
+
+def _t_xml(text: str) -> str:
+    """Return a ``<w:t>`` for non-empty *text*, preserving edge whitespace."""
+    space = ' xml:space="preserve"' if text[0].isspace() or text[-1].isspace() else ""
+    return f"<w:t{space}>{_escape_text(text)}</w:t>"
+
+
+def _tbl_xml(headers: list, rows: list[list], col_twips: int) -> str:
+    """Return the XML for a filled ``<w:tbl>`` stretched to the full text width.
+
+    Mirrors python-docx's ``add_table`` markup, with a bold header row and a
+    fixed layout, so Word and LibreOffice take the column widths from the
+    grid instead of re-measuring every cell's content.  Data values beyond
+    the header columns are dropped and short rows are padded.
+    """
+    n_cols = len(headers)
+    tc_open = f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_twips}"/></w:tcPr><w:p>'
+
+    def tr_xml(values: list, rpr: str = "") -> str:
+        tcs = [f"{tc_open}{_run_xml(str(v), rpr)}</w:p></w:tc>" for v in values[:n_cols]]
+        tcs.extend([f"{tc_open}</w:p></w:tc>"] * (n_cols - len(tcs)))
+        return f"<w:tr>{''.join(tcs)}</w:tr>"
+
+    return "".join([
+        f"<w:tbl {nsdecls('w')}><w:tblPr>",
+        # 5000 fiftieths of a percent = 100 % of the page text-width.
+        '<w:tblW w:type="pct" w:w="5000"/>',
+        '<w:tblLayout w:type="fixed"/>',
+        '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+        ' w:noHBand="0" w:noVBand="1" w:val="04A0"/>',
+        "</w:tblPr><w:tblGrid>",
+        f'<w:gridCol w:w="{col_twips}"/>' * n_cols,
+        "</w:tblGrid>",
+        tr_xml(headers, "<w:rPr><w:b/></w:rPr>"),
+        *map(tr_xml, rows),
+        "</w:tbl>",
+    ])
+
+
+def _set_tc_text(tc: Any, text: str, *, bold: bool = False) -> None:
+    """Replace the content of table cell *tc* with one run of *text*.
+
+    Equivalent to python-docx's ``cell.text = text``, but writes the XML
+    directly: going through ``Table.rows``/``Row.cells`` re-resolves the
+    table grid on every access, which is quadratic when filling a table.
+    """
+    for child in list(tc):
+        if child.tag != _W_TCPR:
+            tc.remove(child)
+    p = etree.SubElement(tc, _W_P)
+    r = etree.SubElement(p, _W_R)
+    if bold:
+        etree.SubElement(etree.SubElement(r, _W_RPR), _W_B)
+    if _RUN_BREAK_CHARS.search(text):
+        # Tabs and line breaks need w:tab / w:br, which CT_R's setter emits.
+        r.text = text
+        return
+    t = etree.SubElement(r, _W_T)
+    t.text = text
+    if text[:1].isspace() or text[-1:].isspace():
+        t.set(_XML_SPACE, "preserve")
+
+
+def _append_table(doc: DocxDocument, headers: list, rows: list[list]) -> Table:
+    """Append a filled table with a bold header row to the end of *doc*'s body.
+
+    The whole table is built as one XML string and parsed once, rather than
+    created empty by ``add_table()`` and then filled cell by cell.  That needs
+    python-docx's private ``_block_width`` and ``CT_Body._insert_tbl``; if a
+    python-docx release drops them, the table is built with the public API.
+    """
+    n_cols = len(headers)
+    try:
+        block_width = doc._block_width
+        insert_tbl = doc.element.body._insert_tbl
+    except AttributeError:
+        logger.debug("python-docx internals unavailable; filling table cell by cell")
+        table = doc.add_table(rows=1 + len(rows), cols=n_cols)
+        table.autofit = False
+        for row, values in zip(table.rows, [headers, *rows], strict=True):
+            for cell, value in zip(row.cells, values, strict=False):
+                cell.text = str(value)
+        for cell in table.rows[0].cells:
+            for run in cell.paragraphs[0].runs:
+                run.bold = True
+        return table
+
+    col_twips = Emu(block_width // n_cols).twips if n_cols else 0
+    insert_tbl(parse_xml(_tbl_xml(headers, rows, col_twips)))  # Before the final sectPr.
+    return doc.tables[-1]
+
+
 # ---------------------------------------------------------------------------
-# In-memory document store
+# Document store
 # ---------------------------------------------------------------------------
 
-# Maps document IDs to python-docx Document objects.
-_documents: dict[str, Document] = {}
-
+class _DocumentStore:
+    """Maps document IDs to python-docx Documents with bounded memory.
+
+    At most *max_open* documents -- by default the ``max_open_documents``
+    config setting -- stay in memory.  When another is added, the least
+    recently used one is saved to a scratch ``.docx`` under the
+    configured cache directory and transparently reloaded on its next access,
+    so a long session's memory no longer grows with every report it opens.
+    Scratch files live in a per-store temporary directory that is removed by
+    :meth:`clear`, when the store is collected, or at interpreter exit.
+
+    LlamaIndex runs sync tools on executor threads, so one tool may be editing
+    a document while another opens a new one.  Tools therefore hold documents
+    through :meth:`use`, which pins them in memory: a pinned document is never
+    spilled, and the store briefly exceeds *max_open* instead.
+    """
 
-def _get_document(doc_id: str) -> Document:
-    """Retrieve an open document or raise a clear error."""
+    def __init__(self, max_open: int | None = None) -> None:
+        self._max_open = max_open
+        self._open: OrderedDict[str, DocxDocument] = OrderedDict()
+        self._spilled: dict[str, Path] = {}
+        self._scratch: tempfile.TemporaryDirectory[str] | None = None
+        self._pins: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._open or doc_id in self._spilled
+
+    def __getitem__(self, doc_id: str) -> DocxDocument:
+        with self._lock:
+            return self._get(doc_id)
+
+    @contextlib.contextmanager
+    def use(self, doc_id: str) -> Iterator[DocxDocument]:
+        """Yield *doc_id*'s document, pinned in memory until the block exits.
+
+        Raises:
+            KeyError: If *doc_id* is unknown.
+        """
+        with self._lock:
+            doc = self._get(doc_id)
+            self._pins[doc_id] = self._pins.get(doc_id, 0) + 1
+        try:
+            yield doc
+        finally:
+            with self._lock:
+                self._pins[doc_id] -= 1
+                if not self._pins[doc_id]:
+                    del self._pins[doc_id]
+
+    def __setitem__(self, doc_id: str, doc: DocxDocument) -> None:
+        with self._lock:
+            stale = self._spilled.pop(doc_id, None)
+            if stale is not None:
+                stale.unlink(missing_ok=True)
+            self._insert(doc_id, doc)
+
+    def keys(self) -> list[str]:
+        """Return every document ID, in memory or spilled."""
+        return [*self._open, *self._spilled]
+
+    def clear(self) -> None:
+        """Forget every document and delete its scratch file."""
+        with self._lock:
+            if self._scratch is not None:
+                self._scratch.cleanup()
+                self._scratch = None
+            self._spilled.clear()
+            self._open.clear()
+
+    def _get(self, doc_id: str) -> DocxDocument:
+        """Return *doc_id*'s document, reloading it if spilled.  Lock held."""
+        doc = self._open.get(doc_id)
+        if doc is not None:
+            self._open.move_to_end(doc_id)
+            return doc
+        path = self._spilled.pop(doc_id)  # KeyError if unknown.
+        doc = Document(str(path))
+        path.unlink(missing_ok=True)
+        logger.debug("Reloaded document %s from %s", doc_id, path)
+        self._insert(doc_id, doc)
+        return doc
+
+    def _insert(self, doc_id: str, doc: DocxDocument) -> None:
+        """Add *doc* as most recently used, spilling the overflow.  Lock held."""
+        self._open[doc_id] = doc
+        self._open.move_to_end(doc_id)
+        cfg = get_config()
+        max_open = self._max_open if self._max_open is not None else cfg.max_open_documents
+        while len(self._open) > max(1, max_open):
+            # The least recently used document no tool is holding.
+            cold_id = next((k for k in self._open if k != doc_id and k not in self._pins), None)
+            if cold_id is None:
+                break  # Every other document is in use; spill on a later insert.
+            cold_doc = self._open.pop(cold_id)
+            if self._scratch is None:
+                base = Path(cfg.cache_dir).expanduser() / "documents"
+                base.mkdir(parents=True, exist_ok=True)
+                # Its finalizer deletes the directory at exit, so spills
+                # never outlive the process.
+                self._scratch = tempfile.TemporaryDirectory(dir=base)
+            path = Path(self._scratch.name) / f"{cold_id}.docx"
+            _save_docx(cold_doc, path, compress=False)
+            self._spilled[cold_id] = path
+            logger.debug("Spilled document %s to %s", cold_id, path)
+
+
+_documents = _DocumentStore()
+
+
+@contextlib.contextmanager
+def _use_document(doc_id: str) -> Iterator[DocxDocument]:
+    """Hold an open document for the duration of a tool call or raise a clear error."""
     if doc_id not in _documents:
-        raise ValueError(
-            f"Document '{doc_id}' not found.  Available: {list(_documents.keys())}"
-        )
-    return _documents[doc_id]
+        raise ValueError(f"Document '{doc_id}' not found.  Available: {_documents.keys()}")
+    with _documents.use(doc_id) as doc:
+        yield doc
 
 
 # ---------------------------------------------------------------------------
@@ -58,8 +436,6 @@ def list_output_files(pattern: str = "*") -> str:
         Newline-separated list of absolute file paths, or a message if the
         directory is empty or does not exist.
     """
-    from hermes.config import get_config
-
     output_dir = Path(get_config().output_dir)
     if not output_dir.exists():
         return f"Output directory does not exist: {output_dir}"
@@ -129,10 +505,10 @@ def doc_add_heading(doc_id: str, text: str, level: int = 1) -> str:
     Returns:
         Confirmation string.
     """
-    doc = _get_document(doc_id)
-    level = max(1, min(level, 4))
-    doc.add_heading(text, level=level)
-    return f"Added heading level {level}: '{text}'."
+    with _use_document(doc_id) as doc:
+        level = max(1, min(level, 4))
+        doc.add_heading(text, level=level)
+        return f"Added heading level {level}: '{text}'."
 
 
 def doc_add_paragraph(
@@ -155,14 +531,14 @@ def doc_add_paragraph(
     Returns:
         Confirmation string.
     """
-    doc = _get_document(doc_id)
-    p = doc.add_paragraph(style=style)
-    run = p.add_run(text)
-    if bold:
-        run.bold = True
-    if italic:
-        run.italic = True
-    return f"Added paragraph ({len(text)} chars)."
+    with _use_document(doc_id) as doc:
+        p = doc.add_paragraph(style=style)
+        run = p.add_run(text)
+        if bold:
+            run.bold = True
+        if italic:
+            run.italic = True
+        return f"Added paragraph ({len(text)} chars)."
 
 
 def doc_add_table(
@@ -191,50 +567,63 @@ def doc_add_table(
     Returns:
         Confirmation string with table dimensions.
     """
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
+    with _use_document(doc_id) as doc:
+        # Optional title paragraph — written before the table so order is guaranteed.
+        if title:
+            p = doc.add_paragraph()
+            run = p.add_run(title)
+            run.bold = True
 
-    doc = _get_document(doc_id)
+        n_cols = len(headers)
+        table = _append_table(doc, headers, rows)
 
-    # Optional title paragraph — written before the table so order is guaranteed.
-    if title:
-        p = doc.add_paragraph()
-        run = p.add_run(title)
-        run.bold = True
+        # Apply style -- fall back gracefully if the style name is invalid.
+        try:
+            table.style = style
+        except KeyError:
+            pass  # Default style is acceptable.
 
-    n_cols = len(headers)
-    n_rows = len(rows) + 1  # +1 for header
+        return f"Added {len(rows)}x{n_cols} table."
 
-    table = doc.add_table(rows=n_rows, cols=n_cols)
 
-    # Apply style -- fall back gracefully if the style name is invalid.
-    try:
-        table.style = style
-    except KeyError:
-        pass  # Default style is acceptable.
-
-    # Stretch table to 100 % of the page text-width so columns never overflow.
-    tblPr = table._tbl.tblPr
-    tblW = OxmlElement("w:tblW")
-    tblW.set(qn("w:w"), "5000")   # 5000 / 100 = 100 %
-    tblW.set(qn("w:type"), "pct")
-    tblPr.append(tblW)
-
-    # Write headers with bold formatting.
-    for col_idx, header in enumerate(headers):
-        cell = table.rows[0].cells[col_idx]
-        cell.text = header
-        for paragraph in cell.paragraphs:
-            for run in paragraph.runs:
-                run.bold = True
+def doc_add_table_bulk(
+    doc_id: str,
+    data: Any,
+    headers: list[str] | None = None,
+    title: str | None = None,
+    style: str = "Light Grid Accent 1",
+) -> str:
+    """Insert a table from a pandas DataFrame or 2-D NumPy array.
 
-    # Write data rows.
-    for row_idx, row_data in enumerate(rows):
-        for col_idx, value in enumerate(row_data):
-            if col_idx < n_cols:
-                table.rows[row_idx + 1].cells[col_idx].text = str(value)
+    The Python-side counterpart of :func:`doc_add_table` for callers that
+    already hold tabular data: every cell is converted to text in one
+    vectorised ``astype(str)`` rather than a ``str()`` call per value.  It is
+    not registered as an agent tool, since tool arguments arrive as JSON lists.
 
-    return f"Added {len(rows)}x{n_cols} table."
+    Args:
+        doc_id: Document ID.
+        data: DataFrame, or any two-dimensional array-like of cell values.
+        headers: Column header labels.  Defaults to the DataFrame's columns.
+        title: Optional bold paragraph inserted directly above the table.
+        style: Word table style name.
+
+    Returns:
+        Confirmation string with table dimensions.
+
+    Raises:
+        ValueError: If *data* is not two-dimensional, or *headers* is
+            omitted for data without column labels.
+    """
+    columns = getattr(data, "columns", None)
+    if headers is None:
+        if columns is None:
+            raise ValueError("headers are required when data has no column labels.")
+        headers = [str(c) for c in columns]
+
+    cells = np.asarray(data.to_numpy() if columns is not None else data)
+    if cells.ndim != 2:
+        raise ValueError(f"data must be two-dimensional, got {cells.ndim} dimension(s).")
+    return doc_add_table(doc_id, headers, cells.astype(str).tolist(), title, style)
 
 
 def doc_add_image(
@@ -255,13 +644,23 @@ def doc_add_image(
     Returns:
         Confirmation string.
     """
-    doc = _get_document(doc_id)
-    image_path_obj = Path(image_path)
-    if not image_path_obj.exists():
-        raise FileNotFoundError(f"Image not found: {image_path}")
-
-    doc.add_picture(str(image_path_obj), width=Inches(width_inches))
-    return f"Added image '{image_path_obj.name}' ({width_inches}\" wide)."
+    with _use_document(doc_id) as doc:
+        # One stat both checks existence and keys the cache; the file itself is
+        # opened only on a cache miss.
+        try:
+            mtime_ns = os.stat(image_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image not found: {image_path}") from None
+
+        # Oversized sources (e.g. 3000 px screenshots) bloat the .docx and slow
+        # PDF export, so embed a copy sized for the display width instead.
+        blob = _prepared_image(
+            os.path.abspath(image_path), mtime_ns, int(width_inches * IMAGE_EMBED_DPI)
+        )
+        # python-docx keys image parts by SHA-1 and reuses the relationship, so
+        # a chart embedded on several pages is stored in the package only once.
+        doc.add_picture(io.BytesIO(blob), width=Inches(width_inches))
+        return f"Added image '{Path(image_path).name}' ({width_inches}\" wide)."
 
 
 def doc_add_page_break(doc_id: str) -> str:
@@ -273,9 +672,9 @@ def doc_add_page_break(doc_id: str) -> str:
     Returns:
         Confirmation string.
     """
-    doc = _get_document(doc_id)
-    doc.add_page_break()
-    return "Page break inserted."
+    with _use_document(doc_id) as doc:
+        doc.add_page_break()
+        return "Page break inserted."
 
 
 def doc_save(doc_id: str, filename: str | None = None) -> str:
@@ -292,55 +691,88 @@ def doc_save(doc_id: str, filename: str | None = None) -> str:
     Returns:
         Absolute path to the saved file.
     """
-    doc = _get_document(doc_id)
-    cfg = get_config()
+    with _use_document(doc_id) as doc:
+        filepath = _docx_output_path(doc_id, filename)
+        _save_docx(doc, filepath)
+        logger.info("Saved document to %s", filepath.resolve())
+        return str(filepath.resolve())
 
-    output_dir = Path(cfg.output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
 
-    if filename is None:
-        filename = f"{doc_id}.docx"
-    if not filename.endswith(".docx"):
-        filename += ".docx"
+async def doc_save_async(doc_id: str, filename: str | None = None) -> str:
+    """Save the document as a ``.docx`` file without blocking the event loop on disk I/O.
+
+    The document is serialised in memory on the calling thread, so later
+    edits cannot race the save, and the file write runs in a worker thread.
 
-    filepath = output_dir / filename
-    doc.save(str(filepath))
+    Args:
+        doc_id: Document ID.
+        filename: Optional filename (without path).  Defaults to
+            ``"{doc_id}.docx"``.
+
+    Returns:
+        Absolute path to the saved file.
+    """
+    with _use_document(doc_id) as doc:
+        filepath = _docx_output_path(doc_id, filename)
+        buf = io.BytesIO()
+        _save_docx(doc, buf)
+    await asyncio.to_thread(filepath.write_bytes, buf.getvalue())
     logger.info("Saved document to %s", filepath.resolve())
     return str(filepath.resolve())
 
 
-def doc_export_pdf(
-    docx_path: str,
-    output_dir: str | None = None,
-) -> str:
-    """Convert a ``.docx`` file to PDF using LibreOffice headless.
+def _docx_output_path(doc_id: str, filename: str | None) -> Path:
+    """Return the output-directory path ``doc_save`` writes *doc_id* to."""
+    output_dir = Path(get_config().output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    LibreOffice must be installed on the system (``libreoffice`` or
-    ``soffice`` in PATH).  This produces the highest-fidelity conversion
-    available without Microsoft Word.
+    if filename is None:
+        filename = f"{doc_id}.docx"
+    if not filename.endswith(".docx"):
+        filename += ".docx"
+    return output_dir / filename
 
-    Args:
-        docx_path: Path to the ``.docx`` file to convert.
-        output_dir: Optional output directory for the PDF.  Defaults to
-            the same directory as the input file.
 
-    Returns:
-        Absolute path to the generated PDF file.
+def _copy_replace(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst* through a temporary sibling, so *dst* is never half-written.
 
-    Raises:
-        FileNotFoundError: If the docx file does not exist.
-        RuntimeError: If LibreOffice is not installed or conversion fails.
+    Copying (rather than hard-linking) keeps exported PDFs and cache entries on
+    separate inodes: editing one can never corrupt the other.
     """
-    docx_file = Path(docx_path)
-    if not docx_file.exists():
-        raise FileNotFoundError(f"File not found: {docx_path}")
-
-    if output_dir is None:
-        target_dir = docx_file.parent
-    else:
-        target_dir = Path(output_dir)
-        target_dir.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _trim_pdf_cache(cache_dir: Path, max_bytes: int) -> None:
+    """Delete the least recently used cached PDFs until the cache fits *max_bytes*."""
+    entries = []
+    for path in cache_dir.glob("*.pdf"):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue  # Evicted concurrently.
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        logger.debug("Evicted %s from the PDF cache", path.name)
+
+
+def _run_libreoffice(
+    docx_files: list[Path], target_dir: Path
+) -> subprocess.CompletedProcess[str]:
+    """Convert *docx_files* to PDF in *target_dir* with one headless LibreOffice run.
 
+    Raises:
+        RuntimeError: If LibreOffice is not installed or exits with an error.
+    """
     try:
         result = subprocess.run(
             [
@@ -348,11 +780,12 @@ def doc_export_pdf(
                 "--headless",
                 "--convert-to", "pdf",
                 "--outdir", str(target_dir),
-                str(docx_file),
+                *map(str, docx_files),
             ],
             capture_output=True,
             text=True,
-            timeout=120,
+            # Start-up is paid once per run, so each extra document adds less.
+            timeout=120 + 30 * (len(docx_files) - 1),
         )
     except FileNotFoundError:
         raise RuntimeError(
@@ -366,16 +799,173 @@ def doc_export_pdf(
             f"LibreOffice conversion failed (exit {result.returncode}): "
             f"{result.stderr.strip()}"
         )
+    return result
 
-    pdf_path = target_dir / docx_file.with_suffix(".pdf").name
-    logger.info("Exporting PDF: %s", pdf_path)
-    if not pdf_path.exists():
-        raise RuntimeError(
-            f"Conversion appeared to succeed but PDF not found at {pdf_path}. "
-            f"LibreOffice stdout: {result.stdout.strip()}"
-        )
 
-    return str(pdf_path.resolve())
+def doc_export_pdf(
+    docx_path: str,
+    output_dir: str | None = None,
+) -> str:
+    """Convert a ``.docx`` file to PDF using LibreOffice headless.
+
+    LibreOffice must be installed on the system (``libreoffice`` or
+    ``soffice`` in PATH).  This produces the highest-fidelity conversion
+    available without Microsoft Word.  If ``unoserver`` or LibreOffice's
+    ``uno`` Python bindings are also available, conversions go through one
+    persistent LibreOffice process instead of starting a new one each time.
+
+    Args:
+        docx_path: Path to the ``.docx`` file to convert.
+        output_dir: Optional output directory for the PDF.  Defaults to
+            the same directory as the input file.
+
+    Returns:
+        Absolute path to the generated PDF file.
+
+    Raises:
+        FileNotFoundError: If the docx file does not exist.
+        RuntimeError: If LibreOffice is not installed or conversion fails.
+    """
+    return doc_export_pdf_batch([docx_path], output_dir)[0]
+
+
+_pdf_pool: ThreadPoolExecutor | None = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_pdf_pool() -> ThreadPoolExecutor:
+    """Return the PDF export thread pool, creating it on first use."""
+    global _pdf_pool  # noqa: PLW0603
+
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ThreadPoolExecutor(
+                max_workers=max(1, get_config().pdf_export_workers),
+                thread_name_prefix="hermes-pdf",
+            )
+        return _pdf_pool
+
+
+async def doc_export_pdf_async(docx_path: str, output_dir: str | None = None) -> str:
+    """Convert a ``.docx`` file to PDF like :func:`doc_export_pdf`, off the event loop.
+
+    Every conversion path blocks (hashing for the cache, LibreOffice, the UNO
+    bridge), so the export runs on a dedicated thread pool sized by
+    ``pdf_export_workers``.  That overlaps exports with other tool calls
+    while bounding how many LibreOffice conversions run at once.
+
+    Args:
+        docx_path: Path to the ``.docx`` file to convert.
+        output_dir: Optional output directory for the PDF.  Defaults to
+            the same directory as the input file.
+
+    Returns:
+        Absolute path to the generated PDF file.
+
+    Raises:
+        FileNotFoundError: If the docx file does not exist.
+        RuntimeError: If LibreOffice is not installed or conversion fails.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_pdf_pool(), doc_export_pdf, docx_path, output_dir
+    )
+
+
+def doc_export_pdf_batch(
+    docx_paths: list[str],
+    output_dir: str | None = None,
+) -> list[str]:
+    """Convert several ``.docx`` files to PDF, sharing LibreOffice start-up.
+
+    Without ``unoserver``, each call to :func:`doc_export_pdf` starts
+    LibreOffice afresh.  Here the files are converted by a single LibreOffice
+    run per target directory.  With ``unoserver`` or the ``uno`` bindings
+    available, each file goes through the persistent LibreOffice process instead.
+
+    Args:
+        docx_paths: Paths to the ``.docx`` files to convert.
+        output_dir: Optional output directory for the PDFs.  Defaults to
+            the directory of each input file.
+
+    Returns:
+        Absolute paths to the generated PDF files, in input order.
+
+    Raises:
+        FileNotFoundError: If any docx file does not exist.
+        ValueError: If two different docx files would be exported to the same PDF.
+        RuntimeError: If LibreOffice is not installed or conversion fails.
+    """
+    docx_files = [Path(p) for p in docx_paths]
+    missing = [str(f) for f in docx_files if not f.exists()]
+    if missing:
+        raise FileNotFoundError(f"File not found: {', '.join(missing)}")
+
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    targets = [f.parent if output_dir is None else Path(output_dir) for f in docx_files]
+    pdf_paths = [t / f.with_suffix(".pdf").name for f, t in zip(docx_files, targets, strict=True)]
+
+    # An input listed twice is converted once and shares its PDF; distinct
+    # inputs that would write the same PDF are rejected before any conversion.
+    jobs: dict[Path, tuple[Path, Path, Path]] = {}
+    for docx_file, target_dir, pdf_path in zip(docx_files, targets, pdf_paths, strict=True):
+        key = pdf_path.resolve()
+        first = jobs.setdefault(key, (docx_file, target_dir, pdf_path))[0]
+        if first.resolve() != docx_file.resolve():
+            raise ValueError(f"{first} and {docx_file} would both be exported to {pdf_path}")
+
+    cfg = get_config()
+    cache_dir = Path(cfg.cache_dir).expanduser() / "pdf"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Identical .docx bytes always render to the same PDF, so re-exports of an
+    # unchanged document are served from the cache without LibreOffice.
+    cached = [
+        cache_dir / f"{hashlib.blake2b(f.read_bytes(), digest_size=16).hexdigest()}.pdf"
+        for f, _, _ in jobs.values()
+    ]
+
+    # One CLI run per target directory, since --outdir applies to every input.
+    # Conversions land in a staging directory beside the target and replace the
+    # previous PDF only once every conversion has succeeded.
+    pending: dict[Path, list[Path]] = {}
+    converted: list[tuple[Path, Path, Path]] = []
+    with contextlib.ExitStack() as stack:
+        staging: dict[Path, Path] = {}
+        for (docx_file, target_dir, pdf_path), entry in zip(jobs.values(), cached, strict=True):
+            if entry.exists():
+                _copy_replace(entry, pdf_path)
+                os.utime(entry)  # Mark as recently used for eviction.
+                logger.info("Exported %s from the PDF cache", docx_file.name)
+                continue
+            if target_dir not in staging:
+                staging[target_dir] = Path(
+                    stack.enter_context(
+                        tempfile.TemporaryDirectory(prefix=".hermes-pdf-", dir=target_dir)
+                    )
+                )
+            stage = staging[target_dir]
+            converted.append((stage / pdf_path.name, pdf_path, entry))
+            if _libreoffice.convert_to_pdf(docx_file, stage):
+                logger.info("Exported %s via conversion server", docx_file.name)
+            else:
+                pending.setdefault(stage, []).append(docx_file)
+        stdout = []
+        for stage, batch in pending.items():
+            logger.info("Exporting %d PDF(s) to %s", len(batch), stage.parent)
+            stdout.append(_run_libreoffice(batch, stage).stdout.strip())
+
+        absent = [str(pdf_path) for staged, pdf_path, _ in converted if not staged.exists()]
+        if absent:
+            raise RuntimeError(
+                f"Conversion appeared to succeed but PDF not found at {', '.join(absent)}. "
+                f"LibreOffice stdout: {' '.join(stdout)}"
+            )
+        for staged, pdf_path, entry in converted:
+            os.replace(staged, pdf_path)
+            _copy_replace(pdf_path, entry)
+    if converted:
+        _trim_pdf_cache(cache_dir, cfg.pdf_cache_max_mb * 1024 * 1024)
+    return [str(p.resolve()) for p in pdf_paths]
 
 
 def doc_read(doc_id: str) -> str:
@@ -393,54 +983,42 @@ def doc_read(doc_id: str) -> str:
     Returns:
         Full document content as a structured string.
     """
-    from docx.oxml.ns import qn
-
-    _WNS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-
-    doc = _get_document(doc_id)
-    lines: list[str] = []
-    table_count = 0
-
-    for block_idx, block in enumerate(doc.element.body, start=1):
-        tag = block.tag.split("}")[-1] if "}" in block.tag else block.tag
-
-        if tag == "p":
-            style_el = block.find(qn("w:pPr"))
-            style_name = ""
-            if style_el is not None:
-                style_id_el = style_el.find(qn("w:pStyle"))
-                if style_id_el is not None:
-                    style_name = style_id_el.get(qn("w:val"), "")
-            text = "".join(r.text for r in block.iter() if r.tag == qn("w:t") and r.text)
-            if not text.strip():
-                continue
-            if style_name.startswith("Heading"):
-                level = style_name[-1] if style_name[-1].isdigit() else "1"
-                lines.append(f"[{block_idx}] [HEADING {level}] {text}")
-            else:
-                lines.append(f"[{block_idx}] [PARA] {text}")
-
-        elif tag == "tbl":
-            table_count += 1
-            rows_text: list[list[str]] = []
-            for row in block.iter(f"{{{_WNS}}}tr"):
-                cells = []
-                for cell in row.iter(f"{{{_WNS}}}tc"):
-                    cell_text = "".join(
-                        t.text for t in cell.iter(f"{{{_WNS}}}t") if t.text
+    with _use_document(doc_id) as doc:
+        lines: list[str] = []
+        table_count = 0
+
+        # Every body child is counted, not just w:p and w:tbl, so the [N] indices
+        # match the ones doc_edit_paragraph resolves.
+        for block_idx, block in enumerate(doc.element.body, start=1):
+            tag = block.tag
+
+            if tag == _W_P:
+                text = _text_of(block)
+                if not text.strip():
+                    continue
+                style_name = _W_PSTYLE_VAL(block)
+                if style_name.startswith("Heading"):
+                    level = style_name[-1] if style_name[-1].isdigit() else "1"
+                    lines.append(f"[{block_idx}] [HEADING {level}] {text}")
+                else:
+                    lines.append(f"[{block_idx}] [PARA] {text}")
+
+            elif tag == _W_TBL:
+                table_count += 1
+                rows_text = [
+                    cells
+                    for row in block.iterchildren(_W_TR)
+                    if (cells := [_text_of(cell).strip() for cell in row.iterchildren(_W_TC)])
+                ]
+                if rows_text:
+                    lines.append(
+                        f"[{block_idx}] [TABLE {table_count}: "
+                        f"{len(rows_text)}x{len(rows_text[0])}]"
                     )
-                    cells.append(cell_text.strip())
-                if cells:
-                    rows_text.append(cells)
-            if rows_text:
-                lines.append(
-                    f"[{block_idx}] [TABLE {table_count}: "
-                    f"{len(rows_text)}x{len(rows_text[0])}]"
-                )
-                for row_i, row in enumerate(rows_text, start=1):
-                    lines.append(f"  [r{row_i}] " + " | ".join(row))
+                    for row_i, row in enumerate(rows_text, start=1):
+                        lines.append(f"  [r{row_i}] " + " | ".join(row))
 
-    return "\n".join(lines) if lines else "(empty document)"
+        return "\n".join(lines) if lines else "(empty document)"
 
 
 def doc_edit_paragraph(doc_id: str, block_index: int, new_text: str) -> str:
@@ -458,35 +1036,29 @@ def doc_edit_paragraph(doc_id: str, block_index: int, new_text: str) -> str:
     Returns:
         Confirmation string.
     """
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import qn
-
-    doc = _get_document(doc_id)
-    blocks = list(doc.element.body)
-    if block_index < 1 or block_index > len(blocks):
-        raise ValueError(
-            f"block_index {block_index} out of range (1..{len(blocks)}). "
-            "Use doc_read to list valid indices."
-        )
-    block = blocks[block_index - 1]
-    tag = block.tag.split("}")[-1] if "}" in block.tag else block.tag
-    if tag != "p":
-        raise ValueError(
-            f"Block {block_index} is a '{tag}', not a paragraph. "
-            "Use doc_edit_table_cell for table content."
-        )
-    # Remove all existing runs, keeping paragraph properties (style) intact.
-    for run_el in block.findall(qn("w:r")):
-        block.remove(run_el)
-    # Insert a single new run with the replacement text.
-    r_el = OxmlElement("w:r")
-    t_el = OxmlElement("w:t")
-    t_el.text = new_text
-    if new_text and (new_text[0] == " " or new_text[-1] == " "):
-        t_el.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-    r_el.append(t_el)
-    block.append(r_el)
-    return f"Block {block_index} updated ({len(new_text)} chars)."
+    with _use_document(doc_id) as doc:
+        blocks = list(doc.element.body)
+        if block_index < 1 or block_index > len(blocks):
+            raise ValueError(
+                f"block_index {block_index} out of range (1..{len(blocks)}). "
+                "Use doc_read to list valid indices."
+            )
+        block = blocks[block_index - 1]
+        if block.tag != _W_P:
+            tag = block.tag.rpartition("}")[2]
+            raise ValueError(
+                f"Block {block_index} is a '{tag}', not a paragraph. "
+                "Use doc_edit_table_cell for table content."
+            )
+        # Remove all existing runs in one pass inside lxml, including those nested
+        # in hyperlinks or tracked changes; paragraph properties (style) stay put.
+        etree.strip_elements(block, _W_R, with_tail=False)
+        # Insert a single new run with the replacement text.
+        t_el = etree.SubElement(etree.SubElement(block, _W_R), _W_T)
+        t_el.text = new_text
+        if new_text and (new_text[0] == " " or new_text[-1] == " "):
+            t_el.set(_XML_SPACE, "preserve")
+        return f"Block {block_index} updated ({len(new_text)} chars)."
 
 
 def doc_edit_table_cell(
@@ -511,25 +1083,26 @@ def doc_edit_table_cell(
     Returns:
         Confirmation string.
     """
-    doc = _get_document(doc_id)
-    tables = doc.tables
-    if table_index < 1 or table_index > len(tables):
-        raise ValueError(
-            f"table_index {table_index} out of range (1..{len(tables)}). "
-            "Use doc_read to see available tables."
-        )
-    table = tables[table_index - 1]
-    if row_index < 1 or row_index > len(table.rows):
-        raise ValueError(
-            f"row_index {row_index} out of range (1..{len(table.rows)})."
-        )
-    row = table.rows[row_index - 1]
-    if col_index < 1 or col_index > len(row.cells):
-        raise ValueError(
-            f"col_index {col_index} out of range (1..{len(row.cells)})."
-        )
-    row.cells[col_index - 1].text = new_text
-    return f"Table {table_index} cell [r{row_index}, c{col_index}] updated to {new_text!r}."
+    with _use_document(doc_id) as doc:
+        tables = doc.tables
+        if table_index < 1 or table_index > len(tables):
+            raise ValueError(
+                f"table_index {table_index} out of range (1..{len(tables)}). "
+                "Use doc_read to see available tables."
+            )
+        # Index <w:tr>/<w:tc> directly, as doc_read numbers them.
+        trs = tables[table_index - 1]._tbl.tr_lst
+        if row_index < 1 or row_index > len(trs):
+            raise ValueError(
+                f"row_index {row_index} out of range (1..{len(trs)})."
+            )
+        tcs = trs[row_index - 1].tc_lst
+        if col_index < 1 or col_index > len(tcs):
+            raise ValueError(
+                f"col_index {col_index} out of range (1..{len(tcs)})."
+            )
+        _set_tc_text(tcs[col_index - 1], new_text)
+        return f"Table {table_index} cell [r{row_index}, c{col_index}] updated to {new_text!r}."
 
 
 # ---------------------------------------------------------------------------
@@ -537,6 +1110,7 @@ def doc_edit_table_cell(
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all document tools."""
     return [
@@ -630,6 +1204,7 @@ def create_tools() -> list[FunctionTool]:
         ),
         FunctionTool.from_defaults(
             fn=doc_save,
+            async_fn=doc_save_async,
             name="doc_save",
             description=(
                 "Save a Word document as .docx. Returns the absolute file path."
@@ -637,10 +1212,20 @@ def create_tools() -> list[FunctionTool]:
         ),
         FunctionTool.from_defaults(
             fn=doc_export_pdf,
+            async_fn=doc_export_pdf_async,
             name="doc_export_pdf",
             description=(
                 "Convert a .docx file to PDF using LibreOffice headless. "
                 "Returns the absolute path to the generated PDF."
             ),
         ),
+        FunctionTool.from_defaults(
+            fn=doc_export_pdf_batch,
+            name="doc_export_pdf_batch",
+            description=(
+                "Convert several .docx files to PDF in one LibreOffice run. "
+                "Prefer this over repeated doc_export_pdf calls when exporting "
+                "multiple documents. Returns the absolute PDF paths in input order."
+            ),
+        ),
     ]
@@ -19,6 +19,7 @@ from openpyxl.styles import Border, Font, PatternFill, Side
 from openpyxl.utils import range_boundaries
 
 from hermes.config import get_config
+from hermes.tools._base import shared_tools
 
 logger = logging.getLogger(__name__)
 
@@ -417,6 +418,7 @@ def excel_save(
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all Excel tools."""
     return [
@@ -13,7 +13,7 @@ import logging
 from llama_index.core.tools import FunctionTool
 
 from hermes.infra.cache import TTL_1_HOUR
-from hermes.tools._base import cached_request, fred_get
+from hermes.tools._base import cached_request, fred_get, shared_tools
 
 logger = logging.getLogger(__name__)
 
@@ -156,6 +156,7 @@ async def get_series_info(series_id: str) -> dict:
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all FRED tools."""
     return [
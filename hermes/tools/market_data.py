@@ -13,7 +13,7 @@ import time
 
 from llama_index.core.tools import FunctionTool
 
-from hermes.tools._base import YAHOO_BASE_URL, cached_request, yahoo_get
+from hermes.tools._base import YAHOO_BASE_URL, cached_request, shared_tools, yahoo_get
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +188,7 @@ async def get_multiple_quotes(symbols: list[str]) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all market data tools."""
     return [
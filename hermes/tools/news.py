@@ -14,7 +14,7 @@ import httpx
 from llama_index.core.tools import FunctionTool
 
 from hermes.infra.cache import TTL_1_HOUR
-from hermes.tools._base import cached_request, get_http_client
+from hermes.tools._base import cached_request, get_http_client, shared_tools
 
 logger = logging.getLogger(__name__)
 
@@ -176,6 +176,7 @@ async def search_financial_news(query: str, limit: int = 10) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all news tools."""
     return [
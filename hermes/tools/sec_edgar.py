@@ -17,7 +17,7 @@ from llama_index.core.tools import FunctionTool
 
 from hermes.config import get_config
 from hermes.infra.cache import TTL_1_HOUR, TTL_24_HOURS, TTL_PERMANENT
-from hermes.tools._base import cached_request, sec_efts_get
+from hermes.tools._base import cached_request, sec_efts_get, shared_tools
 
 logger = logging.getLogger(__name__)
 
@@ -600,6 +600,7 @@ def _extract_accession_number(url: str) -> str | None:
 # ---------------------------------------------------------------------------
 
 
+@shared_tools
 def create_tools() -> list[FunctionTool]:
     """Create LlamaIndex FunctionTool instances for all SEC EDGAR tools."""
     return [
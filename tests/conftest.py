@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
@@ -127,6 +128,17 @@ class MockAsyncHTTPClient:
             status_code=404, json_data={"error": "no mock configured"}
         )
         self._call_log: list[dict[str, Any]] = []
+        self._base_url = ""
+
+    def bind(self, base_url: str = "") -> MockAsyncHTTPClient:
+        """Return a view that resolves request paths against *base_url*.
+
+        Mirrors ``httpx.AsyncClient(base_url=...)``; the view shares this
+        mock's registered responses and call log.
+        """
+        view = copy.copy(self)
+        view._base_url = base_url
+        return view
 
     def add_response(self, url_contains: str, response: MockHTTPResponse) -> None:
         """Register a response for URLs containing the given substring."""
@@ -141,6 +153,7 @@ class MockAsyncHTTPClient:
         **kwargs: Any,
     ) -> MockHTTPResponse:
         """Simulate an async GET request."""
+        url = self._base_url + url
         self._call_log.append(
             {"method": "GET", "url": url, "params": params, "headers": headers}
         )
@@ -159,6 +172,7 @@ class MockAsyncHTTPClient:
         **kwargs: Any,
     ) -> MockHTTPResponse:
         """Simulate an async POST request."""
+        url = self._base_url + url
         self._call_log.append(
             {"method": "POST", "url": url, "json": json, "headers": headers}
         )
@@ -192,13 +206,11 @@ def mock_http_client() -> Generator[MockAsyncHTTPClient, None, None]:
     """
     mock_client = MockAsyncHTTPClient()
 
-    # Patch the module-level singleton in hermes.tools._base so that
-    # get_http_client() returns our mock.
-    with patch("hermes.tools._base._client", mock_client):
+    # Patch get_http_client() in hermes.tools._base, and where it has been
+    # imported by name, so that every caller receives our mock (bound to the
+    # requested base URL, as the real per-host clients are).
+    with (
+        patch("hermes.tools._base.get_http_client", side_effect=mock_client.bind),
+        patch("hermes.tools.news.get_http_client", side_effect=mock_client.bind),
+    ):
         yield mock_client
-
-    # Reset the module-level singleton to None so the next test gets
-    # a fresh state.
-    import hermes.tools._base as base_mod
-
-    base_mod._client = None
@@ -7,8 +7,11 @@ from __future__ import annotations
 
 import sys
 import types
+from dataclasses import dataclass
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 # ---------------------------------------------------------------------------
 # Stub out llama_index if not installed
@@ -45,8 +48,24 @@ if "llama_index" not in sys.modules:
 # ---------------------------------------------------------------------------
 
 
-def _make_tool_with_schema(schema: dict) -> MagicMock:
-    """Create a mock tool whose fn_schema returns the given schema dict."""
+@dataclass
+class _FakeMetadata:
+    fn_schema: Any
+
+
+class _FakeTool:
+    """Mirrors LlamaIndex's BaseTool: a read-only ``metadata`` over ``_metadata``."""
+
+    def __init__(self, fn_schema: Any) -> None:
+        self._metadata = _FakeMetadata(fn_schema)
+
+    @property
+    def metadata(self) -> _FakeMetadata:
+        return self._metadata
+
+
+def _make_tool_with_schema(schema: dict) -> _FakeTool:
+    """Create a fake tool whose fn_schema returns the given schema dict."""
 
     class FakeSchema:
         @classmethod
@@ -55,9 +74,7 @@ def _make_tool_with_schema(schema: dict) -> MagicMock:
 
             return copy.deepcopy(schema)
 
-    tool = MagicMock()
-    tool.metadata.fn_schema = FakeSchema
-    return tool
+    return _FakeTool(FakeSchema)
 
 
 def _make_google_llm() -> MagicMock:
@@ -160,26 +177,45 @@ class TestPatchToolsForGoogle:
             },
         }
         tool = _make_tool_with_schema(schema)
-        patch_tools_for_google([tool])
+        (patched,) = patch_tools_for_google([tool])
 
-        result = tool.metadata.fn_schema.model_json_schema()
+        result = patched.metadata.fn_schema.model_json_schema()
         assert "additionalProperties" not in result["properties"]["cell_data"]
 
-    def test_original_schema_still_has_key(self) -> None:
-        """Patching should not mutate the schema dict returned before patching."""
+    def test_original_tool_is_untouched(self) -> None:
+        """Shared tools keep their schema for agents built on other providers."""
         from hermes.agents.base import patch_tools_for_google
 
         schema = {"type": "object", "additionalProperties": True}
         tool = _make_tool_with_schema(schema)
+        original_schema = tool.metadata.fn_schema
+
+        (patched,) = patch_tools_for_google([tool])
 
-        # Get schema before patching
-        before = tool.metadata.fn_schema.model_json_schema()
-        assert "additionalProperties" in before
+        assert patched is not tool
+        assert issubclass(patched.metadata.fn_schema, original_schema)
+        assert tool.metadata.fn_schema is original_schema
+        assert "additionalProperties" in tool.metadata.fn_schema.model_json_schema()
+        assert "additionalProperties" not in patched.metadata.fn_schema.model_json_schema()
 
-        patch_tools_for_google([tool])
+    def test_patches_real_function_tools(self) -> None:
+        """LlamaIndex FunctionTools are copied with their function and a patched schema."""
+        pytest.importorskip("llama_index.core.tools.types")
+        from llama_index.core.tools import FunctionTool
+
+        from hermes.agents.base import patch_tools_for_google
 
-        after = tool.metadata.fn_schema.model_json_schema()
-        assert "additionalProperties" not in after
+        def write(cells: dict[str, Any]) -> str:
+            """Write cells."""
+            return ""
+
+        tool = FunctionTool.from_defaults(fn=write)
+        (patched,) = patch_tools_for_google([tool])
+
+        assert patched.fn is tool.fn
+        assert patched.metadata.name == "write"
+        assert "additionalProperties" in str(tool.metadata.get_parameters_dict())
+        assert "additionalProperties" not in str(patched.metadata.get_parameters_dict())
 
     def test_handles_tool_without_fn_schema(self) -> None:
         """Should not raise if a tool has no fn_schema."""
@@ -188,7 +224,7 @@ class TestPatchToolsForGoogle:
         tool = MagicMock()
         del tool.metadata.fn_schema  # no fn_schema attribute
 
-        patch_tools_for_google([tool])  # should not raise
+        assert patch_tools_for_google([tool]) == [tool]  # should not raise
 
     def test_patches_multiple_tools(self) -> None:
         from hermes.agents.base import patch_tools_for_google
@@ -204,12 +240,12 @@ class TestPatchToolsForGoogle:
                 }
             ),
         ]
-        patch_tools_for_google(tools)
+        patched = patch_tools_for_google(tools)
 
-        assert "additionalProperties" not in tools[0].metadata.fn_schema.model_json_schema()
+        assert "additionalProperties" not in patched[0].metadata.fn_schema.model_json_schema()
         assert (
             "additionalProperties"
-            not in tools[1].metadata.fn_schema.model_json_schema()["properties"]["data"]
+            not in patched[1].metadata.fn_schema.model_json_schema()["properties"]["data"]
         )
 
 
@@ -239,11 +275,13 @@ class TestHermesAgentBuildGeminiPatching:
         agent = FakeAgent()
         llm = _make_google_llm()
 
-        agent.build(llm=llm)
+        with patch("llama_index.core.agent.FunctionAgent") as agent_cls:
+            agent.build(llm=llm)
 
-        # After build(), the tool schema should be sanitized
-        result = tool.metadata.fn_schema.model_json_schema()
-        assert "additionalProperties" not in result
+        # The agent gets a sanitized copy; the shared tool keeps its schema.
+        (built_tool,) = agent_cls.call_args.kwargs["tools"]
+        assert "additionalProperties" not in built_tool.metadata.fn_schema.model_json_schema()
+        assert "additionalProperties" in tool.metadata.fn_schema.model_json_schema()
 
     def test_build_does_not_patch_for_non_google(self) -> None:
         """Schema should not be modified when using non-Gemini providers."""
@@ -265,8 +303,10 @@ class TestHermesAgentBuildGeminiPatching:
         anthropic_llm = MagicMock()
         anthropic_llm.__class__.__name__ = "Anthropic"
 
-        agent.build(llm=anthropic_llm)
+        with patch("llama_index.core.agent.FunctionAgent") as agent_cls:
+            agent.build(llm=anthropic_llm)
 
         # Schema should still have additionalProperties
+        assert agent_cls.call_args.kwargs["tools"] == [tool]
         result = tool.metadata.fn_schema.model_json_schema()
         assert "additionalProperties" in result
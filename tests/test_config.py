@@ -0,0 +1,41 @@
+"""Tests for hermes.config -- global and context-scoped configuration."""
+
+from __future__ import annotations
+
+import asyncio
+
+from hermes.config import (
+    HermesConfig,
+    get_config,
+    reset_request_config,
+    set_request_config,
+)
+
+
+class TestRequestConfig:
+    """Verify that a context-bound config overrides the global one."""
+
+    def test_bound_config_wins_until_reset(self, hermes_config: HermesConfig) -> None:
+        global_config = get_config()
+
+        token = set_request_config(hermes_config)
+        try:
+            assert get_config() is hermes_config
+        finally:
+            reset_request_config(token)
+
+        assert get_config() is global_config
+
+    async def test_binding_is_scoped_to_the_task(self, hermes_config: HermesConfig) -> None:
+        """Concurrent tasks each see their own binding, not each other's."""
+        other = hermes_config.model_copy(update={"fred_api_key": "other-key"})
+
+        async def step(config: HermesConfig) -> str | None:
+            set_request_config(config)
+            await asyncio.sleep(0)
+            return get_config().fred_api_key
+
+        results = await asyncio.gather(step(hermes_config), step(other))
+
+        assert results == ["test-fred-key-not-real", "other-key"]
+        assert get_config() not in (hermes_config, other)
@@ -7,8 +7,10 @@ time-based behaviour rather than mocking the clock.
 
 from __future__ import annotations
 
+import shutil
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -67,6 +69,46 @@ class TestPutAndGet:
         assert result == data
         assert len(result) == 1024 * 1024
 
+    def test_put_leaves_no_temp_files(self, cache: FileCache) -> None:
+        """Atomic writes should not leave temporary files behind."""
+        cache.put("test_ns", "key1", b"data", durable=True)
+        cache.put("test_ns", "key1", b"data2")
+        ns_dir = cache._entry_paths("test_ns", "key1")[0].parent
+        names = sorted(p.suffix for p in ns_dir.iterdir())
+        assert names == [".data", ".meta"]
+
+    def test_put_after_clear_recreates_namespace(self, cache: FileCache) -> None:
+        """Namespace directories removed by clear_*() should be recreated on put."""
+        cache.put("test_ns", "key1", b"data")
+        cache.clear_namespace("test_ns")
+        cache.put("test_ns", "key2", b"data")
+        cache.clear_all()
+        cache.put("test_ns", "key3", b"data")
+        assert cache.get("test_ns", "key3") == b"data"
+
+    def test_put_survives_external_directory_removal(self, cache: FileCache) -> None:
+        """put() should recreate a namespace directory deleted by another process."""
+        cache.put("test_ns", "key1", b"data")
+        shutil.rmtree(cache._entry_paths("test_ns", "key1")[0].parent)
+        cache.put("test_ns", "key2", b"data")
+        assert cache.get("test_ns", "key2") == b"data"
+
+    def test_entry_filename_is_stable_hex_digest(self, cache: FileCache) -> None:
+        """Keys should map to a fixed-length, filesystem-safe hex name."""
+        name = cache._entry_paths("test_ns", "https://example.com/?q=a/b")[0].stem
+        assert len(name) == 64
+        assert int(name, 16) >= 0
+        assert name == cache._entry_paths("other_ns", "https://example.com/?q=a/b")[0].stem
+
+    def test_key_is_hashed_once_per_operation(self, cache: FileCache) -> None:
+        """The .data and .meta names share one digest rather than hashing twice."""
+        with patch.object(FileCache, "_hash_key", wraps=FileCache._hash_key) as hash_key:
+            cache.put("test_ns", "key1", b"data")
+            assert hash_key.call_count == 1
+            cache._mem.clear()
+            assert cache.get("test_ns", "key1") == b"data"
+            assert hash_key.call_count == 2
+
     def test_has_returns_true_for_existing_key(self, cache: FileCache) -> None:
         """has() should return True for a valid, non-expired entry."""
         cache.put("test_ns", "exists", b"data")
@@ -77,6 +119,142 @@ class TestPutAndGet:
         assert cache.has("test_ns", "missing") is False
 
 
+# ---------------------------------------------------------------------------
+# Tests: get_buffer
+# ---------------------------------------------------------------------------
+
+
+class TestGetBuffer:
+    """Test memory-mapped reads of large entries."""
+
+    def test_small_entry_returns_bytes(self, tmp_path: Path) -> None:
+        """Entries below the threshold should come back as plain bytes."""
+        cache = FileCache(base_dir=str(tmp_path / "c"), mmap_threshold=1024)
+        cache.put("buf_ns", "small", b"tiny")
+        result = cache.get_buffer("buf_ns", "small")
+        assert isinstance(result, bytes)
+        assert result == b"tiny"
+
+    def test_large_entry_returns_memoryview(self, tmp_path: Path) -> None:
+        """Entries at or above the threshold should be memory-mapped."""
+        cache = FileCache(base_dir=str(tmp_path / "c"), mmap_threshold=1024)
+        data = bytes(range(256)) * 16
+        cache.put("buf_ns", "large", data)
+        result = cache.get_buffer("buf_ns", "large")
+        assert isinstance(result, memoryview)
+        assert result.readonly
+        assert result.tobytes() == data
+        result.release()
+
+    def test_missing_and_expired_return_none(self, cache: FileCache) -> None:
+        """get_buffer() should honour the same miss/expiry rules as get()."""
+        assert cache.get_buffer("buf_ns", "missing") is None
+        cache.put("buf_ns", "expiring", b"data", ttl_seconds=0.2)
+        time.sleep(0.4)
+        assert cache.get_buffer("buf_ns", "expiring") is None
+
+
+# ---------------------------------------------------------------------------
+# Tests: in-process LRU
+# ---------------------------------------------------------------------------
+
+
+class TestMemoryLRU:
+    """Test the in-process LRU that sits in front of the disk."""
+
+    def test_hot_key_served_from_memory(self, cache: FileCache) -> None:
+        """A recently written key should not need its files to be read."""
+        cache.put("mem_ns", "hot", b"data")
+        cache._entry_paths("mem_ns", "hot")[0].unlink()
+        assert cache.get("mem_ns", "hot") == b"data"
+
+    def test_capacity_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Only the most recently used entries should stay in memory."""
+        cache = FileCache(base_dir=str(tmp_path / "c"), memory_capacity=2)
+        cache.put("mem_ns", "a", b"A")
+        cache.put("mem_ns", "b", b"B")
+        cache.get("mem_ns", "a")
+        cache.put("mem_ns", "c", b"C")
+        assert list(cache._mem) == [("mem_ns", "a"), ("mem_ns", "c")]
+        # Evicted entries are still served from disk.
+        assert cache.get("mem_ns", "b") == b"B"
+
+    def test_delete_and_clear_evict_memory(self, cache: FileCache) -> None:
+        """delete() and clear_namespace() should drop in-memory copies too."""
+        cache.put("mem_ns", "gone", b"data")
+        cache.put("mem_ns2", "kept", b"data")
+        cache.delete("mem_ns", "gone")
+        cache.clear_namespace("mem_ns2")
+        assert cache.get("mem_ns", "gone") is None
+        assert cache.get("mem_ns2", "kept") is None
+
+    def test_large_entries_bypass_memory(self, tmp_path: Path) -> None:
+        """Entries at or above the mmap threshold should not be held in memory."""
+        cache = FileCache(base_dir=str(tmp_path / "c"), mmap_threshold=16)
+        cache.put("mem_ns", "big", b"X" * 32)
+        assert ("mem_ns", "big") not in cache._mem
+        assert cache.get("mem_ns", "big") == b"X" * 32
+
+
+# ---------------------------------------------------------------------------
+# Tests: try_get and miss tracking
+# ---------------------------------------------------------------------------
+
+
+class TestTryGet:
+    """Test the combined existence-and-read lookup."""
+
+    def test_try_get_hit(self, cache: FileCache) -> None:
+        """A present key should report a hit along with its data."""
+        cache.put("try_ns", "k", b"data")
+        assert cache.try_get("try_ns", "k") == (True, b"data")
+
+    def test_try_get_miss(self, cache: FileCache) -> None:
+        """An absent key should report a miss with no data."""
+        assert cache.try_get("try_ns", "absent") == (False, None)
+
+    def test_recent_miss_skips_disk(self, cache: FileCache) -> None:
+        """A key that just missed should not be looked up on disk again."""
+        assert cache.get("try_ns", "polled") is None
+        with patch("hermes.infra.cache._read_file", side_effect=AssertionError("disk hit")):
+            assert cache.get("try_ns", "polled") is None
+            assert cache.has("try_ns", "polled") is False
+
+    def test_put_clears_recent_miss(self, cache: FileCache) -> None:
+        """Writing a key should make it visible immediately after a miss."""
+        assert cache.get("try_ns", "late") is None
+        cache.put("try_ns", "late", b"arrived")
+        assert cache.try_get("try_ns", "late") == (True, b"arrived")
+
+    def test_recent_miss_expires(self, tmp_path: Path) -> None:
+        """Remembered misses should lapse after miss_ttl."""
+        cache = FileCache(base_dir=str(tmp_path / "c"), miss_ttl=0.05)
+        writer = FileCache(base_dir=str(tmp_path / "c"))
+        assert cache.get("try_ns", "shared") is None
+        writer.put("try_ns", "shared", b"data")
+        time.sleep(0.1)
+        assert cache.get("try_ns", "shared") == b"data"
+
+    def test_meta_readable_without_orjson(self, cache: FileCache) -> None:
+        """Entries should round-trip through the stdlib json fallback too."""
+        cache.put("try_ns", "plain", b"data", ttl_seconds=60)
+        cache._mem.clear()
+        with patch("hermes.infra.cache.orjson", None):
+            assert cache.get("try_ns", "plain") == b"data"
+            cache.put("try_ns", "plain2", b"data2")
+        cache._mem.clear()
+        assert cache.get("try_ns", "plain2") == b"data2"
+
+    def test_corrupt_meta_is_a_miss(self, cache: FileCache) -> None:
+        """Unparseable metadata should be treated as a miss and cleaned up."""
+        cache.put("try_ns", "bad", b"data", ttl_seconds=60)
+        cache._mem.clear()
+        meta_path = cache._entry_paths("try_ns", "bad")[1]
+        meta_path.write_text("{not json", encoding="utf-8")
+        assert cache.get("try_ns", "bad") is None
+        assert not meta_path.exists()
+
+
 # ---------------------------------------------------------------------------
 # Tests: TTL expiry
 # ---------------------------------------------------------------------------
@@ -121,8 +299,7 @@ class TestTTLExpiry:
     def test_expired_entry_is_cleaned_from_disk(self, cache: FileCache) -> None:
         """After expiry, the data and metadata files should be deleted."""
         cache.put("ttl_ns", "cleanup", b"temp", ttl_seconds=0.2)
-        data_path = cache._entry_path("ttl_ns", "cleanup")
-        meta_path = cache._meta_path("ttl_ns", "cleanup")
+        data_path, meta_path = cache._entry_paths("ttl_ns", "cleanup")
         assert data_path.exists()
         assert meta_path.exists()
 
@@ -133,6 +310,43 @@ class TestTTLExpiry:
         assert not meta_path.exists()
 
 
+# ---------------------------------------------------------------------------
+# Tests: expiry sweep
+# ---------------------------------------------------------------------------
+
+
+class TestSweep:
+    """Test heap-driven removal of expired entries."""
+
+    def test_sweep_removes_only_expired(self, cache: FileCache) -> None:
+        """sweep() should delete due entries and leave the rest alone."""
+        cache.put("sweep_ns", "short", b"a", ttl_seconds=0.1)
+        cache.put("sweep_ns", "long", b"b", ttl_seconds=60)
+        cache.put("sweep_ns", "forever", b"c")
+        time.sleep(0.2)
+
+        assert cache.sweep() == 1
+        assert not cache._entry_paths("sweep_ns", "short")[0].exists()
+        assert cache.get("sweep_ns", "long") == b"b"
+        assert cache.get("sweep_ns", "forever") == b"c"
+
+    def test_sweep_skips_entries_refreshed_since(self, cache: FileCache) -> None:
+        """A key re-put with a longer TTL should survive its old deadline."""
+        cache.put("sweep_ns", "refreshed", b"old", ttl_seconds=0.1)
+        cache.put("sweep_ns", "refreshed", b"new", ttl_seconds=60)
+        time.sleep(0.2)
+
+        assert cache.sweep() == 0
+        assert cache.get("sweep_ns", "refreshed") == b"new"
+
+    def test_put_triggers_sweep(self, cache: FileCache) -> None:
+        """A put after something has expired should clean it up."""
+        cache.put("sweep_ns", "stale", b"a", ttl_seconds=0.1)
+        time.sleep(0.2)
+        cache.put("sweep_ns", "fresh", b"b")
+        assert not cache._entry_paths("sweep_ns", "stale")[0].exists()
+
+
 # ---------------------------------------------------------------------------
 # Tests: namespaces
 # ---------------------------------------------------------------------------
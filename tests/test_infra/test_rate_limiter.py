@@ -8,7 +8,9 @@ exhausted, refill behaviour, and context manager usage.
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -108,6 +110,63 @@ class TestBlocking:
         delays = [t - start for t in results]
         assert max(delays) >= 0.3
 
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_reserve_consecutive_slots(self) -> None:
+        """Queued waiters should each wait for their own slot, not a shared one."""
+        limiter = RateLimiter(rate=10, per=1.0)
+        for _ in range(10):
+            await limiter.acquire()
+
+        start = time.monotonic()
+        results: list[float] = []
+
+        async def timed_acquire() -> None:
+            await limiter.acquire()
+            results.append(time.monotonic() - start)
+
+        await asyncio.gather(*[timed_acquire() for _ in range(5)])
+
+        # Slots are 0.1s apart, so the last of five lands at ~0.5s.
+        assert sorted(results)[0] >= 0.05
+        assert 0.4 <= max(results) < 0.9
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_reservation(self) -> None:
+        """Cancelling a queued acquire should not delay the next caller."""
+        limiter = RateLimiter(rate=2, per=1.0)
+        for _ in range(2):
+            await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # Without the refund this would wait for two slots (~1s).
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start < 0.7
+
+    @pytest.mark.asyncio
+    async def test_each_waiter_wakes_once(self) -> None:
+        """Queued waiters should sleep once each rather than polling."""
+        limiter = RateLimiter(rate=20, per=1.0)
+        for _ in range(20):
+            await limiter.acquire()
+
+        real_sleep = asyncio.sleep
+        sleeps: list[float] = []
+
+        async def counting_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            await real_sleep(delay)
+
+        with patch("hermes.infra.rate_limiter.asyncio.sleep", counting_sleep):
+            await asyncio.gather(*[limiter.acquire() for _ in range(6)])
+
+        assert len(sleeps) == 6
+
 
 # ---------------------------------------------------------------------------
 # Tests: refill behaviour
@@ -176,6 +235,17 @@ class TestRefill:
         elapsed_4 = time.monotonic() - start2
         assert elapsed_4 >= 0.2
 
+    @pytest.mark.asyncio
+    async def test_fractional_rate_waits_for_first_token(self) -> None:
+        """A bucket holding less than one token should delay the first acquire."""
+        # 0.5 tokens per 0.2s: the bucket starts half full, so the first
+        # token is ready after another 0.2s.
+        limiter = RateLimiter(rate=0.5, per=0.2)
+        start = time.monotonic()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+        assert 0.15 <= elapsed < 0.6
+
 
 # ---------------------------------------------------------------------------
 # Tests: context manager usage
@@ -241,3 +311,21 @@ class TestGetLimiter:
         limiter = get_limiter("unknown_api_for_test")
         assert limiter.rate == 1
         assert limiter.per == 1.0
+
+    def test_concurrent_first_calls_share_instance(self) -> None:
+        """Threads racing to create the same limiter should all get one instance."""
+        name = "race_api_for_test"
+        barrier = threading.Barrier(8)
+        seen: list[RateLimiter] = []
+
+        def worker() -> None:
+            barrier.wait()
+            seen.append(get_limiter(name))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(lim) for lim in seen}) == 1
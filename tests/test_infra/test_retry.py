@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import re
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -38,6 +39,21 @@ def test_parse_go_duration_milliseconds():
     assert _parse_go_duration("500ms") == pytest.approx(0.5)
 
 
+def test_parse_go_duration_fast_path_matches_general_parser():
+    for value in ("53s", "0.5s", "10.25s", "1e3s", "5.s", "6m0s", "1.2.3s"):
+        assert _parse_go_duration(value) == pytest.approx(
+            sum(
+                float(v) * {"h": 3600, "m": 60, "s": 1, "ms": 0.001}.get(u, 0)
+                for v, u in re.findall(r"(\d+(?:\.\d+)?)([a-z]+)", value)
+            )
+        )
+
+
+def test_parse_go_duration_fractional_and_unknown_units():
+    assert _parse_go_duration("1.5s20xs") == pytest.approx(1.5)
+    assert _parse_go_duration("") == 0.0
+
+
 # ---------------------------------------------------------------------------
 # is_rate_limit_error — Anthropic
 # ---------------------------------------------------------------------------
@@ -0,0 +1,83 @@
+"""Tests for streaming event types."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import pytest
+
+from hermes.infra.streaming import (
+    EventType,
+    StreamEvent,
+    agent_output,
+    agent_start,
+    error,
+    file_created,
+    tool_call,
+)
+
+
+class TestStreamEvent:
+    """Test the StreamEvent value object."""
+
+    def test_defaults(self) -> None:
+        """Optional fields should default to None and empty metadata."""
+        event = StreamEvent(type=EventType.TOKEN, text="hi")
+        assert event.agent_name is None
+        assert dict(event.metadata) == {}
+        assert event.timestamp > 0
+
+    def test_is_frozen(self) -> None:
+        """Events should be immutable once created."""
+        event = agent_start("macro")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            event.text = "changed"  # type: ignore[misc]
+
+    def test_default_metadata_is_read_only(self) -> None:
+        """The shared empty metadata must not be mutable through any event."""
+        event = StreamEvent(type=EventType.TOKEN)
+        with pytest.raises(TypeError):
+            event.metadata["key"] = "value"  # type: ignore[index]
+
+    def test_to_dict_is_json_serialisable(self) -> None:
+        """to_dict() should produce plain JSON-compatible values."""
+        event = StreamEvent(
+            type=EventType.TOOL_CALL,
+            agent_name="sec",
+            tool_name="get_company_facts",
+            metadata={"tool_kwargs": {"ticker": "AAPL"}},
+        )
+        payload = json.loads(json.dumps(event.to_dict()))
+        assert payload["type"] == "tool_call"
+        assert payload["metadata"] == {"tool_kwargs": {"ticker": "AAPL"}}
+
+    def test_string_type_is_coerced(self) -> None:
+        """A plain string type is accepted and converted, as the Pydantic model did."""
+        event = StreamEvent(type="token", text="hi")  # type: ignore[arg-type]
+        assert event.type is EventType.TOKEN
+        assert event.to_dict()["type"] == "token"
+        with pytest.raises(ValueError):
+            StreamEvent(type="no_such_event")  # type: ignore[arg-type]
+
+    def test_model_dump_alias(self) -> None:
+        """model_dump() still works for callers of the former Pydantic model."""
+        event = agent_output("macro", "done")
+        assert event.model_dump()["type"] is EventType.AGENT_OUTPUT
+        assert event.model_dump(mode="json") == event.to_dict()
+
+    def test_convenience_constructor(self) -> None:
+        """Convenience constructors should set the matching event type."""
+        event = tool_call("sec", "search_filings")
+        assert event.type is EventType.TOOL_CALL
+        assert event.agent_name == "sec"
+        assert event.tool_name == "search_filings"
+
+    def test_all_convenience_constructors_set_type(self) -> None:
+        """Each pre-bound constructor should produce its own event type."""
+        assert agent_start("a").type is EventType.AGENT_START
+        assert agent_output("a", "t").type is EventType.AGENT_OUTPUT
+        assert file_created("/tmp/x.xlsx").type is EventType.FILE_CREATED
+        assert error("boom").text == "boom"
+        # Timestamps are taken per event, not frozen into the template.
+        assert agent_start("a").timestamp <= agent_start("b").timestamp
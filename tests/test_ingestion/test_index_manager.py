@@ -0,0 +1,167 @@
+"""Tests for the ChromaDB index manager.
+
+Uses a real persistent ChromaDB client in a temporary directory with
+LlamaIndex's ``MockEmbedding`` so no embedding API is called.  Tests that
+only need to observe how nodes are handed to the index replace it with a mock.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from llama_index.core import Settings
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.schema import TextNode
+
+from hermes.config import HermesConfig
+from hermes.ingestion.index_manager import IndexManager
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def manager(hermes_config: HermesConfig) -> Generator[IndexManager, None, None]:
+    """Create an IndexManager backed by a temporary ChromaDB directory."""
+    with (
+        patch("hermes.ingestion.index_manager.get_config", return_value=hermes_config),
+        patch.object(Settings, "_embed_model", MockEmbedding(embed_dim=8)),
+    ):
+        yield IndexManager(persist_dir=hermes_config.chroma_persist_dir)
+
+
+def _nodes(n: int) -> list[TextNode]:
+    return [TextNode(text=f"node {i}") for i in range(n)]
+
+
+# ---------------------------------------------------------------------------
+# Tests: add_documents
+# ---------------------------------------------------------------------------
+
+
+class TestAddDocuments:
+    """Test batched node insertion."""
+
+    def test_empty_nodes_raises(self, manager: IndexManager) -> None:
+        """An empty node list should be rejected."""
+        with pytest.raises(ValueError, match="empty"):
+            manager.add_documents("sec_filings_TEST", [])
+
+    def test_nodes_are_inserted_in_batches(
+        self, manager: IndexManager, hermes_config: HermesConfig
+    ) -> None:
+        """Every node should be inserted exactly once, in configured batch sizes."""
+        hermes_config.ingest_batch_size = 4
+        index = MagicMock()
+        inserted: list[list[TextNode]] = []
+        lock = threading.Lock()
+
+        def record(batch: list[TextNode]) -> None:
+            with lock:
+                inserted.append(batch)
+
+        index.insert_nodes.side_effect = record
+        nodes = _nodes(10)
+
+        with patch.object(manager, "get_or_create_index", return_value=index):
+            manager.add_documents("sec_filings_TEST", nodes)
+
+        assert sorted(len(b) for b in inserted) == [2, 4, 4]
+        flat = [node for batch in inserted for node in batch]
+        assert sorted(n.text for n in flat) == sorted(n.text for n in nodes)
+
+    def test_lazy_nodes_are_consumed_in_bounded_batches(
+        self, manager: IndexManager, hermes_config: HermesConfig
+    ) -> None:
+        """A node generator is drawn down as batches complete, not all up front."""
+        hermes_config.ingest_batch_size = 2
+        hermes_config.ingest_workers = 2
+        index = MagicMock()
+        produced = 0
+        inserted = 0
+        ahead: list[int] = []
+        lock = threading.Lock()
+
+        def generate() -> Generator[TextNode, None, None]:
+            nonlocal produced
+            for node in _nodes(20):
+                with lock:
+                    produced += 1
+                yield node
+
+        def record(batch: list[TextNode]) -> None:
+            nonlocal inserted
+            with lock:
+                ahead.append(produced - inserted)
+                inserted += len(batch)
+
+        index.insert_nodes.side_effect = record
+
+        with patch.object(manager, "get_or_create_index", return_value=index):
+            manager.add_documents("sec_filings_TEST", generate())
+
+        assert inserted == 20
+        # Two batches in flight plus the one being pulled from the generator.
+        assert max(ahead) <= 3 * 2
+
+    def test_batch_failure_propagates(
+        self, manager: IndexManager, hermes_config: HermesConfig
+    ) -> None:
+        """An error in any batch should surface to the caller."""
+        hermes_config.ingest_batch_size = 2
+        index = MagicMock()
+        index.insert_nodes.side_effect = [None, RuntimeError("embed failed"), None]
+
+        with (
+            patch.object(manager, "get_or_create_index", return_value=index),
+            pytest.raises(RuntimeError, match="embed failed"),
+        ):
+            manager.add_documents("sec_filings_TEST", _nodes(6))
+
+
+# ---------------------------------------------------------------------------
+# Tests: collection bookkeeping
+# ---------------------------------------------------------------------------
+
+
+class TestCollections:
+    """Test the cached collection-name set."""
+
+    def test_list_collections_is_cached(self, manager: IndexManager) -> None:
+        """Repeated listings should hit ChromaDB once."""
+        with patch.object(
+            manager._client, "list_collections", wraps=manager._client.list_collections
+        ) as spy:
+            manager.list_collections()
+            manager.list_collections()
+            assert spy.call_count == 1
+
+    def test_create_and_delete_keep_cache_in_sync(self, manager: IndexManager) -> None:
+        """Collections created or deleted through the manager should be reflected."""
+        assert manager.list_collections() == []
+        manager.get_or_create_index("sec_filings_AAPL")
+        assert manager.list_collections() == ["sec_filings_AAPL"]
+        assert manager.collection_count("sec_filings_AAPL") == 0
+
+        manager.delete_collection("sec_filings_AAPL")
+        assert manager.list_collections() == []
+        with pytest.raises(KeyError, match="does not exist"):
+            manager.collection_count("sec_filings_AAPL")
+
+    def test_refresh_sees_external_changes(self, manager: IndexManager) -> None:
+        """refresh() should pick up collections created by another client."""
+        assert manager.list_collections() == []
+        manager._client.get_or_create_collection("transcripts_MSFT")
+        assert manager.list_collections() == []
+        manager.refresh()
+        assert manager.list_collections() == ["transcripts_MSFT"]
+
+    def test_missing_collection_error_lists_available(self, manager: IndexManager) -> None:
+        """Lookups of unknown collections should name the ones that exist."""
+        manager.get_or_create_index("sec_filings_AAPL")
+        with pytest.raises(KeyError, match=r"Available: \['sec_filings_AAPL'\]"):
+            manager.query("sec_filings_MSFT", "revenue")
@@ -0,0 +1,258 @@
+"""Tests for the SEC filing HTML parser.
+
+Uses small hand-written filing snippets so section detection, chunking, and
+table extraction can be checked against exact expected output.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hermes.ingestion.sec_parser import SecFilingParser
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_PARAGRAPH = (
+    "Our business depends on continued demand for our products and services, "
+    "and adverse economic conditions could reduce that demand materially."
+)
+
+
+def _filing(*sections: tuple[str, int]) -> str:
+    """Build filing HTML with one heading and *n* paragraphs per section."""
+    body = []
+    for heading, n_paras in sections:
+        body.append(f"<p><b>{heading}</b></p>")
+        body.extend(f"<p><font>({i}) {_PARAGRAPH}</font></p>" for i in range(n_paras))
+    return (
+        "<html><head><style>p {}</style><script>var x = 1;</script></head><body>"
+        + "".join(body)
+        + "</body></html>"
+    )
+
+
+@pytest.fixture()
+def parser() -> SecFilingParser:
+    return SecFilingParser()
+
+
+# ---------------------------------------------------------------------------
+# Tests: parse
+# ---------------------------------------------------------------------------
+
+
+class TestParse:
+    """Test section-tagged node extraction."""
+
+    def test_sections_are_identified(self, parser: SecFilingParser) -> None:
+        """Each Item heading should start a new, correctly named section."""
+        html = _filing(("Item 1. Business", 3), ("Item 1A. Risk Factors", 3))
+        nodes = parser.parse(html, metadata={"ticker": "AAPL"})
+
+        assert [n.metadata["section_id"] for n in nodes] == ["item 1", "item 1a"]
+        assert nodes[1].metadata["section_name"] == "Risk Factors"
+        assert all(n.metadata["ticker"] == "AAPL" for n in nodes)
+        assert nodes[0].text.count(_PARAGRAPH) == 3
+
+    def test_scripts_and_short_sections_are_dropped(self, parser: SecFilingParser) -> None:
+        """Non-visible content and sections below MIN_SECTION_LENGTH are skipped."""
+        html = _filing(("Item 2. Properties", 1), ("Item 7. MD&A", 3))
+        nodes = parser.parse(html)
+
+        assert [n.metadata["section_id"] for n in nodes] == ["item 7"]
+        assert "var x" not in nodes[0].text
+
+    def test_long_sections_are_chunked(self, parser: SecFilingParser) -> None:
+        """Sections over MAX_NODE_LENGTH should be split with chunk metadata."""
+        html = _filing(("Item 7. MD&A", 120))
+        nodes = parser.parse(html)
+
+        assert len(nodes) > 1
+        assert all(len(n.text) <= parser.MAX_NODE_LENGTH for n in nodes)
+        assert [n.metadata["chunk_index"] for n in nodes] == list(range(len(nodes)))
+        assert {n.metadata["total_chunks"] for n in nodes} == {len(nodes)}
+
+    def test_parse_many_matches_parse(self, parser: SecFilingParser) -> None:
+        """Parallel parsing returns the same nodes, in input order."""
+        docs = [
+            (_filing(("Item 1. Business", 3)), {"ticker": "AAPL"}),
+            (_filing(("Item 7. MD&A", 3), ("Item 8. Statements", 3)), {"ticker": "MSFT"}),
+            (_filing(("Item 1A. Risk Factors", 3)), None),
+        ]
+        expected = [n for html, meta in docs for n in parser.parse(html, meta)]
+
+        for workers in (1, 2):
+            nodes = parser.parse_many(docs, max_workers=workers)
+            assert [(n.text, n.metadata) for n in nodes] == [
+                (n.text, n.metadata) for n in expected
+            ]
+
+    def test_iter_parse_matches_parse(self, parser: SecFilingParser) -> None:
+        """iter_parse lazily yields exactly the nodes parse returns."""
+        html = _filing(("Item 1. Business", 3), ("Item 7. MD&A", 120))
+        nodes = parser.iter_parse(html, metadata={"ticker": "AAPL"})
+
+        assert not isinstance(nodes, list)
+        assert [(n.text, n.metadata) for n in nodes] == [
+            (n.text, n.metadata) for n in parser.parse(html, metadata={"ticker": "AAPL"})
+        ]
+
+    def test_concurrent_threads(self, parser: SecFilingParser) -> None:
+        """Parsing from several threads at once gives the single-thread result."""
+        html = _filing(("Item 1. Business", 3), ("Item 7. MD&A", 40))
+        expected = [(n.text, n.metadata) for n in parser.parse(html)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(parser.parse, [html] * 8))
+
+        for nodes in results:
+            assert [(n.text, n.metadata) for n in nodes] == expected
+
+    def test_xml_declaration_and_empty_input(self, parser: SecFilingParser) -> None:
+        """Inline XBRL with an XML declaration should parse; empty input yields nothing."""
+        html = "<?xml version='1.0' encoding='ASCII'?>" + _filing(("Item 1A. Risk", 3))
+        assert [n.metadata["section_id"] for n in parser.parse(html)] == ["item 1a"]
+        assert parser.parse("") == []
+        assert parser.parse("<!-- nothing here -->") == []
+
+    def test_nested_duplicate_blocks_collapse(self, parser: SecFilingParser) -> None:
+        """A block repeated by nested wrappers is kept once; repeats later are kept."""
+        root = parser._parse_document(
+            "<div><p><b>Same</b></p></div><p>x</p><p>Other</p><div>Same</div>"
+        )
+        assert parser._extract_text_blocks(root) == ["Same", "Other", "Same"]
+
+    def test_nested_blocks_are_not_double_counted(self, parser: SecFilingParser) -> None:
+        """Inline tags join their block; nested blocks split the outer text run."""
+        root = parser._parse_document(
+            "<div>Item 7. <b>MD&amp;A</b><!-- note --><p>Revenue <i>grew</i>.</p>"
+            "Tail text</div><span>outside</span>"
+        )
+        assert parser._extract_text_blocks(root) == [
+            "Item 7. MD&A",
+            "Revenue grew .",
+            "Tail text",
+            "outside",
+        ]
+
+    def test_body_level_font_text_is_kept(self, parser: SecFilingParser) -> None:
+        """Legacy filings with text directly under <body> still yield blocks and sections."""
+        body = "Results of operations discussed at length. " * 4
+        html = (
+            "<html><head><title>10-K</title></head><body>"
+            "<center><b>ANNUAL REPORT</b></center>"
+            f"<font>Item 7. Management's Discussion and Analysis</font><br>{body}"
+            f"<table><tr><td>Net sales</td></tr></table>Bare closing text. {body}"
+            "</body></html>"
+        )
+        assert parser._extract_text_blocks(parser._parse_document(html)) == [
+            "ANNUAL REPORT",
+            "Item 7. Management's Discussion and Analysis",
+            body.strip(),
+            "Net sales",
+            f"Bare closing text. {body.strip()}",
+        ]
+        assert "item 7" in {n.metadata["section_id"] for n in parser.parse(html)}
+
+    def test_identify_section(self, parser: SecFilingParser) -> None:
+        """Item and Part headings map to known sections; unknown items do not."""
+        assert parser._identify_section("  ITEM 7A. Market Risk") == (
+            "item 7a",
+            "Quantitative and Qualitative Disclosures About Market Risk",
+        )
+        assert parser._identify_section("Part II - Other") == ("part ii", "Other Information")
+        assert parser._identify_section("Item 99. Unknown") is None
+        assert parser._identify_section("Itemized list") is None
+        assert parser._identify_section("Item 10. Directors")[0] == "item 10"
+        assert parser._identify_section("Item 1ab") is None
+        assert parser._identify_section("Part III") is None
+        # Repeated headings share one prebuilt result.
+        assert parser._identify_section("ITEM 7.") is parser._identify_section("Item 7 MD&A")
+
+    def test_split_into_sections(self, parser: SecFilingParser) -> None:
+        """Leading text is preamble; headings with no body produce no section."""
+        blocks = ["Cover", "Page", "Item 1. Business", "Item 1A. Risk", "a", "b"]
+        assert parser._split_into_sections(blocks) == [
+            ("preamble", "Preamble", "Cover\n\nPage"),
+            ("item 1a", "Risk Factors", "a\n\nb"),
+        ]
+        assert parser._split_into_sections(["Item 7"]) == []
+
+    def test_text_is_cleaned(self, parser: SecFilingParser) -> None:
+        """Non-breaking spaces, tabs, and runs of spaces should be collapsed."""
+        assert parser._clean_text(" a\xa0\xa0b\t\tc    d\n\n\n\ne ") == "a b c d\n\ne"
+
+
+# ---------------------------------------------------------------------------
+# Tests: parse_tables
+# ---------------------------------------------------------------------------
+
+
+class TestParseTables:
+    """Test structured table extraction."""
+
+    def test_header_row_from_th(self, parser: SecFilingParser) -> None:
+        """A first row of <th> cells should become the headers."""
+        html = (
+            "<p>intro</p><table>"
+            "<tr><th>Segment</th><th>Revenue</th></tr>"
+            "<tr><td>Americas</td><td><span>167,045</span></td></tr>"
+            "<tr><td>Europe</td><td>101,328</td></tr>"
+            "</table>"
+        )
+        [table] = parser.parse_tables(html)
+        assert table["headers"] == ["Segment", "Revenue"]
+        assert table["rows"] == [["Americas", "167,045"], ["Europe", "101,328"]]
+
+    def test_generated_headers_and_single_row_tables(self, parser: SecFilingParser) -> None:
+        """Tables without <th> get col_N headers; one-row tables are skipped."""
+        html = (
+            "<table><tr><td>layout</td></tr></table>"
+            "<table><tr><td>a</td><td>b</td></tr><tr><td>c</td><td>d</td></tr></table>"
+        )
+        [table] = parser.parse_tables(html)
+        assert table["headers"] == ["col_0", "col_1"]
+        assert table["rows"] == [["a", "b"], ["c", "d"]]
+
+    def test_blank_spacer_rows_are_dropped(self, parser: SecFilingParser) -> None:
+        """Rows of empty cells don't count as data or as the header row."""
+        html = (
+            "<table><tr><td>&nbsp;</td><td></td></tr>"
+            "<tr><th>Item</th><th>2024</th></tr>"
+            "<tr><td> </td><td><!-- spacer --></td></tr>"
+            "<tr><td>Net sales</td><td>391,035</td></tr></table>"
+            "<table><tr><td>only</td></tr><tr><td></td></tr></table>"
+        )
+        [table] = parser.parse_tables(html)
+        assert table["headers"] == ["Item", "2024"]
+        assert table["rows"] == [["Net sales", "391,035"]]
+
+
+# ---------------------------------------------------------------------------
+# Tests: parse_all
+# ---------------------------------------------------------------------------
+
+
+class TestParseAll:
+    """Test combined node and table extraction."""
+
+    def test_matches_separate_calls(self, parser: SecFilingParser) -> None:
+        """parse_all should return exactly what parse and parse_tables do."""
+        html = _filing(("Item 7. MD&A", 3)).replace(
+            "</body>",
+            "<table><tr><th>Year</th></tr><tr><td>2024</td></tr></table></body>",
+        )
+        nodes, tables = parser.parse_all(html, metadata={"ticker": "AAPL"})
+
+        assert [(n.text, n.metadata) for n in nodes] == [
+            (n.text, n.metadata) for n in parser.parse(html, metadata={"ticker": "AAPL"})
+        ]
+        assert tables == parser.parse_tables(html) == [{"headers": ["Year"], "rows": [["2024"]]}]
+
+    def test_empty_document(self, parser: SecFilingParser) -> None:
+        assert parser.parse_all("") == ([], [])
+        assert parser.parse_tables("") == []
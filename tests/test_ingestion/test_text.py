@@ -0,0 +1,24 @@
+"""Tests for the text helpers shared by the ingestion parsers."""
+
+from __future__ import annotations
+
+from hermes.ingestion._text import greedy_chunk
+
+
+class TestGreedyChunk:
+    """Test paragraph-boundary chunking."""
+
+    def test_short_text_is_one_chunk(self) -> None:
+        assert greedy_chunk("a\n\nb", 10) == ["a\n\nb"]
+
+    def test_paragraphs_are_packed_greedily(self) -> None:
+        """Paragraphs are joined while they fit, counting a separator after each."""
+        text = "\n\n".join(["aaaa", "bbbb", "cccc", "dd"])
+        assert greedy_chunk(text, 12) == ["aaaa\n\nbbbb", "cccc\n\ndd"]
+
+    def test_oversized_paragraph_is_hard_split(self) -> None:
+        text = "\n\n".join(["ab", "x" * 12, "cd"])
+        assert greedy_chunk(text, 5) == ["ab", "xxxxx", "xxxxx", "xx", "cd"]
+
+    def test_custom_separator(self) -> None:
+        assert greedy_chunk("aa\nbb\ncc", 6, sep="\n") == ["aa\nbb", "cc"]
@@ -0,0 +1,136 @@
+"""Tests for the earnings call transcript parser.
+
+Uses small hand-written transcripts so speaker attribution, Q&A detection,
+and chunking can be checked against exact expected output.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from hermes.ingestion.transcript_parser import TranscriptParser
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_REMARK = (
+    "Thank you. Revenue grew eleven percent year over year, driven by strong "
+    "demand across every geographic segment and product line."
+)
+
+_TRANSCRIPT = f"""Apple Inc. Q4 2024 Earnings Call
+This transcript is provided for informational purposes only and may contain errors.
+
+Operator
+Good afternoon and welcome to the call. {_REMARK}
+
+Tim Cook - Chief Executive Officer
+{_REMARK}
+
+Luca Maestri, Chief Financial Officer
+{_REMARK}
+
+Question-and-Answer Session
+
+Operator
+Our first question comes from the line of Erik Woodring.
+
+Erik Woodring - Analyst
+{_REMARK}
+
+Tim Cook - Chief Executive Officer
+{_REMARK}
+"""
+
+
+@pytest.fixture()
+def parser() -> TranscriptParser:
+    return TranscriptParser()
+
+
+# ---------------------------------------------------------------------------
+# Tests: parse
+# ---------------------------------------------------------------------------
+
+
+class TestParse:
+    """Test speaker-attributed node extraction."""
+
+    def test_speakers_and_sections(self, parser: TranscriptParser) -> None:
+        """Segments are attributed and split into prepared remarks and Q&A."""
+        nodes = parser.parse(_TRANSCRIPT, metadata={"ticker": "AAPL"})
+
+        assert [(n.metadata["speaker"], n.metadata["section"]) for n in nodes] == [
+            ("Header", "prepared_remarks"),
+            ("Operator", "prepared_remarks"),
+            ("Tim Cook", "prepared_remarks"),
+            ("Luca Maestri", "prepared_remarks"),
+            ("Operator", "q_and_a"),
+            ("Erik Woodring", "q_and_a"),
+            ("Tim Cook", "q_and_a"),
+        ]
+        assert nodes[2].metadata["speaker_role"] == "Chief Executive Officer"
+        assert nodes[5].metadata["speaker_role"] == "Analyst"
+        assert all(n.metadata["ticker"] == "AAPL" for n in nodes)
+
+    def test_no_speakers(self, parser: TranscriptParser) -> None:
+        """Text without speaker lines becomes a single Unknown segment."""
+        [node] = parser.parse(_REMARK.lower())
+        assert node.metadata["speaker"] == "Unknown"
+
+    def test_long_segments_are_chunked(self, parser: TranscriptParser) -> None:
+        """Segments over MAX_NODE_LENGTH are split with chunk metadata."""
+        body = "\n\n".join([_REMARK] * 100)
+        nodes = parser.parse(f"Tim Cook - CEO\n{body}\n")
+
+        assert len(nodes) > 1
+        assert all(len(n.text) <= parser.MAX_NODE_LENGTH for n in nodes)
+        assert [n.metadata["chunk_index"] for n in nodes] == list(range(len(nodes)))
+
+    def test_iter_parse_matches_parse(self, parser: TranscriptParser) -> None:
+        """iter_parse lazily yields exactly the nodes parse returns."""
+        nodes = parser.iter_parse(_TRANSCRIPT, metadata={"ticker": "AAPL"})
+
+        assert not isinstance(nodes, list)
+        assert [(n.text, n.metadata) for n in nodes] == [
+            (n.text, n.metadata) for n in parser.parse(_TRANSCRIPT, metadata={"ticker": "AAPL"})
+        ]
+
+    def test_parse_many_matches_parse(self, parser: TranscriptParser) -> None:
+        """Parallel parsing returns the same nodes, in input order."""
+        docs = [(_TRANSCRIPT, {"ticker": "AAPL"}), (f"Tim Cook - CEO\n{_REMARK}\n", None)]
+        expected = [n for text, meta in docs for n in parser.parse(text, meta)]
+
+        nodes = parser.parse_many(docs, max_workers=2)
+        assert [(n.text, n.metadata) for n in nodes] == [(n.text, n.metadata) for n in expected]
+        assert parser.parse_many([]) == []
+
+    def test_speaker_role_is_stripped(self, parser: TranscriptParser) -> None:
+        """Roles end at the last non-space character, even after long gaps."""
+        text = f"Tim Cook - Chief {' ' * 5000}Executive Officer \t \n{_REMARK}\n"
+        [segment] = parser._split_by_speaker(text)
+        assert segment["role"] == f"Chief {' ' * 5000}Executive Officer"
+        assert segment["text"].strip() == _REMARK
+
+
+# ---------------------------------------------------------------------------
+# Tests: _find_qa_boundary
+# ---------------------------------------------------------------------------
+
+
+class TestFindQaBoundary:
+    """Test detection of the prepared-remarks / Q&A boundary."""
+
+    def test_earliest_marker_wins(self, parser: TranscriptParser) -> None:
+        text = "intro ... Questions & Answers ... later Q&A"
+        assert parser._find_qa_boundary(text) == text.index("Questions")
+
+    def test_missing_marker(self, parser: TranscriptParser) -> None:
+        assert parser._find_qa_boundary("no boundary here " * 100) is None
+
+    def test_marker_case_is_ignored(self, parser: TranscriptParser) -> None:
+        """Markers match in any case, and the first one in the text wins."""
+        text = "x" * 20 + "ANALYST Q&A" + "x" * 40 + "q&a"
+        assert parser._find_qa_boundary(text) == 20
+        assert parser._find_qa_boundary("x" * 100 + "Question And Answer Session") == 100
@@ -8,7 +8,22 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hermes.config import HermesConfig
-from hermes.llm_providers import PROVIDER_REGISTRY, ProviderSpec, build_llm, detect_provider
+from hermes.llm_providers import (
+    _LLM_CLASS_CACHE,
+    PROVIDER_REGISTRY,
+    ProviderSpec,
+    build_llm,
+    detect_provider,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_class_cache():
+    """Drop resolved LLM classes so each test sees its own patched import."""
+    _LLM_CLASS_CACHE.clear()
+    yield
+    _LLM_CLASS_CACHE.clear()
+
 
 # ---------------------------------------------------------------------------
 # TestDetectProvider
@@ -82,7 +97,7 @@ class TestBuildLlm:
 
     def test_unknown_provider_raises(self) -> None:
         config = self._make_config()
-        with pytest.raises(ValueError, match="Unknown LLM provider"):
+        with pytest.raises(ValueError, match="Available providers: anthropic, cohere"):
             build_llm("not-a-provider", "some-model", config)
 
     def test_missing_package_raises(self) -> None:
@@ -138,6 +153,54 @@ class TestBuildLlm:
         assert call_kwargs["model"] == "o3-mini"
         assert call_kwargs["max_tokens"] == 8192
 
+    @pytest.mark.parametrize(
+        ("provider", "class_name", "model", "expected"),
+        [
+            ("groq", "Groq", " O1-preview ", "o1-preview"),
+            ("openai", "OpenAI", " GPT-4o ", "GPT-4o"),
+            ("anthropic", "Anthropic", "O3-Sonnet", "O3-Sonnet"),
+        ],
+    )
+    def test_model_id_resolution(
+        self, provider: str, class_name: str, model: str, expected: str
+    ) -> None:
+        """Only OpenAI-derived classes lowercase reasoning ids; all ids are stripped."""
+        config = self._make_config()
+        mock_cls = MagicMock()
+        mock_module = MagicMock()
+        setattr(mock_module, class_name, mock_cls)
+
+        with patch("hermes.llm_providers.importlib.import_module", return_value=mock_module):
+            build_llm(provider, model, config)
+
+        assert mock_cls.call_args[1]["model"] == expected
+
+    def test_llm_class_is_imported_once(self) -> None:
+        """Repeat builds for a provider reuse the resolved class."""
+        config = self._make_config()
+        mock_module = MagicMock()
+
+        with patch(
+            "hermes.llm_providers.importlib.import_module", return_value=mock_module
+        ) as import_module:
+            build_llm("anthropic", "claude-sonnet-4-6", config)
+            build_llm("anthropic", "claude-opus-4", config)
+
+        import_module.assert_called_once_with("llama_index.llms.anthropic")
+        assert mock_module.Anthropic.call_count == 2
+
+    def test_anthropic_prompt_caching_enabled(self) -> None:
+        """Anthropic gets cache_idx; per-call kwargs don't leak between builds."""
+        mock_module = MagicMock()
+
+        with patch("hermes.llm_providers.importlib.import_module", return_value=mock_module):
+            build_llm("anthropic", "claude-sonnet-4-6", self._make_config(llm_max_tokens=100))
+            build_llm("anthropic", "claude-sonnet-4-6", self._make_config())
+
+        first, second = (c[1] for c in mock_module.Anthropic.call_args_list)
+        assert first["cache_idx"] == second["cache_idx"] == -1
+        assert (first["max_tokens"], second["max_tokens"]) == (100, 8192)
+
     def test_xai_passes_api_base(self) -> None:
         config = self._make_config(xai_api_key="xai-key-123")
         mock_cls = MagicMock()
@@ -220,5 +283,15 @@ class TestProviderRegistry:
                 )
                 seen[prefix] = name
 
+    def test_registry_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            PROVIDER_REGISTRY["custom"] = PROVIDER_REGISTRY["openai"]  # type: ignore[index]
+
+    def test_extra_kwargs_are_read_only(self) -> None:
+        """Specs share their extra_kwargs, so none of them may be mutated."""
+        for spec in PROVIDER_REGISTRY.values():
+            with pytest.raises(TypeError):
+                spec.extra_kwargs["api_base"] = "https://example.invalid"  # type: ignore[index]
+
     def test_registry_has_ten_providers(self) -> None:
         assert len(PROVIDER_REGISTRY) == 10
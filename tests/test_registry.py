@@ -0,0 +1,66 @@
+"""Tests for the tool and agent registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from hermes.registry import Registry
+
+
+class TestToolRegistry:
+    """Test tool registration and tag lookup."""
+
+    def test_tags_are_frozen_sets(self, registry: Registry) -> None:
+        """Tags are copied into a frozenset; tag-less tools share one empty set."""
+        tags = ["sec", "filings"]
+        registry.register_tool("a", object(), tags=tags)
+        registry.register_tool("b", object())
+        registry.register_tool("c", object(), tags=[])
+        tags.append("macro")
+
+        assert registry.get_tool("a").tags == frozenset({"sec", "filings"})
+        assert registry.get_tool("b").tags is registry.get_tool("c").tags
+        assert registry.list_tools() == {"a": ["filings", "sec"], "b": [], "c": []}
+
+    def test_iter_tools_is_lazy(self, registry: Registry) -> None:
+        """iter_tools yields the stored tag sets themselves, in registration order."""
+        registry.register_tool("b", object(), tags=["macro", "fred"])
+        registry.register_tool("a", object())
+
+        tools = registry.iter_tools()
+        assert not isinstance(tools, (list, dict))
+        assert list(tools) == [("b", frozenset({"macro", "fred"})), ("a", frozenset())]
+        assert next(registry.iter_tools())[1] is registry.get_tool("b").tags
+
+    def test_find_tools_by_tag(self, registry: Registry) -> None:
+        registry.register_tool("a", object(), tags=["sec"])
+        registry.register_tool("b", object(), tags=["sec", "macro"])
+        registry.register_tool("c", object(), tags=["macro"])
+
+        assert [e.name for e in registry.find_tools_by_tag("sec")] == ["a", "b"]
+        assert registry.find_tools_by_tag("missing") == []
+
+    def test_duplicate_requires_override(self, registry: Registry) -> None:
+        registry.register_tool("a", object(), tags=["sec"])
+        with pytest.raises(KeyError, match="already registered"):
+            registry.register_tool("a", object())
+
+        registry.register_tool("a", object(), tags=["macro"], override=True)
+        assert registry.get_tool("a").tags == frozenset({"macro"})
+
+    def test_tag_index_follows_override_and_removal(self, registry: Registry) -> None:
+        """Replacing or removing a tool updates which tags find it."""
+        registry.register_tool("a", object(), tags=["sec", "macro"])
+        registry.register_tool("b", "tool b", tags=["sec"])
+        registry.register_tool("a", "new", tags=["sec", "news"], override=True)
+
+        assert [e.tool for e in registry.find_tools_by_tag("sec")] == ["new", "tool b"]
+        assert registry.find_tools_by_tag("macro") == []
+        assert [e.name for e in registry.find_tools_by_tag("news")] == ["a"]
+
+        registry.remove_tool("a")
+        assert [e.name for e in registry.find_tools_by_tag("sec")] == ["b"]
+        assert registry.find_tools_by_tag("news") == []
+
+        registry.clear()
+        assert registry.find_tools_by_tag("sec") == []
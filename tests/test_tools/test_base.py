@@ -0,0 +1,157 @@
+"""Tests for the shared request helpers in hermes.tools._base."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hermes.infra.cache import FileCache
+from hermes.tools import _base
+from hermes.tools._base import cached_request
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache(tmp_path: Path):
+    """Give each test a fresh cache."""
+    cache = FileCache(base_dir=str(tmp_path / "test_base_cache"))
+    with patch("hermes.tools._base.get_cache", return_value=cache):
+        yield
+
+
+class TestCachedRequest:
+    """Test the fetch-or-cache helper."""
+
+    async def test_second_call_is_served_from_cache(self) -> None:
+        calls = 0
+
+        async def fetch() -> bytes:
+            nonlocal calls
+            calls += 1
+            return b"payload"
+
+        assert await cached_request("ns", "k", fetch) == b"payload"
+        assert await cached_request("ns", "k", fetch) == b"payload"
+        assert calls == 1
+
+    async def test_cache_io_runs_off_the_event_loop(self) -> None:
+        """Disk reads and writes happen on the cache I/O thread."""
+        cache = _base.get_cache()
+        threads: list[str] = []
+        get, put = cache.get, cache.put
+
+        def record_get(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return get(*args, **kwargs)
+
+        def record_put(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return put(*args, **kwargs)
+
+        async def fetch() -> bytes:
+            return b"payload"
+
+        with patch.object(cache, "get", record_get), patch.object(cache, "put", record_put):
+            await cached_request("ns", "k", fetch)
+
+        assert len(threads) == 2
+        assert all(name.startswith("hermes-cache") for name in threads)
+
+    async def test_concurrent_misses_share_one_fetch(self) -> None:
+        """Callers missing on the same key wait for one in-flight fetch."""
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> bytes:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return b"payload"
+
+        waiters = [asyncio.create_task(cached_request("ns", "k", fetch)) for _ in range(5)]
+        other = asyncio.create_task(cached_request("ns", "other", fetch))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters, other) == [b"payload"] * 6
+        assert calls == 2
+        assert _base._inflight == {}
+
+    async def test_fetch_error_reaches_every_caller(self) -> None:
+        """A failed fetch raises in all waiters and is not remembered."""
+        release = asyncio.Event()
+
+        async def fail() -> bytes:
+            await release.wait()
+            raise RuntimeError("boom")
+
+        waiters = [asyncio.create_task(cached_request("ns", "k", fail)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert _base._inflight == {}
+
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self) -> None:
+        release = asyncio.Event()
+
+        async def fetch() -> bytes:
+            await release.wait()
+            return b"payload"
+
+        first = asyncio.create_task(cached_request("ns", "k", fetch))
+        second = asyncio.create_task(cached_request("ns", "k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == b"payload"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestSecHeaders:
+    """Test the shared SEC request headers."""
+
+    async def test_headers_follow_configured_user_agent(self) -> None:
+        client = MagicMock()
+        client.get = AsyncMock(return_value=MagicMock(json=lambda: {}))
+        sent: list[dict[str, str]] = []
+
+        for agent in ("first agent", "first agent", "second agent"):
+            config = MagicMock(sec_user_agent=agent)
+            with (
+                patch("hermes.tools._base.get_config", return_value=config),
+                patch("hermes.tools._base.get_http_client", return_value=client),
+            ):
+                await _base.sec_get("/api/x")
+            sent.append(client.get.call_args.kwargs["headers"])
+
+        assert [h["User-Agent"] for h in sent] == ["first agent", "first agent", "second agent"]
+        assert sent[0] is sent[1]
+
+
+class TestFredParams:
+    """Test the shared FRED query parameters."""
+
+    async def test_params_merge_without_mutating_template(self) -> None:
+        client = MagicMock()
+        client.get = AsyncMock(return_value=MagicMock(json=lambda: {}))
+        config = MagicMock(fred_api_key="fred-key")
+        sent: list[dict[str, str]] = []
+
+        with (
+            patch("hermes.tools._base.get_config", return_value=config),
+            patch("hermes.tools._base.get_http_client", return_value=client),
+        ):
+            for params in (None, {"series_id": "GDP", "file_type": "xml"}, None):
+                await _base.fred_get("/fred/series", params)
+                sent.append(client.get.call_args.kwargs["params"])
+
+        assert sent[1] == {"api_key": "fred-key", "file_type": "xml", "series_id": "GDP"}
+        assert sent[0] is sent[2]
+        assert sent[0] == {"api_key": "fred-key", "file_type": "json"}
@@ -0,0 +1,205 @@
+"""Tests for the matplotlib chart tools.
+
+Charts are rendered for real into a temporary output directory; only the
+config lookup is patched.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import matplotlib
+import pytest
+
+from hermes.config import HermesConfig
+from hermes.tools import charts
+
+
+@pytest.fixture(autouse=True)
+def _chart_output(hermes_config: HermesConfig) -> Generator[Path, None, None]:
+    """Send chart output to the test config's temporary directory."""
+    with patch("hermes.tools.charts.get_config", return_value=hermes_config):
+        yield Path(hermes_config.output_dir)
+
+
+@pytest.fixture(autouse=True)
+def _empty_figure_pool() -> Generator[None, None, None]:
+    """Start and finish each test with no pooled figures."""
+    charts._FIG_POOL.clear()
+    yield
+    charts._FIG_POOL.clear()
+
+
+class TestFigurePool:
+    """Test that figures are reused between charts without leaking state."""
+
+    def test_figure_is_reused_and_cleared(self) -> None:
+        """A pooled heatmap figure comes back with one fresh axes, no colorbar."""
+        size = (8, 6)
+        charts.chart_heatmap("Sensitivity", [[1.0, 2.0], [3.0, 4.0]], ["a", "b"], ["x", "y"])
+        [(pooled, _)] = charts._FIG_POOL[size]
+        fig, ax = charts._acquire_fig(size)
+        try:
+            assert fig is pooled
+            assert fig.axes == [ax]
+            assert not ax.has_data()
+            assert not ax.get_title()
+        finally:
+            charts._release_fig(fig)
+
+    def test_pool_is_bounded(self) -> None:
+        figs = [charts._acquire_fig((4, 3))[0] for _ in range(charts._FIG_POOL_MAX + 2)]
+        for fig in figs:
+            charts._release_fig(fig)
+
+        assert sum(map(len, charts._FIG_POOL.values())) == charts._FIG_POOL_MAX
+
+
+class TestStyle:
+    """Test that charts use the registered "hermes" style."""
+
+    def test_style_is_applied_when_drawing(self) -> None:
+        charts._use_hermes_style.cache_clear()
+        with matplotlib.rc_context():
+            matplotlib.rcParams["axes.titlesize"] = 10
+            fig, _ = charts._acquire_fig((4, 3))
+            charts._release_fig(fig)
+
+            assert matplotlib.rcParams["axes.titlesize"] == 14
+        assert matplotlib.style.library["hermes"] is charts._HERMES_STYLE
+
+
+class TestKernels:
+    """Test the numeric preparation shared by the chart tools."""
+
+    def test_waterfall_layout(self) -> None:
+        bottoms, heights, rising = charts._waterfall_layout([10, -4, 6, 0])
+
+        assert bottoms.tolist() == [0, 6, 6, 0]
+        assert heights.tolist() == [10, 4, 6, 12]
+        assert rising.tolist() == [True, False, True]
+
+    def test_waterfall_layout_total_only(self) -> None:
+        bottoms, heights, rising = charts._waterfall_layout([5])
+
+        assert (bottoms.tolist(), heights.tolist(), rising.tolist()) == ([0], [0], [])
+
+
+class TestCharts:
+    """Test that each chart type renders to a PNG file."""
+
+    def test_line_chart_with_rotated_labels(self, _chart_output: Path) -> None:
+        path = charts.chart_line(
+            "Revenue", list(range(12)), {"A": list(range(12)), "B": list(range(12))},
+            filename="line",
+        )
+        assert Path(path) == (_chart_output / "line.png").resolve()
+        assert Path(path).stat().st_size > 0
+
+    def test_png_keeps_figure_size(self) -> None:
+        """The PNG keeps the figure's own size, with no tight-bbox crop."""
+        path = charts.chart_bar("Sizes", ["a", "b"], {"s": [1.0, 2.0]})
+        header = Path(path).read_bytes()[16:24]
+
+        assert int.from_bytes(header[:4], "big") == 12 * charts.CHART_DPI
+        assert int.from_bytes(header[4:], "big") == 6 * charts.CHART_DPI
+
+    def test_dpi_opt_in(self) -> None:
+        path = charts.chart_waterfall("Print", ["a", "Total"], [1.0, 0.0], dpi=200)
+        header = Path(path).read_bytes()[16:24]
+
+        assert int.from_bytes(header[:4], "big") == 12 * 200
+
+    def test_bar_series_are_offset_within_each_group(self) -> None:
+        fig, ax = charts._acquire_fig((12, 6))
+        charts._draw_bar(fig, ax, "Grouped", ["a", "b"], {"s1": [1, 2], "s2": [3, 4]}, "", "")
+
+        bars = [(round(b.get_x() + b.get_width() / 2, 2), b.get_height()) for b in ax.patches]
+        assert bars == [(-0.2, 1), (0.8, 2), (0.2, 3), (1.2, 4)]
+        assert [t.get_text() for t in ax.get_legend().get_texts()] == ["s1", "s2"]
+
+    def test_waterfall_chart(self) -> None:
+        path = charts.chart_waterfall("Bridge", ["Start", "Up", "Down", "End"], [100, 20, -5, 0])
+        assert Path(path).suffix == ".png"
+        assert Path(path).exists()
+
+    def test_waterfall_bar_geometry(self) -> None:
+        """Steps float on the running total; the last bar is the total from zero."""
+        fig, ax = charts._acquire_fig((12, 6))
+        charts._draw_waterfall(fig, ax, "Bridge", ["Start", "Up", "Down", "End"], [100, 20, -5, 0])
+
+        assert [(b.get_y(), b.get_height()) for b in ax.patches] == [
+            (0, 100), (100, 20), (115, 5), (0, 115),
+        ]
+        assert [t.get_text() for t in ax.texts] == ["+100", "+20", "-5", "115"]
+
+    def test_heatmap_annotations(self) -> None:
+        """Only labelled cells are annotated; outliers get white text."""
+        data = [[0.0, 0.0, 0.0], [0.0, 9.0, 0.0]]
+        fig, ax = charts._acquire_fig((8, 6))
+        charts._draw_heatmap(fig, ax, "Grid", data, ["r0", "r1"], ["c0", "c1"])
+
+        assert [(t.get_text(), t.get_color()) for t in ax.texts] == [
+            ("0.00", "black"), ("0.00", "black"), ("0.00", "black"), ("9.00", "white"),
+        ]
+
+    def test_charts_render_from_worker_threads(self) -> None:
+        """Without pyplot's global state, charts can be drawn concurrently."""
+
+        def draw(i: int) -> str:
+            return charts.chart_bar(f"Chart {i}", ["a", "b"], {"s": [1.0, 2.0]}, filename=f"c{i}")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = list(executor.map(draw, range(8)))
+
+        assert len(set(paths)) == 8
+        assert all(Path(p).stat().st_size > 0 for p in paths)
+
+
+class TestChartPool:
+    """Test that overlapping renders are handed to the worker pool."""
+
+    def test_lone_chart_renders_inline(self) -> None:
+        with patch("hermes.tools.charts._get_chart_pool") as get_pool:
+            charts.chart_bar("Inline", ["a"], {"s": [1.0]})
+
+        get_pool.assert_not_called()
+
+    def test_overlapping_chart_renders_inline_by_default(self) -> None:
+        """Without chart_workers, no process pool is started even for overlapping charts."""
+        draw_line = charts._draw_line
+
+        def draw_with_nested_chart(*args: object) -> None:
+            charts.chart_bar("Nested", ["a"], {"s": [1.0]}, filename="n")
+            draw_line(*args)
+
+        with (
+            patch("hermes.tools.charts._draw_line", draw_with_nested_chart),
+            patch("hermes.tools.charts._get_chart_pool") as get_pool,
+        ):
+            charts.chart_line("Outer", [0, 1], {"y": [0, 1]}, filename="o")
+
+        get_pool.assert_not_called()
+
+    def test_overlapping_chart_uses_pool(
+        self, _chart_output: Path, hermes_config: HermesConfig
+    ) -> None:
+        """A chart requested while another renders is saved by a worker process."""
+        hermes_config.chart_workers = 2
+        inner: list[str] = []
+        draw_line = charts._draw_line
+
+        def draw_with_nested_chart(*args: object) -> None:
+            inner.append(charts.chart_bar("Nested", ["a", "b"], {"s": [1.0, 2.0]}, filename="n"))
+            draw_line(*args)
+
+        with patch("hermes.tools.charts._draw_line", draw_with_nested_chart):
+            outer = charts.chart_line("Outer", [0, 1], {"y": [0, 1]}, filename="o")
+
+        assert charts._chart_pool is not None
+        assert inner == [str((_chart_output / "n.png").resolve())]
+        assert Path(inner[0]).stat().st_size > 0
+        assert Path(outer).stat().st_size > 0
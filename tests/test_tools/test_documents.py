@@ -6,11 +6,27 @@ their contents using python-docx.  No mocking of document functionality.
 
 from __future__ import annotations
 
+import gc
+import io
+import os
+import subprocess
+import threading
 import zipfile
+from collections.abc import Generator
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
 from docx.shared import Pt
+from PIL import Image
+
+from hermes.config import HermesConfig
+from hermes.tools import documents
 
 # ---------------------------------------------------------------------------
 # Helpers -- these exercise the same operations the document tools will
@@ -290,3 +306,787 @@ class TestSaveToDisk:
         assert len(doc2.paragraphs) >= 4  # headings + paragraphs
         assert len(doc2.tables) == 1
         assert doc2.tables[0].cell(1, 0).text == "Revenue"
+
+    def test_python_docx_writer_internals_exist(self) -> None:
+        """_save_docx relies on these private helpers; fail loudly if they go away."""
+        from docx.opc.pkgwriter import PackageWriter
+
+        for name in ("_write_content_types_stream", "_write_pkg_rels", "_write_parts"):
+            assert callable(getattr(PackageWriter, name, None)), name
+
+    def test_images_are_stored_uncompressed(self, tmp_output_dir: Path) -> None:
+        """Already-compressed media is not deflated again; XML parts still are."""
+        image = tmp_output_dir / "chart.png"
+        Image.new("RGB", (300, 150), "navy").save(image)
+        doc = Document()
+        doc.add_paragraph("Chart below")
+        doc.add_picture(str(image))
+        path = tmp_output_dir / "stored.docx"
+
+        documents._save_docx(doc, path)
+
+        with zipfile.ZipFile(path) as zf:
+            methods = {info.filename: info.compress_type for info in zf.infolist()}
+        assert methods["word/media/image1.png"] == zipfile.ZIP_STORED
+        assert {m for n, m in methods.items() if n.endswith((".xml", ".rels"))} == {
+            zipfile.ZIP_DEFLATED
+        }
+        reloaded = Document(str(path))
+        assert reloaded.paragraphs[0].text == "Chart below"
+        assert len(reloaded.inline_shapes) == 1
+
+    async def test_save_async_writes_the_same_package(self, hermes_config: HermesConfig) -> None:
+        """doc_save_async writes the same parts as doc_save."""
+        with (
+            patch("hermes.tools.documents.get_config", return_value=hermes_config),
+            patch.object(documents, "_documents", documents._DocumentStore()),
+        ):
+            documents._documents["memo"] = doc = Document()
+            doc.add_paragraph("Saved off the event loop")
+
+            sync_path = Path(documents.doc_save("memo", "sync"))
+            async_path = Path(await documents.doc_save_async("memo", "async"))
+
+        assert async_path == sync_path.with_name("async.docx")
+        with zipfile.ZipFile(sync_path) as a, zipfile.ZipFile(async_path) as b:
+            assert {n: a.read(n) for n in a.namelist()} == {n: b.read(n) for n in b.namelist()}
+
+
+class TestDocumentStore:
+    """Test the bounded in-memory store behind the doc_* tools."""
+
+    def test_cold_documents_spill_and_reload(self, hermes_config: HermesConfig) -> None:
+        """Beyond max_open, the LRU document goes to disk and comes back intact."""
+        store = documents._DocumentStore(max_open=2)
+        with patch("hermes.tools.documents.get_config", return_value=hermes_config):
+            for name in ("a", "b", "c"):
+                doc = Document()
+                doc.add_paragraph(f"body {name}")
+                store[name] = doc
+
+            assert list(store._open) == ["b", "c"]
+            spill_path = store._spilled["a"]
+            with zipfile.ZipFile(spill_path) as zf:
+                assert {i.compress_type for i in zf.infolist()} == {zipfile.ZIP_STORED}
+            assert store.keys() == ["b", "c", "a"]
+
+            reloaded = store["a"]
+
+            assert reloaded.paragraphs[0].text == "body a"
+            assert not spill_path.exists()
+            assert list(store._open) == ["c", "a"]
+            assert "b" in store._spilled
+
+        store.clear()
+        assert store.keys() == []
+        assert not any(Path(hermes_config.cache_dir).rglob("*.docx"))
+
+    def test_scratch_directory_is_removed_with_the_store(
+        self, hermes_config: HermesConfig
+    ) -> None:
+        """Spilled files do not outlive the store that wrote them."""
+        store = documents._DocumentStore(max_open=1)
+        with patch("hermes.tools.documents.get_config", return_value=hermes_config):
+            store["a"] = Document()
+            store["b"] = Document()
+        scratch = store._spilled["a"].parent
+        assert scratch.is_dir()
+
+        del store
+        gc.collect()
+
+        assert not scratch.exists()
+
+    def test_default_bound_comes_from_config(self, hermes_config: HermesConfig) -> None:
+        store = documents._DocumentStore()
+        hermes_config.max_open_documents = 1
+        with patch("hermes.tools.documents.get_config", return_value=hermes_config):
+            store["a"] = Document()
+            store["b"] = Document()
+
+            assert list(store._open) == ["b"]
+            assert list(store._spilled) == ["a"]
+            store.clear()
+
+    def test_documents_in_use_are_not_spilled(self, hermes_config: HermesConfig) -> None:
+        """A document another tool opens mid-edit cannot spill the one being edited."""
+        store = documents._DocumentStore(max_open=1)
+        with (
+            patch("hermes.tools.documents.get_config", return_value=hermes_config),
+            patch.object(documents, "_documents", store),
+        ):
+            store["a"] = Document()
+            with documents._use_document("a") as doc:
+                store["b"] = Document()  # e.g. a parallel doc_create
+                doc.add_paragraph("written after the other document opened")
+                assert list(store._open) == ["a", "b"]
+
+            store["c"] = Document()
+            assert "a" in store._spilled
+            assert "written after the other document opened" in documents.doc_read("a")
+            assert store._pins == {}
+            store.clear()
+
+    def test_unknown_document_lists_available(self) -> None:
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["known"] = Document()
+            with pytest.raises(ValueError, match=r"Available: \['known'\]"):
+                with documents._use_document("missing"):
+                    pass
+
+
+class TestDocAddTableTool:
+    """Test the doc_add_table tool's direct XML cell writes."""
+
+    def test_header_with_line_break_is_bold(self) -> None:
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = Document()
+            documents.doc_add_table("doc", ["FY2024\n(USD m)", "Growth"], [])
+            table = documents._documents["doc"].tables[0]
+
+        runs = [r for c in table.rows[0].cells for r in c.paragraphs[0].runs]
+        assert [(r.text, r.bold) for r in runs] == [("FY2024\n(USD m)", True), ("Growth", True)]
+        # rPr comes first so Word accepts the run, and python-docx can still edit it.
+        assert runs[0]._r[0] is runs[0]._r.rPr
+        runs[0].italic = True
+        assert runs[0].italic
+
+    def test_cells_match_python_docx_output(self, tmp_output_dir: Path) -> None:
+        """Text, header bolding, spacing and line breaks survive a save/load round trip."""
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = Document()
+            documents.doc_add_table(
+                "doc",
+                ["Metric", "FY2024"],
+                [["Revenue", 391035, "extra"], [" padded ", "a\tb\nc"], ["short"]],
+            )
+            path = tmp_output_dir / "table.docx"
+            documents._documents["doc"].save(str(path))
+
+        table = Document(str(path)).tables[0]
+        assert [[c.text for c in row.cells] for row in table.rows] == [
+            ["Metric", "FY2024"],
+            ["Revenue", "391035"],
+            [" padded ", "a\tb\nc"],
+            ["short", ""],
+        ]
+        header_runs = [r for c in table.rows[0].cells for r in c.paragraphs[0].runs]
+        assert [r.bold for r in header_runs] == [True, True]
+        assert all(r.bold is None for r in table.rows[1].cells[0].paragraphs[0].runs)
+        assert all(len(c.paragraphs) == 1 for row in table.rows for c in row.cells)
+
+    def test_table_markup(self) -> None:
+        """A full-width fixed-layout table on an even grid, placed before the sectPr."""
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            doc = documents._documents["doc"] = Document()
+            documents.doc_add_table("doc", ["A", "B", "C"], [["x & <y>"]], style="No Such Style")
+
+        tbl = doc.tables[0]._tbl
+        widths = tbl.tblPr.iterchildren(qn("w:tblW"))
+        assert [(w.get(qn("w:type")), w.get(qn("w:w"))) for w in widths] == [("pct", "5000")]
+        assert tbl.tblPr.find(qn("w:tblLayout")).get(qn("w:type")) == "fixed"
+        assert not doc.tables[0].autofit
+        assert len({col.w for col in tbl.tblGrid.gridCol_lst}) == 1
+        assert doc.element.body[-1].tag == qn("w:sectPr")
+        assert doc.tables[0].cell(1, 0).text == "x & <y>"
+
+    def test_append_table_without_python_docx_internals(self) -> None:
+        """If python-docx's private helpers vanish, the public API builds the same table."""
+
+        class PublicOnly:
+            def __init__(self, doc: Document) -> None:
+                self._doc = doc
+
+            def __getattr__(self, name: str) -> object:
+                if name.startswith("_"):
+                    raise AttributeError(name)
+                return getattr(self._doc, name)
+
+        doc = Document()
+        table = documents._append_table(PublicOnly(doc), ["A", "B"], [["1", "2", "3"], ["4"]])
+
+        assert table._tbl is doc.tables[0]._tbl
+        assert [[c.text for c in row.cells] for row in table.rows] == [
+            ["A", "B"],
+            ["1", "2"],
+            ["4", ""],
+        ]
+        assert [r.bold for c in table.rows[0].cells for r in c.paragraphs[0].runs] == [True, True]
+        assert not table.autofit
+
+    def test_edit_cell_replaces_content(self) -> None:
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = Document()
+            documents.doc_add_table("doc", ["Metric", "FY2024"], [["Revenue", "391"]])
+            documents.doc_edit_table_cell("doc", 1, 2, 2, "  395 ")
+            with pytest.raises(ValueError, match=r"col_index 3 out of range \(1\.\.2\)"):
+                documents.doc_edit_table_cell("doc", 1, 2, 3, "x")
+            table = documents._documents["doc"].tables[0]
+
+        cell = table.cell(1, 1)
+        assert cell.text == "  395 "
+        assert len(cell.paragraphs) == 1
+        assert cell._tc.tcPr is not None
+
+    def test_bulk_table_from_dataframe(self) -> None:
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame({"Metric": ["Revenue", "EPS"], "FY2024": [391035, 6.08]})
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            doc = documents._documents["doc"] = Document()
+            assert documents.doc_add_table_bulk("doc", frame) == "Added 2x2 table."
+
+        assert [[c.text for c in row.cells] for row in doc.tables[0].rows] == [
+            ["Metric", "FY2024"],
+            ["Revenue", "391035.0"],
+            ["EPS", "6.08"],
+        ]
+
+    def test_bulk_table_from_array_needs_headers(self) -> None:
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            doc = documents._documents["doc"] = Document()
+            with pytest.raises(ValueError, match="headers are required"):
+                documents.doc_add_table_bulk("doc", np.eye(2))
+            with pytest.raises(ValueError, match="two-dimensional"):
+                documents.doc_add_table_bulk("doc", np.arange(3), headers=["a"])
+            documents.doc_add_table_bulk("doc", np.eye(2, dtype=int), headers=["a", "b"])
+
+        assert doc.tables[0].cell(1, 0).text == "1"
+
+
+class TestDocReadTool:
+    """Test the structured text view returned by doc_read."""
+
+    def test_blocks_are_indexed_and_typed(self) -> None:
+        doc = Document()
+        doc.add_heading("Summary", level=2)
+        doc.add_paragraph("")
+        para = doc.add_paragraph("Visit ")
+        # Text inside a hyperlink is nested below the paragraph, not a direct run.
+        para._p.append(
+            parse_xml(f"<w:hyperlink {nsdecls('w')}><w:r><w:t>our site</w:t></w:r></w:hyperlink>")
+        )
+        table = doc.add_table(rows=2, cols=2)
+        for cell, text in zip(table._cells, ["Metric", "FY24", "Revenue", "391"], strict=True):
+            cell.text = text
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = doc
+            assert documents.doc_read("doc").splitlines() == [
+                "[1] [HEADING 2] Summary",
+                "[3] [PARA] Visit our site",
+                "[4] [TABLE 1: 2x2]",
+                "  [r1] Metric | FY24",
+                "  [r2] Revenue | 391",
+            ]
+
+    def test_indices_count_every_body_child(self) -> None:
+        """A content control between paragraphs keeps [N] in step with doc_edit_paragraph."""
+        doc = Document()
+        doc.add_paragraph("Intro")
+        doc.element.body.insert(1, parse_xml(f"<w:sdt {nsdecls('w')}/>"))
+        doc.add_paragraph("Body")
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = doc
+            assert documents.doc_read("doc").splitlines()[-1] == "[3] [PARA] Body"
+            documents.doc_edit_paragraph("doc", 3, "Edited")
+
+        assert doc.paragraphs[1].text == "Edited"
+
+    def test_edit_paragraph_keeps_style(self) -> None:
+        doc = Document()
+        doc.add_heading("Draft title", level=1)
+        doc.add_table(rows=1, cols=1)
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = doc
+            documents.doc_edit_paragraph("doc", 1, " Final title ")
+            with pytest.raises(ValueError, match="Block 2 is a 'tbl'"):
+                documents.doc_edit_paragraph("doc", 2, "x")
+
+        assert doc.paragraphs[0].text == " Final title "
+        assert doc.paragraphs[0].style.name == "Heading 1"
+        assert len(doc.paragraphs[0].runs) == 1
+
+    def test_edit_paragraph_replaces_hyperlink_text(self) -> None:
+        """Runs nested in a hyperlink are replaced along with the direct runs."""
+        doc = Document()
+        para = doc.add_paragraph("See ")
+        link = f"<w:hyperlink {nsdecls('w')}><w:r><w:t>the filing</w:t></w:r></w:hyperlink>"
+        para._p.append(parse_xml(link))
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = doc
+            documents.doc_edit_paragraph("doc", 1, "Updated")
+
+        assert documents._text_of(para._p) == "Updated"
+
+
+class TestDocAddImageTool:
+    """Test that oversized images are downsampled before embedding."""
+
+    def _embedded_sizes(self, doc: Document, path: Path) -> list[tuple[int, int]]:
+        doc.save(str(path))
+        with zipfile.ZipFile(path) as zf:
+            media = [n for n in zf.namelist() if n.startswith("word/media/")]
+            return [Image.open(io.BytesIO(zf.read(n))).size for n in media]
+
+    def test_large_image_is_downsampled(self, tmp_output_dir: Path) -> None:
+        big = tmp_output_dir / "big.png"
+        small = tmp_output_dir / "small.png"
+        Image.new("RGB", (3000, 1500), "navy").save(big)
+        Image.new("RGB", (600, 300), "navy").save(small)
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = Document()
+            documents.doc_add_image("doc", str(big), width_inches=6.0)
+            documents.doc_add_image("doc", str(small), width_inches=6.0)
+            sizes = self._embedded_sizes(documents._documents["doc"], tmp_output_dir / "i.docx")
+
+        assert sorted(sizes) == [(600, 300), (900, 450)]
+
+    def test_resample_is_cached_until_file_changes(self, tmp_output_dir: Path) -> None:
+        big = tmp_output_dir / "chart.png"
+        Image.new("RGB", (2000, 1000), "white").save(big)
+        args = (str(big), big.stat().st_mtime_ns, 300)
+
+        first = documents._prepared_image(*args)
+        assert documents._prepared_image(*args) is first
+        assert Image.open(io.BytesIO(first)).size == (300, 150)
+        assert documents._prepared_image(str(big), args[1] + 1, 300) is not first
+
+    def test_small_image_bytes_are_cached_unchanged(self, tmp_output_dir: Path) -> None:
+        small = tmp_output_dir / "small.png"
+        Image.new("RGB", (200, 100), "white").save(small)
+        args = (str(small), small.stat().st_mtime_ns, 900)
+
+        blob = documents._prepared_image(*args)
+
+        assert blob == small.read_bytes()
+        assert documents._prepared_image(*args) is blob
+
+    def test_exif_rotated_photo_is_resized_upright(self, tmp_output_dir: Path) -> None:
+        photo = tmp_output_dir / "photo.jpg"
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Stored landscape, displayed portrait.
+        Image.new("RGB", (2000, 1000), "white").save(photo, exif=exif)
+
+        blob = documents._prepared_image(str(photo), photo.stat().st_mtime_ns, 300)
+
+        with Image.open(io.BytesIO(blob)) as im:
+            assert im.size == (300, 600)
+            assert im.getexif().get(0x0112, 1) == 1
+
+    def test_decompression_bomb_falls_back_to_original(self, tmp_output_dir: Path) -> None:
+        big = tmp_output_dir / "bomb.png"
+        Image.new("RGB", (2000, 1000), "white").save(big)
+
+        with patch.object(Image, "MAX_IMAGE_PIXELS", 1000):
+            blob = documents._prepared_image(str(big), big.stat().st_mtime_ns, 300)
+
+        assert blob == big.read_bytes()
+
+    def test_repeated_image_shares_one_part(self, tmp_output_dir: Path) -> None:
+        """Embedding the same chart twice references a single media part."""
+        chart = tmp_output_dir / "chart.png"
+        Image.new("RGB", (600, 300), "navy").save(chart)
+
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = doc = Document()
+            documents.doc_add_image("doc", str(chart), width_inches=4.0)
+            documents.doc_add_image("doc", str(chart), width_inches=6.0)
+            sizes = self._embedded_sizes(doc, tmp_output_dir / "twice.docx")
+
+        blips = doc.element.body.xpath(".//a:blip/@r:embed")
+        assert len(blips) == 2
+        assert len(set(blips)) == 1
+        assert sizes == [(600, 300)]
+
+    def test_missing_image_is_reported(self, tmp_output_dir: Path) -> None:
+        with patch.object(documents, "_documents", documents._DocumentStore()):
+            documents._documents["doc"] = Document()
+            with pytest.raises(FileNotFoundError, match="Image not found: .*gone.png"):
+                documents.doc_add_image("doc", str(tmp_output_dir / "gone.png"))
+
+
+class TestExportPdf:
+    """Test the choice between the conversion server and the one-shot CLI."""
+
+    @pytest.fixture(autouse=True)
+    def _config(self, hermes_config: HermesConfig) -> Generator[None, None, None]:
+        """Keep the PDF cache in the test's temporary cache directory."""
+        with patch("hermes.tools.documents.get_config", return_value=hermes_config):
+            yield
+
+    def test_server_conversion_skips_cli(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+
+        def fake_server(docx: Path, target_dir: Path) -> bool:
+            (target_dir / "report.pdf").write_bytes(b"%PDF")
+            return True
+
+        server = MagicMock(side_effect=fake_server)
+        with (
+            patch.object(documents._libreoffice, "convert_to_pdf", server),
+            patch("hermes.tools.documents.subprocess.run") as run,
+        ):
+            pdf = documents.doc_export_pdf(str(docx_file))
+
+        server.assert_called_once()
+        assert server.call_args.args[0] == docx_file
+        assert server.call_args.args[1].parent == tmp_output_dir
+        run.assert_not_called()
+        assert pdf == str((tmp_output_dir / "report.pdf").resolve())
+
+    async def test_async_export_runs_on_pdf_pool(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+        threads: list[str] = []
+
+        def fake_server(docx: Path, target_dir: Path) -> bool:
+            threads.append(threading.current_thread().name)
+            (target_dir / "report.pdf").write_bytes(b"%PDF")
+            return True
+
+        with patch.object(documents._libreoffice, "convert_to_pdf", side_effect=fake_server):
+            pdf = await documents.doc_export_pdf_async(str(docx_file))
+
+        assert threads[0].startswith("hermes-pdf")
+        assert Path(pdf).read_bytes() == b"%PDF"
+
+    def test_falls_back_to_cli_without_unoserver(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+
+        def fake_cli(cmd: list[str], **kwargs: object) -> MagicMock:
+            (Path(cmd[cmd.index("--outdir") + 1]) / "report.pdf").write_bytes(b"%PDF")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with (
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch("hermes.tools.documents.subprocess.run", side_effect=fake_cli) as run,
+        ):
+            pdf = documents.doc_export_pdf(str(docx_file))
+
+        assert run.call_args.args[0][0] == "libreoffice"
+        assert Path(pdf).read_bytes() == b"%PDF"
+
+    def test_uno_bindings_drive_soffice_without_unoserver(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+        desktop = MagicMock()
+        loaded = desktop.loadComponentFromURL.return_value
+        loaded.storeToURL.side_effect = lambda url, props: Path(url[7:]).write_bytes(b"%PDF")
+        fake_uno = MagicMock(systemPathToFileUrl=lambda path: f"file://{path}")
+
+        with (
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch.object(documents._libreoffice, "uno", fake_uno),
+            patch.object(documents._libreoffice, "PropertyValue", MagicMock(), create=True),
+            patch.object(documents._libreoffice, "_ensure_desktop", return_value=desktop),
+            patch("hermes.tools.documents.subprocess.run") as run,
+        ):
+            pdf = documents.doc_export_pdf(str(docx_file))
+
+        run.assert_not_called()
+        assert desktop.loadComponentFromURL.call_args.args[0] == f"file://{docx_file.resolve()}"
+        loaded.close.assert_called_once_with(True)
+        assert Path(pdf).read_bytes() == b"%PDF"
+
+    @pytest.fixture
+    def fake_soffice(self, tmp_path: Path) -> Generator[SimpleNamespace, None, None]:
+        """Stand in for LibreOffice's uno module and the soffice process it connects to."""
+
+        class NoConnectError(Exception):
+            pass
+
+        desktop = MagicMock()
+        loaded = desktop.loadComponentFromURL.return_value
+        loaded.storeToURL.side_effect = lambda url, props: Path(url[7:]).write_bytes(b"%PDF")
+        remote_ctx = MagicMock()
+        remote_ctx.ServiceManager.createInstanceWithContext.return_value = desktop
+        resolver = MagicMock()
+        resolver.resolve.side_effect = [NoConnectError(), remote_ctx]
+        fake_uno = MagicMock(systemPathToFileUrl=lambda path: f"file://{path}")
+        local_ctx = fake_uno.getComponentContext.return_value
+        local_ctx.ServiceManager.createInstanceWithContext.return_value = resolver
+        popen = MagicMock()
+        popen.return_value.poll.return_value = None
+        profile = tmp_path / "profile"
+        profile.mkdir()
+
+        def which(name: str) -> str | None:
+            return "/usr/bin/soffice" if name == "soffice" else None
+
+        lo = documents._libreoffice
+        with (
+            patch.object(lo.shutil, "which", which),
+            patch.object(lo, "uno", fake_uno),
+            patch.object(lo, "PropertyValue", MagicMock(), create=True),
+            patch.object(lo, "NoConnectException", NoConnectError, create=True),
+            patch.object(lo.subprocess, "Popen", popen),
+            patch.object(lo.tempfile, "mkdtemp", return_value=str(profile)),
+            patch.object(lo.time, "sleep"),
+        ):
+            yield SimpleNamespace(
+                popen=popen, resolver=resolver, remote_ctx=remote_ctx, profile=profile
+            )
+            lo._stop_soffice()
+
+    def test_soffice_runs_with_a_private_profile(
+        self, tmp_output_dir: Path, fake_soffice: SimpleNamespace
+    ) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+
+        assert documents._libreoffice.convert_to_pdf(docx_file, tmp_output_dir)
+
+        argv = fake_soffice.popen.call_args.args[0]
+        assert f"-env:UserInstallation={fake_soffice.profile.as_uri()}" in argv
+        assert fake_soffice.resolver.resolve.call_count == 2
+        assert (tmp_output_dir / "report.pdf").read_bytes() == b"%PDF"
+        documents._libreoffice._stop_soffice()
+        assert not fake_soffice.profile.exists()
+
+    @pytest.mark.parametrize("failure", ["popen", "resolve", "desktop"])
+    def test_soffice_start_up_errors_fall_back(
+        self, tmp_output_dir: Path, fake_soffice: SimpleNamespace, failure: str
+    ) -> None:
+        """Errors while starting soffice report False instead of escaping to the caller."""
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+        if failure == "popen":
+            fake_soffice.popen.side_effect = OSError("exec format error")
+        elif failure == "resolve":
+            fake_soffice.resolver.resolve.side_effect = RuntimeError("bridge failed")
+        else:
+            remote = fake_soffice.remote_ctx.ServiceManager
+            remote.createInstanceWithContext.side_effect = RuntimeError("no desktop")
+
+        assert not documents._libreoffice.convert_to_pdf(docx_file, tmp_output_dir)
+        assert documents._libreoffice._soffice is None
+        assert not fake_soffice.profile.exists()
+
+    @pytest.fixture
+    def fake_unoserver(self) -> Generator[SimpleNamespace, None, None]:
+        """Stand in for the unoserver/unoconvert executables and the server port."""
+        popen = MagicMock()
+        popen.return_value.poll.return_value = None
+        port_open = MagicMock(side_effect=[False, True])
+
+        lo = documents._libreoffice
+        with (
+            patch.object(lo.shutil, "which", lambda name: f"/usr/bin/{name}"),
+            patch.object(lo.subprocess, "Popen", popen),
+            patch.object(lo.subprocess, "run") as run,
+            patch.object(lo, "_port_open", port_open),
+            patch.object(lo.time, "sleep"),
+        ):
+            yield SimpleNamespace(popen=popen, run=run, port_open=port_open)
+            lo._stop_server()
+
+    @pytest.mark.parametrize(
+        "error", [subprocess.TimeoutExpired("unoconvert", 120), OSError("no such file")]
+    )
+    def test_unoconvert_failure_stops_the_server(
+        self, tmp_output_dir: Path, fake_unoserver: SimpleNamespace, error: Exception
+    ) -> None:
+        fake_unoserver.run.side_effect = error
+
+        assert not documents._libreoffice.convert_to_pdf(
+            tmp_output_dir / "report.docx", tmp_output_dir
+        )
+        fake_unoserver.popen.return_value.terminate.assert_called_once()
+        assert documents._libreoffice._server is None
+
+    def test_timeout_leaves_a_replaced_server_running(
+        self, tmp_output_dir: Path, fake_unoserver: SimpleNamespace
+    ) -> None:
+        """A hung call only stops the server it used, not one another thread started since."""
+        lo = documents._libreoffice
+        replacement = MagicMock()
+
+        def hang_after_restart(*args: object, **kwargs: object) -> None:
+            lo._server = replacement  # Another export thread restarted the server.
+            raise subprocess.TimeoutExpired("unoconvert", 120)
+
+        fake_unoserver.run.side_effect = hang_after_restart
+
+        assert not lo.convert_to_pdf(tmp_output_dir / "report.docx", tmp_output_dir)
+        replacement.terminate.assert_not_called()
+        assert lo._server is replacement
+        lo._server = None
+
+    def test_foreign_listener_on_server_port_is_not_trusted(
+        self, tmp_output_dir: Path, fake_unoserver: SimpleNamespace
+    ) -> None:
+        fake_unoserver.port_open.side_effect = None
+        fake_unoserver.port_open.return_value = True
+
+        with patch.object(documents._libreoffice, "_convert_via_uno", return_value=False):
+            assert not documents._libreoffice.convert_to_pdf(
+                tmp_output_dir / "report.docx", tmp_output_dir
+            )
+        fake_unoserver.popen.assert_not_called()
+        fake_unoserver.run.assert_not_called()
+
+    def test_batch_converts_each_directory_in_one_cli_run(self, tmp_output_dir: Path) -> None:
+        other_dir = tmp_output_dir / "appendix"
+        other_dir.mkdir()
+        docx_files = [tmp_output_dir / "a.docx", other_dir / "b.docx", tmp_output_dir / "c.docx"]
+        for docx_file in docx_files:
+            Document().save(str(docx_file))
+
+        def fake_cli(cmd: list[str], **kwargs: object) -> MagicMock:
+            outdir = Path(cmd[cmd.index("--outdir") + 1])
+            for name in cmd[cmd.index("--outdir") + 2 :]:
+                (outdir / Path(name).with_suffix(".pdf").name).write_bytes(b"%PDF")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with (
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch("hermes.tools.documents.subprocess.run", side_effect=fake_cli) as run,
+        ):
+            pdfs = documents.doc_export_pdf_batch([str(f) for f in docx_files])
+
+        assert [call.args[0][6:] for call in run.call_args_list] == [
+            [str(docx_files[0]), str(docx_files[2])],
+            [str(docx_files[1])],
+        ]
+        assert pdfs == [str(f.with_suffix(".pdf").resolve()) for f in docx_files]
+        assert all(Path(pdf).read_bytes() == b"%PDF" for pdf in pdfs)
+        assert not list(tmp_output_dir.glob(".hermes-pdf-*"))
+
+    def test_batch_converts_a_repeated_input_once(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+
+        def fake_server(docx: Path, target_dir: Path) -> bool:
+            (target_dir / "report.pdf").write_bytes(b"%PDF")
+            return True
+
+        server = MagicMock(side_effect=fake_server)
+        with patch.object(documents._libreoffice, "convert_to_pdf", server):
+            pdfs = documents.doc_export_pdf_batch([str(docx_file), str(docx_file)])
+
+        server.assert_called_once()
+        assert pdfs == [str((tmp_output_dir / "report.pdf").resolve())] * 2
+        assert Path(pdfs[0]).read_bytes() == b"%PDF"
+
+    def test_batch_rejects_inputs_exported_to_the_same_pdf(self, tmp_output_dir: Path) -> None:
+        docx_files = [tmp_output_dir / "a" / "report.docx", tmp_output_dir / "b" / "report.docx"]
+        for docx_file in docx_files:
+            docx_file.parent.mkdir()
+            Document().save(str(docx_file))
+
+        with (
+            patch.object(documents._libreoffice, "convert_to_pdf") as server,
+            pytest.raises(ValueError, match="would both be exported to"),
+        ):
+            documents.doc_export_pdf_batch(
+                [str(f) for f in docx_files], output_dir=str(tmp_output_dir / "pdf")
+            )
+
+        server.assert_not_called()
+
+    def test_batch_reports_missing_inputs(self, tmp_output_dir: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="nope.docx"):
+            documents.doc_export_pdf_batch([str(tmp_output_dir / "nope.docx")])
+
+    def test_unchanged_document_is_served_from_cache(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+
+        def fake_cli(cmd: list[str], **kwargs: object) -> MagicMock:
+            (Path(cmd[cmd.index("--outdir") + 1]) / "report.pdf").write_bytes(b"%PDF")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with (
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch("hermes.tools.documents.subprocess.run", side_effect=fake_cli) as run,
+        ):
+            documents.doc_export_pdf(str(docx_file))
+            (tmp_output_dir / "report.pdf").unlink()
+            pdf = documents.doc_export_pdf(str(docx_file))
+
+        run.assert_called_once()
+        assert Path(pdf).read_bytes() == b"%PDF"
+
+    def test_resaved_document_is_served_from_cache(self, tmp_output_dir: Path) -> None:
+        """Saving an unchanged document again yields the same bytes, so the PDF is cached."""
+
+        def fake_cli(cmd: list[str], **kwargs: object) -> MagicMock:
+            (Path(cmd[cmd.index("--outdir") + 1]) / "report.pdf").write_bytes(b"%PDF")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with (
+            patch.object(documents, "_documents", documents._DocumentStore()),
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch("hermes.tools.documents.subprocess.run", side_effect=fake_cli) as run,
+        ):
+            documents._documents["report"] = doc = Document()
+            doc.add_paragraph("Unchanged between saves")
+            saved = []
+            for now in (1_000_000_000.0, 2_000_000_000.0):
+                with patch.object(zipfile.time, "time", return_value=now):
+                    docx_path = documents.doc_save("report")
+                saved.append(Path(docx_path).read_bytes())
+                documents.doc_export_pdf(docx_path)
+
+        assert saved[0] == saved[1]
+        run.assert_called_once()
+
+    def test_exported_pdf_does_not_share_the_cache_entry(
+        self, tmp_output_dir: Path, hermes_config: HermesConfig
+    ) -> None:
+        """Overwriting an exported PDF in place leaves the cached copy intact."""
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+
+        def fake_cli(cmd: list[str], **kwargs: object) -> MagicMock:
+            (Path(cmd[cmd.index("--outdir") + 1]) / "report.pdf").write_bytes(b"%PDF")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with (
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch("hermes.tools.documents.subprocess.run", side_effect=fake_cli),
+        ):
+            pdf = Path(documents.doc_export_pdf(str(docx_file)))
+            with pdf.open("r+b") as fh:
+                fh.write(b"edit")
+            served = Path(documents.doc_export_pdf(str(docx_file)))
+
+        (entry,) = (Path(hermes_config.cache_dir).expanduser() / "pdf").glob("*.pdf")
+        assert entry.read_bytes() == b"%PDF"
+        assert served.read_bytes() == b"%PDF"
+        assert served.stat().st_ino != entry.stat().st_ino
+
+    def test_failed_conversion_keeps_previous_pdf(self, tmp_output_dir: Path) -> None:
+        docx_file = tmp_output_dir / "report.docx"
+        Document().save(str(docx_file))
+        (tmp_output_dir / "report.pdf").write_bytes(b"previous")
+
+        with (
+            patch("hermes.tools._libreoffice.shutil.which", return_value=None),
+            patch(
+                "hermes.tools.documents.subprocess.run",
+                return_value=MagicMock(returncode=0, stdout="", stderr=""),
+            ),
+            pytest.raises(RuntimeError, match="PDF not found"),
+        ):
+            documents.doc_export_pdf(str(docx_file))
+
+        assert (tmp_output_dir / "report.pdf").read_bytes() == b"previous"
+        assert not list(tmp_output_dir.glob(".hermes-pdf-*"))
+
+    def test_pdf_cache_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        for age, name in enumerate(["new", "old"]):
+            entry = tmp_path / f"{name}.pdf"
+            entry.write_bytes(b"x" * 600)
+            os.utime(entry, (1000 - age, 1000 - age))
+
+        documents._trim_pdf_cache(tmp_path, 1000)
+
+        assert [p.name for p in tmp_path.glob("*.pdf")] == ["new.pdf"]
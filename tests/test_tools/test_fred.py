@@ -236,7 +236,7 @@ class TestFredGetHelper:
                 pass
 
         with (
-            patch("hermes.tools._base._client", mock_client),
+            patch("hermes.tools._base.get_http_client", return_value=mock_client),
             patch("hermes.tools._base.get_limiter", return_value=NoOpLimiter()),
         ):
             from hermes.tools._base import fred_get
@@ -703,6 +703,14 @@ class TestCreateTools:
         tools = create_tools()
         assert len(tools) == 9
 
+    def test_tools_are_built_once(self) -> None:
+        """Repeated calls share the tool objects but not the list."""
+        from hermes.tools.sec_edgar import create_tools
+
+        first, second = create_tools(), create_tools()
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
 
 # ---------------------------------------------------------------------------
 # Network tests (skipped by default)